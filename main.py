@@ -61,6 +61,10 @@ if not getattr(sys, "frozen", False):
     del isMissing
 del find_spec
 
+from scripts.housekeeping import startup_trace
+
+startup_trace.install()
+
 from scripts.housekeeping.log_cleanup import prune_logs
 from scripts.housekeeping.stream_duplexer import UnbufferedStreamDuplexer
 from scripts.housekeeping.datadir import get_log_dir, setup_data_dir
@@ -188,6 +192,7 @@ from scripts.game_structure.screen_settings import screen_scale, MANAGER, screen
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.discord_rpc import _DiscordRPC
 from scripts.cat.sprites import sprites
+from scripts.cat.sprite_queue import sprite_queue
 from scripts.clan import clan_class
 from scripts.utility import (
     quit,
@@ -197,7 +202,7 @@ from scripts.utility import (
 from scripts.debug_console import debug_mode
 import pygame
 
-# import all screens for initialization (Note - must be done after pygame_gui manager is created)
+# screens are created when they are first shown (Note - must be done after pygame_gui manager is created)
 from scripts.screens.all_screens import AllScreens
 import scripts.game_structure.screen_settings
 
@@ -217,17 +222,21 @@ def load_data():
     global finished_loading
 
     # load in the spritesheets
-    sprites.load_all()
+    with startup_trace.stage("load sprites"):
+        sprites.load_all()
 
     clan_list = game.read_clans()
     if clan_list:
         game.switches["clan_list"] = clan_list
         try:
-            load_cats()
-            version_info = clan_class.load_clan()
-            version_convert(version_info)
-            game.load_events()
-            scripts.screens.screens_core.screens_core.rebuild_core()
+            with startup_trace.stage("load cats"):
+                load_cats()
+            with startup_trace.stage("load clan"):
+                version_info = clan_class.load_clan()
+                version_convert(version_info)
+                game.load_events()
+            with startup_trace.stage("build core screen"):
+                scripts.screens.screens_core.screens_core.rebuild_core()
         except Exception as e:
             logging.exception("File failed to load")
             if not game.switches["error_message"]:
@@ -311,6 +320,7 @@ except pygame.error:
     music_manager.audio_disabled = True
     music_manager.muted = True
 AllScreens.start_screen.screen_switches()
+startup_trace.report()
 
 # dev screen info now lives in scripts/screens/screens_core
 
@@ -387,6 +397,9 @@ while 1:
 
         MANAGER.process_events(event)
 
+    # swap in cat sprites that were drawn in the background
+    sprite_queue.update()
+
     MANAGER.update(time_delta)
 
     # update
@@ -9,20 +9,22 @@ import itertools
 import os.path
 import sys
 from random import choice, randint, sample, random, getrandbits, randrange
-from typing import Dict, List, Any, Union, Callable
+from typing import Dict, List, Any, Optional, Union, Callable
 
 import i18n
 import ujson  # type: ignore
 
 from scripts.cat.enums import CatAgeEnum
 from scripts.cat.history import History
+from scripts.cat.membership import MembershipIndex
 from scripts.cat.names import Name
 from scripts.cat.pelts import Pelt
 from scripts.cat.personality import Personality
 from scripts.cat.skills import CatSkills
 from scripts.cat.thoughts import Thoughts
 from scripts.cat_relations.inheritance import Inheritance
-from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations.log_archive import archive_log_entries
+from scripts.cat_relations.relationship import Relationship, RelationshipStore
 from scripts.conditions import (
     Illness,
     Injury,
@@ -33,7 +35,12 @@ from scripts.conditions import (
 from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
 from scripts.game_structure import image_cache
+from scripts.game_structure.clan_database import get_clan_database
 from scripts.game_structure.game_essentials import game
+from scripts.game_structure.history_store import (
+    get_history_store,
+    mark_history_used,
+)
 from scripts.game_structure.screen_settings import screen
 from scripts.housekeeping.datadir import get_save_dir
 from scripts.utility import (
@@ -97,6 +104,7 @@ class Cat:
 
     all_cats: Dict[str, Cat] = {}  # ID: object
     outside_cats: Dict[str, Cat] = {}  # cats outside the clan
+    membership = MembershipIndex()  # where the cats of all_cats are
     id_iter = itertools.count()
 
     all_cats_list: List[Cat] = []
@@ -144,7 +152,7 @@ class Cat:
         :param kwargs: TODO what are the possible args here? ["biome", ]
         """
 
-        self.history = None
+        self._history = None
 
         if (
             faded
@@ -176,7 +184,7 @@ class Cat:
         self.patrol_with_mentor = 0
         self.apprentice = []
         self.former_apprentices = []
-        self.relationships = {}
+        self.relationships = RelationshipStore(self)
         self.mate = []
         self.previous_mates = []
         self._pronouns: Dict[str, List[Dict[str, Union[str, int]]]] = {}
@@ -188,6 +196,8 @@ class Cat:
         self.driven_out = False
         self.dead_for = 0  # moons
         self.thought = ""
+        # dead cats only get a new thought once their profile is looked at, see Events.one_moon_dead_cats
+        self.thought_pending = False
         self.genderalign = None
         self.birth_cooldown = 0
         self.illnesses = {}
@@ -218,7 +228,7 @@ class Cat:
         self.specsuffix_hidden = specsuffix_hidden
         self.inheritance = None
 
-        self.history = None
+        self._history = None
 
         # setting ID
         if ID is None:
@@ -329,6 +339,8 @@ class Cat:
 
         # SAVE CAT INTO ALL_CATS DICTIONARY IN CATS-CLASS
         self.all_cats[self.ID] = self
+        Inheritance.family_index.update_cat(self)
+        Cat.membership.add_cat(self)
 
         if self.ID not in ["0", None]:
             Cat.insert_cat(self)
@@ -485,6 +497,57 @@ class Cat:
                 "\nCat.mentor has to be either None (no mentor) or the mentor's ID as a string."
             )
 
+    def _membership_changed(self):
+        # while the cat is still being created, it isn't indexed yet
+        if "ID" in self.__dict__:
+            Cat.membership.update_cat(self)
+
+    @property
+    def status(self) -> str:
+        return self._status
+
+    @status.setter
+    def status(self, value: str):
+        self._status = value
+        self._membership_changed()
+
+    @property
+    def dead(self) -> bool:
+        return self._dead
+
+    @dead.setter
+    def dead(self, value: bool):
+        self._dead = value
+        self._membership_changed()
+
+    @property
+    def outside(self) -> bool:
+        return self._outside
+
+    @outside.setter
+    def outside(self, value: bool):
+        self._outside = value
+        self._membership_changed()
+
+    @property
+    def exiled(self) -> bool:
+        return self._exiled
+
+    @exiled.setter
+    def exiled(self, value: bool):
+        self._exiled = value
+        self._membership_changed()
+
+    @property
+    def df(self) -> bool:
+        """Whether the cat is in the Dark Forest"""
+        return self._df
+
+    @df.setter
+    def df(self, value: bool):
+        self._df = value
+        self._membership_changed()
+
     @property
     def pronouns(self) -> List[Dict[str, Union[str, int]]]:
         """
@@ -653,8 +716,8 @@ class Cat:
         load_grief_reactions()
 
         # apply grief to cats with high positive relationships to dead cat
-        for cat in Cat.all_cats.values():
-            if cat.dead or cat.outside or cat.moons < 1:
+        for cat in Cat.membership.select(dead=False, outside=False):
+            if cat.moons < 1:
                 continue
 
             to_self = cat.relationships.get(self.ID)
@@ -1020,6 +1083,26 @@ class Cat:
             scar_events=scars,
         )
 
+    @property
+    def history(self) -> Optional[History]:
+        """This cat's history. It's loaded the first time it's needed, see history_store.py."""
+        if self._history is None:
+            self.load_history()
+        if self._history is not None:
+            mark_history_used(self.ID)
+        return self._history
+
+    @history.setter
+    def history(self, history: Optional[History]):
+        self._history = history
+        if history is not None:
+            mark_history_used(self.ID)
+
+    @property
+    def history_loaded(self) -> bool:
+        """Whether the history is loaded, without loading it."""
+        return self._history is not None
+
     def load_history(self):
         """Load this cat's history"""
         try:
@@ -1031,58 +1114,26 @@ class Cat:
             print("WARNING: History failed to load, no Clan in game.switches?")
             return
 
-        history_directory = f"{get_save_dir()}/{clanname}/history/"
-        cat_history_directory = history_directory + self.ID + "_history.json"
-
-        if not os.path.exists(cat_history_directory):
-            self.history = History(
-                beginning={},
-                mentor_influence={},
-                app_ceremony={},
-                lead_ceremony=None,
-                possible_history={},
-                died_by=[],
-                scar_events=[],
-                murder={},
-            )
-            return
         try:
-            with open(cat_history_directory, "r", encoding="utf-8") as read_file:
-                history_data = ujson.loads(read_file.read())
-                self.history = History(
-                    beginning=(
-                        history_data["beginning"] if "beginning" in history_data else {}
-                    ),
-                    mentor_influence=(
-                        history_data["mentor_influence"]
-                        if "mentor_influence" in history_data
-                        else {}
-                    ),
-                    app_ceremony=(
-                        history_data["app_ceremony"]
-                        if "app_ceremony" in history_data
-                        else {}
-                    ),
-                    lead_ceremony=(
-                        history_data["lead_ceremony"]
-                        if "lead_ceremony" in history_data
-                        else None
-                    ),
-                    possible_history=(
-                        history_data["possible_history"]
-                        if "possible_history" in history_data
-                        else {}
-                    ),
-                    died_by=(
-                        history_data["died_by"] if "died_by" in history_data else []
-                    ),
-                    scar_events=(
-                        history_data["scar_events"]
-                        if "scar_events" in history_data
-                        else []
-                    ),
-                    murder=history_data["murder"] if "murder" in history_data else {},
+            database = get_clan_database(clanname)
+            if database:
+                history_data = database.get("history", self.ID)
+            else:
+                history_data = get_history_store(f"{get_save_dir()}/{clanname}").get(
+                    self.ID
                 )
+            if history_data is None:
+                history_data = {}
+            self.history = History(
+                beginning=history_data.get("beginning", {}),
+                mentor_influence=history_data.get("mentor_influence", {}),
+                app_ceremony=history_data.get("app_ceremony", {}),
+                lead_ceremony=history_data.get("lead_ceremony"),
+                possible_history=history_data.get("possible_history", {}),
+                died_by=history_data.get("died_by", []),
+                scar_events=history_data.get("scar_events", []),
+                murder=history_data.get("murder", {}),
+            )
         except Exception:
             self.history = None
             print(
@@ -1091,18 +1142,18 @@ class Cat:
                 f"you'd like to preserve!"
             )
 
-    def save_history(self, history_dir):
+    def save_history(self, history_store, database=None):
         """Save this cat's history.
 
-        :param history_dir: Directory to save cat's history to
-        :type history_dir: str
+        :param history_store: The Clan's HistoryStore. The history is written when the store is flushed.
+        :param database: The Clan's single-file save, if it uses one, in which case history_store isn't used
         """
-        if not os.path.exists(history_dir):
-            os.makedirs(history_dir)
-
         history_dict = History.make_dict(self)
         try:
-            game.safe_save(f"{history_dir}/{self.ID}_history.json", history_dict)
+            if database:
+                database.put("history", self.ID, history_dict)
+            else:
+                history_store.put(self.ID, history_dict)
         except:
             self.history = History(
                 beginning={},
@@ -1515,7 +1566,6 @@ class Cat:
     def thoughts(self):
         """Generates a thought for the cat, which displays on their profile."""
         all_cats = self.all_cats
-        other_cat = choice(list(all_cats.keys()))
         game_mode = game.switches["game_mode"]
         biome = game.switches["biome"]
         camp = game.switches["camp_bg"]
@@ -1539,45 +1589,32 @@ class Cat:
             where_kitty = "inside"
 
         # get other cat
-        i = 0
-        # for cats inside the clan
-        if where_kitty == "inside":
-            dead_chance = getrandbits(4)
-            while (
-                other_cat == self.ID
-                and len(all_cats) > 1
-                or (all_cats.get(other_cat).dead and dead_chance != 1)
-                or (other_cat not in self.relationships)
-            ):
-                other_cat = choice(list(all_cats.keys()))
-                i += 1
-                if i > 100:
-                    other_cat = None
-                    break
-        # for dead cats
-        elif where_kitty in ["starclan", "hell", "UR"]:
-            while other_cat == self.ID and len(all_cats) > 1:
-                other_cat = choice(list(all_cats.keys()))
-                i += 1
-                if i > 100:
-                    other_cat = None
-                    break
-        # for cats currently outside
-        # it appears as for now, kittypets and loners can only think about outsider cats
-        elif where_kitty == "outside":
-            while (
-                other_cat == self.ID
-                and len(all_cats) > 1
-                or (other_cat not in self.relationships)
-            ):
-                # or (self.status in ['kittypet', 'loner'] and not all_cats.get(other_cat).outside):
-                other_cat = choice(list(all_cats.keys()))
-                i += 1
-                if i > 100:
-                    other_cat = None
-                    break
+        other_cat = None
+        if where_kitty in ["starclan", "hell", "UR"]:
+            # dead cats can think about anyone
+            other_cat = self.membership.random_cat(exclude=self.ID)
+        else:
+            # living cats think about the cats they know, and cats inside the clan rarely about dead ones
+            allow_dead = where_kitty == "outside" or getrandbits(4) == 1
+            relationships = self.relationships
+
+            def known(cat):
+                return (
+                    cat.ID != self.ID
+                    and cat.ID in relationships
+                    and (allow_dead or not cat.dead)
+                )
 
-        other_cat = all_cats.get(other_cat)
+            other_cat = self.membership.random_matching(known)
+            if other_cat is None:
+                # only a few of all the cats are known, so pick from those directly
+                known_count = 0
+                for cat_id in relationships:
+                    cat = all_cats.get(cat_id)
+                    if cat is not None and known(cat):
+                        known_count += 1
+                        if randrange(known_count) == 0:
+                            other_cat = cat
 
         # get chosen thought
         chosen_thought = Thoughts.get_chosen_thought(
@@ -1594,16 +1631,16 @@ class Cat:
 
         # insert thought
         self.thought = str(chosen_thought)
+        self.thought_pending = False
 
     def relationship_interaction(self):
         """Randomly choose a cat of the Clan and have an interaction with them."""
         cats_to_choose = [
             iter_cat
-            for iter_cat in Cat.all_cats.values()
+            for iter_cat in Cat.membership.select(
+                dead=False, outside=False, exiled=False
+            )
             if iter_cat.ID != self.ID
-            and not iter_cat.outside
-            and not iter_cat.exiled
-            and not iter_cat.dead
         ]
         # if there are no cats to interact, stop
         if not cats_to_choose:
@@ -1851,7 +1888,9 @@ class Cat:
 
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
 
-        if medical_cats_condition_fulfilled(Cat.all_cats.values(), amount_per_med):
+        if medical_cats_condition_fulfilled(
+            Cat.membership.select(dead=False, outside=False), amount_per_med
+        ):
             duration = med_duration
         if severity != "minor":
             duration += randrange(-1, 1)
@@ -1920,7 +1959,8 @@ class Cat:
 
         injury_severity = injury["severity"] if severity == "default" else severity
         if medical_cats_condition_fulfilled(
-            Cat.all_cats.values(), get_amount_cat_for_one_medic(game.clan)
+            Cat.membership.select(dead=False, outside=False),
+            get_amount_cat_for_one_medic(game.clan),
         ):
             duration = med_duration
         if severity != "minor":
@@ -2197,8 +2237,8 @@ class Cat:
                 )
                 self.get_ill(illness_name)
 
-    def save_condition(self):
-        # save conditions for each cat
+    def save_condition(self, database=None):
+        # save conditions for each cat, into the Clan's single-file save if given
         clanname = None
         if game.switches["clan_name"] != "":
             clanname = game.switches["clan_name"]
@@ -2215,8 +2255,10 @@ class Cat:
             or self.dead
             or self.outside
         ):
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
+            if database:
+                database.delete("conditions", self.ID)
+            else:
+                game.remove_save_file(condition_file_path, clanname)
             return
 
         conditions = {}
@@ -2230,25 +2272,40 @@ class Cat:
         if self.is_disabled():
             conditions["permanent conditions"] = self.permanent_condition
 
-        game.safe_save(condition_file_path, conditions)
-
-    def load_conditions(self):
-        if game.switches["clan_name"] != "":
-            clanname = game.switches["clan_name"]
+        if database:
+            database.put("conditions", self.ID, conditions)
         else:
-            clanname = game.switches["clan_list"][0]
+            game.save_if_changed(condition_file_path, conditions)
 
-        condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
-        condition_cat_directory = condition_directory + self.ID + "_conditions.json"
-        if not os.path.exists(condition_cat_directory):
-            return
+    def load_conditions(self, rel_data=None):
+        """
+        :param rel_data: The saved conditions of this cat, if they were read already. Otherwise
+            they are read from the save.
+        """
+        if rel_data is None:
+            if game.switches["clan_name"] != "":
+                clanname = game.switches["clan_name"]
+            else:
+                clanname = game.switches["clan_list"][0]
+
+            condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
+            condition_cat_directory = condition_directory + self.ID + "_conditions.json"
+
+            database = get_clan_database(clanname)
+            if database:
+                rel_data = database.get("conditions", self.ID)
+                if rel_data is None:
+                    return
+            elif not os.path.exists(condition_cat_directory):
+                return
 
         try:
-            with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.illnesses = rel_data.get("illnesses", {})
-                self.injuries = rel_data.get("injuries", {})
-                self.permanent_condition = rel_data.get("permanent conditions", {})
+            if rel_data is None:
+                with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
+                    rel_data = ujson.loads(read_file.read())
+            self.illnesses = rel_data.get("illnesses", {})
+            self.injuries = rel_data.get("injuries", {})
+            self.permanent_condition = rel_data.get("permanent conditions", {})
 
             if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
                 self.pelt.paralyzed = True
@@ -2354,7 +2411,7 @@ class Cat:
         if not self.mentor:
             potential_mentors = []
             priority_mentors = []
-            for cat in self.all_cats.values():
+            for cat in Cat.membership.select(dead=False, outside=False):
                 if self.is_valid_mentor(cat):
                     potential_mentors.append(cat)
                     if not cat.apprentice and not cat.not_working():
@@ -2465,12 +2522,12 @@ class Cat:
             if not self.dead:
                 if other_cat.ID not in self.relationships:
                     self.create_one_relationship(other_cat)
-                    self.relationships[other_cat.ID].mate = True
+                    self.relationships[other_cat.ID].mates = True
                 self_relationship = self.relationships[other_cat.ID]
                 self_relationship.romantic_love -= randint(20, 60)
                 self_relationship.comfortable -= randint(10, 30)
                 self_relationship.trust -= randint(5, 15)
-                self_relationship.mate = False
+                self_relationship.mates = False
                 if fight:
                     self_relationship.romantic_love -= randint(10, 30)
                     self_relationship.platonic_like -= randint(15, 45)
@@ -2478,12 +2535,12 @@ class Cat:
             if not other_cat.dead:
                 if self.ID not in other_cat.relationships:
                     other_cat.create_one_relationship(self)
-                    other_cat.relationships[self.ID].mate = True
+                    other_cat.relationships[self.ID].mates = True
                 other_relationship = other_cat.relationships[self.ID]
                 other_relationship.romantic_love -= 40
                 other_relationship.comfortable -= 20
                 other_relationship.trust -= 10
-                other_relationship.mate = False
+                other_relationship.mates = False
                 if fight:
                     self_relationship.romantic_love -= 20
                     other_relationship.platonic_like -= 30
@@ -2524,22 +2581,22 @@ class Cat:
         if not self.dead:
             if other_cat.ID not in self.relationships:
                 self.create_one_relationship(other_cat)
-                self.relationships[other_cat.ID].mate = True
+                self.relationships[other_cat.ID].mates = True
             self_relationship = self.relationships[other_cat.ID]
             self_relationship.romantic_love += 20
             self_relationship.comfortable += 20
             self_relationship.trust += 10
-            self_relationship.mate = True
+            self_relationship.mates = True
 
         if not other_cat.dead:
             if self.ID not in other_cat.relationships:
                 other_cat.create_one_relationship(self)
-                other_cat.relationships[self.ID].mate = True
+                other_cat.relationships[self.ID].mates = True
             other_relationship = other_cat.relationships[self.ID]
             other_relationship.romantic_love += 20
             other_relationship.comfortable += 20
             other_relationship.trust += 10
-            other_relationship.mate = True
+            other_relationship.mates = True
 
     def unset_adoptive_parent(self, other_cat: Cat):
         """Unset the adoptive parent from self"""
@@ -2623,8 +2680,8 @@ class Cat:
                 and inter_cat.outside
             ):
                 continue
-            inter_cat.relationships[self.ID] = Relationship(inter_cat, self)
-            self.relationships[inter_cat.ID] = Relationship(self, inter_cat)
+            inter_cat.relationships.add_default(self.ID)
+            self.relationships.add_default(inter_cat.ID)
 
     def init_all_relationships(self):
         """Create Relationships to all current Clancats."""
@@ -2694,6 +2751,20 @@ class Cat:
                 if siblings and like < 30:
                     like = 30
 
+                if not (
+                    mates
+                    or related
+                    or romantic_love
+                    or like
+                    or dislike
+                    or admiration
+                    or comfortable
+                    or jealousy
+                    or trust
+                ):
+                    self.relationships.add_default(the_cat.ID)
+                    continue
+
                 rel = Relationship(
                     cat_from=self,
                     cat_to=the_cat,
@@ -2709,11 +2780,37 @@ class Cat:
                 )
                 self.relationships[the_cat.ID] = rel
 
-    def save_relationship_of_cat(self, relationship_dir):
-        # save relationships for each cat
+    def save_relationship_of_cat(self, relationship_dir, database=None):
+        # save relationships for each cat, into the Clan's single-file save if given
+
+        # old log entries are moved to the log archive, see log_archive.py
+        log_length = game.config["relationship"]["log_length"]
+        archived_logs = {}
 
         rel = []
-        for r in self.relationships.values():
+        for cat_to_id in self.relationships:
+            r = self.relationships.peek(cat_to_id)
+            if r is None:
+                rel.append(
+                    {
+                        "cat_from_id": self.ID,
+                        "cat_to_id": cat_to_id,
+                        "mates": False,
+                        "family": False,
+                        "romantic_love": 0,
+                        "platonic_like": 0,
+                        "dislike": 0,
+                        "admiration": 0,
+                        "comfortable": 0,
+                        "jealousy": 0,
+                        "trust": 0,
+                        "log": [],
+                    }
+                )
+                continue
+            old_entries = r.compact_log(log_length)
+            if old_entries:
+                archived_logs[r.cat_to.ID] = old_entries
             r_data = {
                 "cat_from_id": r.cat_from.ID,
                 "cat_to_id": r.cat_to.ID,
@@ -2730,50 +2827,89 @@ class Cat:
             }
             rel.append(r_data)
 
-        game.safe_save(f"{relationship_dir}/{self.ID}_relations.json", rel)
-
-    def load_relationship_of_cat(self):
-        if game.switches["clan_name"] != "":
-            clanname = game.switches["clan_name"]
+        archive_log_entries(os.path.dirname(relationship_dir), self.ID, archived_logs)
+        if database:
+            database.put("relationships", self.ID, rel)
         else:
-            clanname = game.switches["clan_list"][0]
+            game.save_if_changed(f"{relationship_dir}/{self.ID}_relations.json", rel)
 
-        relation_directory = get_save_dir() + "/" + clanname + "/relationships/"
-        relation_cat_directory = relation_directory + self.ID + "_relations.json"
+    def load_relationship_of_cat(self, rel_data=None):
+        """
+        :param rel_data: The saved relationships of this cat, if they were read already. Otherwise
+            they are read from the save.
+        """
+        self.relationships = RelationshipStore(self)
+        if rel_data is None:
+            if game.switches["clan_name"] != "":
+                clanname = game.switches["clan_name"]
+            else:
+                clanname = game.switches["clan_list"][0]
+
+            relation_directory = get_save_dir() + "/" + clanname + "/relationships/"
+            relation_cat_directory = relation_directory + self.ID + "_relations.json"
 
-        self.relationships = {}
-        if os.path.exists(relation_directory):
-            if not os.path.exists(relation_cat_directory):
-                self.init_all_relationships()
-                for cat in Cat.all_cats.values():
-                    cat.create_one_relationship(self)
+            database = get_clan_database(clanname)
+            if database:
+                rel_data = database.get("relationships", self.ID)
+            elif not os.path.exists(relation_directory):
                 return
-            try:
-                with open(relation_cat_directory, "r", encoding="utf-8") as read_file:
-                    rel_data = ujson.loads(read_file.read())
-                    for rel in rel_data:
-                        cat_to = self.all_cats.get(rel["cat_to_id"])
-                        if cat_to is None or rel["cat_to_id"] == self.ID:
-                            continue
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel["mates"] or False,
-                            family=rel["family"] or False,
-                            romantic_love=(rel["romantic_love"] or 0),
-                            platonic_like=(rel["platonic_like"] or 0),
-                            dislike=rel["dislike"] or 0,
-                            admiration=rel["admiration"] or 0,
-                            comfortable=rel["comfortable"] or 0,
-                            jealousy=rel["jealousy"] or 0,
-                            trust=rel["trust"] or 0,
-                            log=rel["log"],
-                        )
-                        self.relationships[rel["cat_to_id"]] = new_rel
-            except:
-                print(
-                    f"WARNING: There was an error reading the relationship file of cat #{self}."
+            elif os.path.exists(relation_cat_directory):
+                try:
+                    with open(
+                        relation_cat_directory, "r", encoding="utf-8"
+                    ) as read_file:
+                        rel_data = ujson.loads(read_file.read())
+                except:
+                    print(
+                        f"WARNING: There was an error reading the relationship file of cat #{self}."
+                    )
+                    return
+
+        if rel_data is None:
+            self.init_all_relationships()
+            for cat in Cat.all_cats.values():
+                cat.create_one_relationship(self)
+            return
+
+        try:
+            for rel in rel_data:
+                cat_to = self.all_cats.get(rel["cat_to_id"])
+                if cat_to is None or rel["cat_to_id"] == self.ID:
+                    continue
+                # only create the relationship once it is needed
+                if not (
+                    rel["mates"]
+                    or rel["family"]
+                    or rel["romantic_love"]
+                    or rel["platonic_like"]
+                    or rel["dislike"]
+                    or rel["admiration"]
+                    or rel["comfortable"]
+                    or rel["jealousy"]
+                    or rel["trust"]
+                    or rel["log"]
+                ):
+                    self.relationships.add_default(rel["cat_to_id"])
+                    continue
+                new_rel = Relationship(
+                    cat_from=self,
+                    cat_to=cat_to,
+                    mates=rel["mates"] or False,
+                    family=rel["family"] or False,
+                    romantic_love=(rel["romantic_love"] or 0),
+                    platonic_like=(rel["platonic_like"] or 0),
+                    dislike=rel["dislike"] or 0,
+                    admiration=rel["admiration"] or 0,
+                    comfortable=rel["comfortable"] or 0,
+                    jealousy=rel["jealousy"] or 0,
+                    trust=rel["trust"] or 0,
+                    log=rel["log"],
                 )
+                self.relationships[rel["cat_to_id"]] = new_rel
+        except:
+            print(
+                f"WARNING: There was an error reading the relationship file of cat #{self}."
+            )
 
     @staticmethod
     def mediate_relationship(mediator, cat1, cat2, allow_romantic, sabotage=False):
@@ -3130,13 +3266,20 @@ class Cat:
                 game.switches["clan_list"][0] if game.clan is None else game.clan.name
             )
 
-            with open(
-                get_save_dir() + "/" + clan + "/faded_cats/" + cat + ".json",
-                "r",
-                encoding="utf-8",
-            ) as read_file:
-                cat_info = ujson.loads(read_file.read())
-                # If loading cats is attempted before the Clan is loaded, we would need to use this.
+            database = get_clan_database(clan)
+            if database:
+                cat_info = database.get("faded_cats", cat)
+                if cat_info is None:
+                    print("ERROR: in loading faded cat")
+                    return False
+            else:
+                with open(
+                    get_save_dir() + "/" + clan + "/faded_cats/" + cat + ".json",
+                    "r",
+                    encoding="utf-8",
+                ) as read_file:
+                    cat_info = ujson.loads(read_file.read())
+                    # If loading cats is attempted before the Clan is loaded, we would need to use this.
 
         except (
             AttributeError
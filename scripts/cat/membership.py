@@ -0,0 +1,192 @@
+"""
+Clan-wide index of where every cat in Cat.all_cats is: alive or dead, in the Clan, outside it or
+exiled, in StarClan or the Dark Forest, and what their status is.
+
+Most of the game only cares about some of the cats (e.g. the living Clan cats, or the living warriors),
+but Cat.all_cats also holds every cat that ever died or left. Instead of going through all of them,
+ask Cat.membership for the cats or the number of cats you need. The index is kept up to date by Cat
+itself: changing dead, outside, exiled, df or status on a cat, or adding it to Cat.all_cats, files it
+under its new place.
+"""
+
+import random
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# (dead, outside, exiled, df, status)
+Place = Tuple[bool, bool, bool, bool, str]
+
+
+class MembershipIndex:
+    def __init__(self):
+        self.cats = {}  # ID: cat object
+        self.places: Dict[str, Place] = {}  # ID: place the cat is filed under
+        self.buckets: Dict[Place, set] = {}  # place: IDs of the cats there
+        self.order = {}  # ID: position the cat was added in, to keep the order of Cat.all_cats
+        self.next_position = 0
+        self.ids: List[str] = []  # every indexed ID, in no particular order, to pick random cats from
+        self.id_positions: Dict[str, int] = {}  # ID: where it is in ids
+        # (query): list of cats, thrown away whenever a cat moves
+        self._selections = {}
+
+    def clear(self):
+        self.cats.clear()
+        self.places.clear()
+        self.buckets.clear()
+        self.order.clear()
+        self.next_position = 0
+        self.ids.clear()
+        self.id_positions.clear()
+        self._selections.clear()
+
+    def rebuild(self, all_cats: dict):
+        """Index all the given cats from scratch, in their current order."""
+        self.clear()
+        for cat in all_cats.values():
+            self.add_cat(cat)
+
+    @staticmethod
+    def place_of(cat) -> Place:
+        return (
+            bool(cat.dead),
+            bool(cat.outside),
+            bool(cat.exiled),
+            bool(cat.df),
+            cat.status,
+        )
+
+    def add_cat(self, cat):
+        """Add a cat that was just put into Cat.all_cats, or replace the one with the same ID."""
+        if cat.ID not in self.order:
+            self.order[cat.ID] = self.next_position
+            self.next_position += 1
+            self.id_positions[cat.ID] = len(self.ids)
+            self.ids.append(cat.ID)
+        self.cats[cat.ID] = cat
+        self._file(cat.ID, self.place_of(cat))
+
+    def update_cat(self, cat):
+        """File the cat under its current place. Cats which aren't indexed are ignored."""
+        if self.cats.get(cat.ID) is not cat:
+            return
+        place = self.place_of(cat)
+        if self.places.get(cat.ID) != place:
+            self._file(cat.ID, place)
+
+    def remove_cat(self, cat_id: str):
+        """Remove the cat, which is no longer part of Cat.all_cats."""
+        self._unfile(cat_id)
+        self.cats.pop(cat_id, None)
+        self.order.pop(cat_id, None)
+
+        position = self.id_positions.pop(cat_id, None)
+        if position is not None:
+            # fill the gap with the last ID, so nothing has to move
+            last_id = self.ids.pop()
+            if last_id != cat_id:
+                self.ids[position] = last_id
+                self.id_positions[last_id] = position
+
+    def _file(self, cat_id: str, place: Place):
+        self._unfile(cat_id)
+        self.places[cat_id] = place
+        self.buckets.setdefault(place, set()).add(cat_id)
+        self._selections.clear()
+
+    def _unfile(self, cat_id: str):
+        old_place = self.places.pop(cat_id, None)
+        if old_place is None:
+            return
+        bucket = self.buckets[old_place]
+        bucket.discard(cat_id)
+        if not bucket:
+            del self.buckets[old_place]
+        self._selections.clear()
+
+    def _matching_buckets(self, dead, outside, exiled, df, statuses) -> List[set]:
+        return [
+            bucket
+            for (is_dead, is_outside, is_exiled, is_df, status), bucket in self.buckets.items()
+            if (dead is None or is_dead == dead)
+            and (outside is None or is_outside == outside)
+            and (exiled is None or is_exiled == exiled)
+            and (df is None or is_df == df)
+            and (statuses is None or status in statuses)
+        ]
+
+    def select(
+        self,
+        *,
+        dead: Optional[bool] = None,
+        outside: Optional[bool] = None,
+        exiled: Optional[bool] = None,
+        df: Optional[bool] = None,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> list:
+        """
+        Returns the cats that match, in the order of Cat.all_cats. Arguments that are None aren't checked.
+        e.g. select(dead=False, outside=False) gives every living cat in the Clan, and
+        select(dead=True, df=True) every cat in the Dark Forest.
+        The list is the caller's own to change.
+
+        :param dead: Whether the cats are dead
+        :param outside: Whether the cats are outside the Clan (lost, exiled or never part of it)
+        :param exiled: Whether the cats were exiled
+        :param df: Whether the cats are in the Dark Forest
+        :param statuses: The statuses the cats can have
+        """
+        statuses = frozenset(statuses) if statuses is not None else None
+        key = (dead, outside, exiled, df, statuses)
+        selection = self._selections.get(key)
+        if selection is None:
+            ids = set().union(
+                *self._matching_buckets(dead, outside, exiled, df, statuses)
+            )
+            selection = self._selections[key] = [
+                self.cats[cat_id] for cat_id in sorted(ids, key=self.order.__getitem__)
+            ]
+        return list(selection)
+
+    def count(
+        self,
+        *,
+        dead: Optional[bool] = None,
+        outside: Optional[bool] = None,
+        exiled: Optional[bool] = None,
+        df: Optional[bool] = None,
+        statuses: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Returns how many cats match. The arguments are the same as for select()."""
+        statuses = frozenset(statuses) if statuses is not None else None
+        return sum(
+            len(bucket)
+            for bucket in self._matching_buckets(dead, outside, exiled, df, statuses)
+        )
+
+    def random_cat(self, exclude: Optional[str] = None):
+        """
+        Returns a random cat, any of them equally likely, without going through all of them.
+        :param exclude: The ID of a cat which can't be picked
+        :return: The cat, or None if there's no other cat to pick
+        """
+        if len(self.ids) <= (exclude in self.id_positions):
+            return None
+        while True:
+            cat_id = random.choice(self.ids)
+            if cat_id != exclude:
+                return self.cats[cat_id]
+
+    def random_matching(self, accept: Callable, attempts: int = 32):
+        """
+        Returns a random cat that accept(cat) is true for, any of them equally likely, by trying random
+        cats rather than going through all of them.
+        :param accept: Whether a cat can be picked
+        :param attempts: How many random cats to try
+        :return: The cat, or None if none of the tried cats could be picked
+        """
+        if not self.ids:
+            return None
+        for _ in range(attempts):
+            cat = self.cats[random.choice(self.ids)]
+            if accept(cat):
+                return cat
+        return None
@@ -17,6 +17,12 @@ class Name:
     Stores & handles name generation.
     """
 
+    # status is set by the cat when its status changes
+    __slots__ = ("prefix", "suffix", "specsuffix_hidden", "cat", "status")
+
+    # the most recently given prefixes, which aren't given again for a while
+    prefix_history = []
+
     if os.path.exists("resources/dicts/names/names.json"):
         with open("resources/dicts/names/names.json", encoding="utf-8") as read_file:
             names_dict = ujson.loads(read_file.read())
@@ -294,4 +300,3 @@ class Name:
 
 
 names = Name()
-names.prefix_history = []
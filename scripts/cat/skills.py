@@ -148,6 +148,8 @@ class SkillTypeFlag(Flag):
 class Skill:
     """Skills handling functions mostly"""
 
+    __slots__ = ("path", "interest_only", "_p")
+
     tier_ranges = ((0, 9), (10, 19), (20, 29))
     point_range = (0, 29)
 
@@ -289,6 +291,8 @@ class CatSkills:
     Holds the cats skills, and handled changes in the skills.
     """
 
+    __slots__ = ("primary", "secondary", "hidden")
+
     # Mentor Inflence groups.
     # pylint: disable=unsupported-binary-operation
     influence_flags = {
@@ -0,0 +1,138 @@
+"""
+Draws cat sprites in the background.
+
+Screens that show a lot of cats at once ask the sprite queue for their sprites instead of using
+Cat.sprite. Sprites that were drawn before are handed over right away. The others are drawn by a
+worker thread while the game keeps running, and the screen shows a placeholder until they are ready.
+The main loop calls sprite_queue.update() every frame, which hands finished sprites to whoever asked
+for them. If a sprite can't be drawn in the background, update() draws it itself, or hands over the
+placeholder if that fails too. Widgets which are killed before their sprite is ready should cancel()
+their requests, so they aren't kept around until then.
+"""
+
+import itertools
+import logging
+from queue import Empty, PriorityQueue, SimpleQueue
+from threading import Thread
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import pygame
+
+from scripts.cat.sprites import sprites
+from scripts.utility import CatSpriteKey, draw_cat_sprite, get_sprite_key
+
+logger = logging.getLogger(__name__)
+
+# lower numbers are drawn first
+VISIBLE = 0
+PREFETCH = 1
+
+
+class SpriteQueue:
+    def __init__(self, workers: int = 1):
+        """
+        :param workers: How many threads draw sprites. Drawing mostly holds the GIL, so more than one
+            rarely helps; the point is to keep the main loop free.
+        """
+        self.workers = workers
+        self._jobs = PriorityQueue()
+        self._finished = SimpleQueue()
+        # key: (owner, callback) of the requests waiting for that sprite
+        self._waiting: Dict[CatSpriteKey, List[Tuple[Any, Callable]]] = {}
+        self._order = itertools.count()
+        self._threads: List[Thread] = []
+        self._placeholder = None
+
+    @property
+    def placeholder(self) -> pygame.Surface:
+        """An empty sprite, shown while the real one is being drawn."""
+        if self._placeholder is None or self._placeholder.get_width() != sprites.size:
+            self._placeholder = pygame.Surface(
+                (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
+            )
+        return self._placeholder
+
+    def request(
+        self,
+        cat,
+        callback: Callable[[pygame.Surface], None],
+        owner=None,
+        **sprite_options,
+    ):
+        """
+        Get a cat's sprite. If it was drawn before, callback is called with it right away.
+        Otherwise it is drawn in the background, and callback is called from update() once it's done.
+
+        :param cat: The cat whose sprite is needed
+        :param callback: Called with the finished sprite, on the main thread. Don't draw on that sprite.
+        :param owner: The widget the sprite is for, to cancel() the request with
+        :param sprite_options: Passed on to generate_sprite()
+        """
+        key = get_sprite_key(cat, **sprite_options)
+        sprite = sprites.get_cat_sprite(key)
+        if sprite is not None or key is None:
+            callback(sprite if sprite is not None else draw_cat_sprite(key))
+            return
+
+        self._waiting.setdefault(key, []).append((owner, callback))
+        self._add_job(VISIBLE, key)
+
+    def prefetch(self, cats: Iterable, **sprite_options):
+        """Draw the sprites of cats which will probably be shown soon, after the ones already asked for."""
+        for cat in cats:
+            key = get_sprite_key(cat, **sprite_options)
+            if key is not None and sprites.get_cat_sprite(key) is None:
+                self._add_job(PREFETCH, key)
+
+    def cancel(self, owner):
+        """Forget the requests of a widget that is gone, e.g. because it was killed."""
+        for key in list(self._waiting):
+            requests = [request for request in self._waiting[key] if request[0] is not owner]
+            if requests:
+                self._waiting[key] = requests
+            else:
+                del self._waiting[key]
+
+    def update(self):
+        """Hand finished sprites to whoever asked for them. Call this once per frame."""
+        while True:
+            try:
+                key, sprite = self._finished.get_nowait()
+            except Empty:
+                return
+            requests = self._waiting.pop(key, ())
+            if requests and sprite is None:
+                # it couldn't be drawn in the background
+                try:
+                    sprite = draw_cat_sprite(key)
+                except Exception:
+                    logger.exception("Failed to draw sprite")
+                    sprite = self.placeholder
+            for _, callback in requests:
+                callback(sprite)
+
+    def _add_job(self, priority: int, key: CatSpriteKey):
+        self._jobs.put((priority, next(self._order), key))
+        if not self._threads:
+            for i in range(self.workers):
+                thread = Thread(
+                    target=self._work, name=f"sprite_worker_{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            _, _, key = self._jobs.get()
+            # the same sprite may have been asked for more than once
+            sprite = sprites.get_cat_sprite(key)
+            try:
+                if sprite is None:
+                    sprite = draw_cat_sprite(key)
+            except Exception:
+                logger.exception("Failed to draw sprite in the background")
+                sprite = None
+            self._finished.put((key, sprite))
+
+
+sprite_queue = SpriteQueue()
@@ -1,5 +1,8 @@
 import os
+from collections import OrderedDict
+from collections.abc import Mapping
 from copy import copy
+from threading import Lock
 
 import pygame
 import ujson
@@ -7,11 +10,66 @@ import ujson
 from scripts.game_structure.game_essentials import game
 
 
+class SpriteRegistry(Mapping):
+    """
+    All sprites cut out of the spritesheets, by name. Works like a read-only dict of Surfaces.
+
+    At startup only the position of each sprite on its spritesheet is recorded. The spritesheet is
+    loaded and the sprite cut out of it the first time the sprite is looked up, so sprites no cat
+    uses never take up memory.
+    """
+
+    def __init__(self, owner):
+        self._owner = owner
+        self._positions = {}  # name: (spritesheet, x, y)
+        self._sprites = {}
+        self._lock = Lock()
+
+    def add(self, name, spritesheet, x, y):
+        """Record where a sprite is, without cutting it out yet."""
+        self._positions[name] = (spritesheet, x, y)
+        self._sprites.pop(name, None)
+
+    def __getitem__(self, name) -> pygame.Surface:
+        sprite = self._sprites.get(name)
+        if sprite is None:
+            # sprites are also drawn outside the main thread, see sprite_queue.py
+            with self._lock:
+                sprite = self._sprites.get(name)
+                if sprite is None:
+                    sprite = self._sprites[name] = self._owner.cut_sprite(
+                        name, *self._positions[name]
+                    )
+        return sprite
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+    @property
+    def created(self) -> int:
+        """How many sprites were cut out so far."""
+        return len(self._sprites)
+
+    def clear(self):
+        with self._lock:
+            self._positions.clear()
+            self._sprites.clear()
+
+
 class Sprites:
     cat_tints = {}
     white_patches_tints = {}
     clan_symbols = []
 
+    # how many finished cat sprites are kept, see get_cat_sprite()
+    cat_sprite_cache_size = 1024
+
     def __init__(self):
         """Class that handles and hold all spritesheets.
         Size is normally automatically determined by the size
@@ -19,13 +77,21 @@ class Sprites:
         this value."""
         self.symbol_dict = None
         self.size = None
-        self.spritesheets = {}
+        self.spritesheet_files = {}
+        self.spritesheets = {}  # only the spritesheets that were needed so far
         self.images = {}
-        self.sprites = {}
+        self.sprites = SpriteRegistry(self)
 
         # Shared empty sprite for placeholders
         self.blank_sprite = None
 
+        # finished cat sprites, keyed by everything that decides what they look like.
+        # Sprites are also drawn outside the main thread, see sprite_queue.py
+        self.cat_sprite_cache = OrderedDict()
+        self.cat_sprite_cache_lock = Lock()
+        # surfaces filled with one tint colour, keyed by that colour
+        self.tint_surfaces = {}
+
         self.load_tints()
 
     def load_tints(self):
@@ -43,15 +109,66 @@ class Sprites:
         except IOError:
             print("ERROR: Reading White Patches Tints")
 
+    def tint_surface(self, colour) -> pygame.Surface:
+        """Returns a sprite-sized surface filled with the given colour. Don't draw on it."""
+        colour = tuple(colour)
+        surface = self.tint_surfaces.get(colour)
+        if surface is None:
+            surface = pygame.Surface((self.size, self.size)).convert_alpha()
+            surface.fill(colour)
+            self.tint_surfaces[colour] = surface
+        return surface
+
+    def get_cat_sprite(self, key):
+        """Returns the finished cat sprite stored under key, or None. Don't draw on it."""
+        with self.cat_sprite_cache_lock:
+            sprite = self.cat_sprite_cache.get(key)
+            if sprite is not None:
+                self.cat_sprite_cache.move_to_end(key)
+        return sprite
+
+    def store_cat_sprite(self, key, sprite: pygame.Surface):
+        """Keep a finished cat sprite, forgetting the least recently used one if the cache is full."""
+        with self.cat_sprite_cache_lock:
+            self.cat_sprite_cache[key] = sprite
+            self.cat_sprite_cache.move_to_end(key)
+            if len(self.cat_sprite_cache) > self.cat_sprite_cache_size:
+                self.cat_sprite_cache.popitem(last=False)
+
     def spritesheet(self, a_file, name):
         """
-        Add spritesheet called name from a_file.
+        Add spritesheet called name from a_file. The file is only loaded once one of its sprites is used.
 
         Parameters:
         a_file -- Path to the file to create a spritesheet from.
         name -- Name to call the new spritesheet.
         """
-        self.spritesheets[name] = pygame.image.load(a_file).convert_alpha()
+        self.spritesheet_files[name] = a_file
+        self.spritesheets.pop(name, None)
+
+    def get_spritesheet(self, name) -> pygame.Surface:
+        """Returns the spritesheet called name, loading it if it wasn't needed before."""
+        sheet = self.spritesheets.get(name)
+        if sheet is None:
+            sheet = self.spritesheets[name] = pygame.image.load(
+                self.spritesheet_files[name]
+            ).convert_alpha()
+        return sheet
+
+    def cut_sprite(self, name, spritesheet, x, y) -> pygame.Surface:
+        """Cut one sprite out of a spritesheet. Used by SpriteRegistry, the first time a sprite is needed."""
+        try:
+            return pygame.Surface.subsurface(
+                self.get_spritesheet(spritesheet), x, y, self.size, self.size
+            )
+        except ValueError:
+            # Fallback for non-existent sprites
+            print(f"WARNING: nonexistent sprite - {name}")
+            if not self.blank_sprite:
+                self.blank_sprite = pygame.Surface(
+                    (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
+                )
+            return self.blank_sprite
 
     def make_group(
         self, spritesheet, pos, name, sprites_x=3, sprites_y=7, no_index=False
@@ -78,25 +195,12 @@ class Sprites:
                 else:
                     full_name = f"{name}{i}"
 
-                try:
-                    new_sprite = pygame.Surface.subsurface(
-                        self.spritesheets[spritesheet],
-                        group_x_ofs + x * self.size,
-                        group_y_ofs + y * self.size,
-                        self.size,
-                        self.size,
-                    )
-
-                except ValueError:
-                    # Fallback for non-existent sprites
-                    print(f"WARNING: nonexistent sprite - {full_name}")
-                    if not self.blank_sprite:
-                        self.blank_sprite = pygame.Surface(
-                            (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
-                        )
-                    new_sprite = self.blank_sprite
-
-                self.sprites[full_name] = new_sprite
+                self.sprites.add(
+                    full_name,
+                    spritesheet,
+                    group_x_ofs + x * self.size,
+                    group_y_ofs + y * self.size,
+                )
                 i += 1
 
     def load_all(self):
@@ -120,6 +224,10 @@ class Sprites:
 
         del width, height  # unneeded
 
+        with self.cat_sprite_cache_lock:
+            self.cat_sprite_cache.clear()
+        self.tint_surfaces.clear()
+
         for x in [
             "lineart",
             "lineartdf",
@@ -754,6 +862,27 @@ class Sprites:
 
             y_pos += 1
 
+    def memory_report(self) -> dict:
+        """
+        How many sprites exist and how much memory their pixels take up. Sprites cut out of a
+        spritesheet share its pixels, so only the spritesheets themselves are counted for them.
+        """
+
+        def size_of(surface):
+            return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+        with self.cat_sprite_cache_lock:
+            cat_sprites = list(self.cat_sprite_cache.values())
+        return {
+            "sprites": len(self.sprites),
+            "sprites_cut_out": self.sprites.created,
+            "spritesheets": len(self.spritesheet_files),
+            "spritesheets_loaded": len(self.spritesheets),
+            "spritesheet_bytes": sum(size_of(sheet) for sheet in self.spritesheets.values()),
+            "cat_sprites": len(cat_sprites),
+            "cat_sprite_bytes": sum(size_of(sprite) for sprite in cat_sprites),
+        }
+
     def dark_mode_symbol(self, symbol):
         """Change the color of the symbol to dark mode, then return it
         :param Surface symbol: The clan symbol to convert"""
@@ -3,54 +3,121 @@ from random import choice
 
 import i18n
 
+from scripts.cat_relations.constraints import compile_constraint
 from scripts.game_structure.localization import load_lang_resource
 
 
-class Thoughts:
-    @staticmethod
-    def thought_fulfill_rel_constraints(main_cat, random_cat, constraint) -> bool:
-        """Check if the relationship fulfills the interaction relationship constraints."""
-        # if the constraints are not existing, they are considered to be fulfilled
-        if not random_cat:
-            return False
-
-        # No current relationship-value bases tags, so this is commented out.
-        relationship = None
-        if random_cat.ID in main_cat.relationships:
-            relationship = main_cat.relationships[random_cat.ID]
-
-        if "siblings" in constraint and not main_cat.is_sibling(random_cat):
-            return False
+class ThoughtIndex:
+    """
+    The thoughts available to one life state and status, bucketed by the constraints that only depend on the
+    main cat and the Clan. Each cat then only has to check the thoughts that could actually apply to it.
+    """
+
+    # constraint key -> whether "any" in the constraint means it's always fulfilled
+    INDEXED_CONSTRAINTS = {
+        "biome": False,
+        "season": False,
+        "camp": False,
+        "main_status_constraint": True,
+        "main_age_constraint": False,
+        "main_trait_constraint": False,
+    }
+
+    def __init__(self, thoughts: list):
+        self.thoughts = thoughts
+        self.all_thoughts = (1 << len(thoughts)) - 1
+
+        # constraint key -> thoughts without that constraint, as a bitmask of indexes into self.thoughts
+        self.unconstrained = {}
+        # constraint key -> {value: thoughts that value fulfills, as a bitmask}
+        self.buckets = {}
+        for key, any_allowed in self.INDEXED_CONSTRAINTS.items():
+            unconstrained = 0
+            buckets = {}
+            for i, thought in enumerate(thoughts):
+                values = thought.get(key)
+                if values is None or (any_allowed and "any" in values):
+                    unconstrained |= 1 << i
+                    continue
+                for value in values:
+                    buckets[value] = buckets.get(value, 0) | 1 << i
+
+            self.unconstrained[key] = unconstrained
+            self.buckets[key] = {
+                value: mask | unconstrained for value, mask in buckets.items()
+            }
+
+        for thought in thoughts:
+            if "relationship_constraint" in thought:
+                compile_constraint(
+                    thought["relationship_constraint"], thought.get("id")
+                )
 
-        if "littermates" in constraint and not main_cat.is_littermate(random_cat):
-            return False
+    def candidates(self, main_cat, biome, season, camp) -> list:
+        """Returns the thoughts that aren't ruled out by the indexed constraints, in their original order."""
+        mask = self.all_thoughts
+        for key, value in (
+            ("biome", biome),
+            ("season", season),
+            ("camp", camp),
+            ("main_status_constraint", main_cat.status),
+            ("main_age_constraint", main_cat.age),
+            ("main_trait_constraint", main_cat.personality.trait),
+        ):
+            mask &= self.buckets[key].get(value, self.unconstrained[key])
+            if not mask:
+                return []
 
-        if "mates" in constraint and random_cat.ID not in main_cat.mate:
-            return False
+        found = []
+        while mask:
+            lowest = mask & -mask
+            found.append(self.thoughts[lowest.bit_length() - 1])
+            mask ^= lowest
+        return found
 
-        if "not_mates" in constraint and random_cat.ID in main_cat.mate:
-            return False
 
-        if "parent/child" in constraint and not main_cat.is_parent(random_cat):
-            return False
+class Thoughts:
+    # location of the thought files -> ThoughtIndex, for the currently loaded language
+    thought_indexes = {}
+    # location of a thought file -> its contents, for the currently loaded language
+    thought_files = {}
+    thoughts_lang = None
 
-        if "child/parent" in constraint and not random_cat.is_parent(main_cat):
-            return False
+    @staticmethod
+    def check_thoughts_lang():
+        """Drop the loaded thoughts if the language has changed since they were loaded."""
+        if Thoughts.thoughts_lang != i18n.config.get("locale"):
+            Thoughts.thought_indexes.clear()
+            Thoughts.thought_files.clear()
+            Thoughts.thoughts_lang = i18n.config.get("locale")
 
-        if "mentor/app" in constraint and random_cat not in main_cat.apprentice:
-            return False
+    @staticmethod
+    def load_thought_file(location: str) -> list:
+        """Load a thought file from the lang folder, only reading it the first time it's asked for."""
+        Thoughts.check_thoughts_lang()
+        if location not in Thoughts.thought_files:
+            Thoughts.thought_files[location] = load_lang_resource(location)
+        return Thoughts.thought_files[location]
 
-        if "app/mentor" in constraint and random_cat.ID != main_cat.mentor:
-            return False
+    @staticmethod
+    def get_thought_index(*locations: str) -> ThoughtIndex:
+        """Get the index for the thoughts of the given files combined, building it the first time it's needed."""
+        Thoughts.check_thoughts_lang()
+        if locations not in Thoughts.thought_indexes:
+            thoughts = []
+            for location in locations:
+                thoughts.extend(Thoughts.load_thought_file(location))
+            Thoughts.thought_indexes[locations] = ThoughtIndex(thoughts)
+        return Thoughts.thought_indexes[locations]
 
-        if (
-            "strangers" in constraint
-            and relationship
-            and (relationship.platonic_like < 1 or relationship.romantic_love < 1)
-        ):
+    @staticmethod
+    def thought_fulfill_rel_constraints(main_cat, random_cat, constraint) -> bool:
+        """Check if the relationship fulfills the interaction relationship constraints."""
+        # if the constraints are not existing, they are considered to be fulfilled
+        if not random_cat:
             return False
 
-        return True
+        return compile_constraint(constraint).fulfilled_by(main_cat, random_cat)
 
     @staticmethod
     def cats_fulfill_thought_constraints(
@@ -358,20 +425,23 @@ class Thoughts:
         # newborns only pull from their status thoughts. this is done for convenience
         try:
             if main_cat.age == "newborn":
-                loaded_thoughts = load_lang_resource(
+                thought_index = Thoughts.get_thought_index(
                     f"thoughts/{life_dir}{spec_dir}/newborn.json"
                 )
             else:
-                thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/{status}.json"
-                )
-                genthoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/general.json"
+                thought_index = Thoughts.get_thought_index(
+                    f"thoughts/{life_dir}{spec_dir}/{status}.json",
+                    f"thoughts/{life_dir}{spec_dir}/general.json",
                 )
-                loaded_thoughts = thoughts + genthoughts
 
             final_thoughts = Thoughts.create_thoughts(
-                loaded_thoughts, main_cat, other_cat, game_mode, biome, season, camp
+                thought_index.candidates(main_cat, biome, season, camp),
+                main_cat,
+                other_cat,
+                game_mode,
+                biome,
+                season,
+                camp,
             )
             return final_thoughts
         except IOError:
@@ -421,11 +491,11 @@ class Thoughts:
         THOUGHTS: []
         try:
             if lives_left > 0:
-                loaded_thoughts = load_lang_resource(
+                loaded_thoughts = Thoughts.load_thought_file(
                     f"thoughts/ondeath{spec_dir}/leader_life.json"
                 )
             else:
-                loaded_thoughts = load_lang_resource(
+                loaded_thoughts = Thoughts.load_thought_file(
                     f"thoughts/ondeath{spec_dir}/leader_death.json"
                 )
             thought_group = choice(
@@ -450,7 +520,7 @@ class Thoughts:
             spec_dir = "/darkforest"
         THOUGHTS: []
         try:
-            loaded_thoughts = load_lang_resource(
+            loaded_thoughts = Thoughts.load_thought_file(
                 f"thoughts/ondeath{spec_dir}/general.json"
             )
             thought_group = choice(
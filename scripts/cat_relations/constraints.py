@@ -0,0 +1,150 @@
+"""
+Relationship constraints.
+
+Interactions, thoughts, group types and events can ask for a certain relationship between two cats,
+as a list of tags: family and mate tags like "siblings" or "not_mates", and value tags like
+"romantic_40" (the romantic love has to be at least 40) or "dislike_20_lower" (at most 20).
+compile_constraint() parses such a list once into a RelationshipConstraint, so checking it doesn't
+have to take the tags apart again every time. Compiled constraints are shared between everything that
+uses the same tags, and tags that don't follow the format are reported once, when they are compiled.
+"""
+
+from operator import ge, le
+from typing import Dict, Iterable, Optional, Tuple
+
+# value tag: the attribute of Relationship it checks
+RELATIONSHIP_VALUES = {
+    "romantic": "romantic_love",
+    "platonic": "platonic_like",
+    "dislike": "dislike",
+    "admiration": "admiration",
+    "comfortable": "comfortable",
+    "jealousy": "jealousy",
+    "trust": "trust",
+}
+
+
+def _are_mates(cat_from, cat_to) -> bool:
+    return cat_to.ID in cat_from.mate and cat_from.ID in cat_to.mate
+
+
+def _are_strangers(cat_from, cat_to) -> bool:
+    if cat_to.ID not in cat_from.relationships:
+        return True
+    return (
+        cat_from.relationships.value_towards(cat_to.ID, "platonic_like") >= 1
+        and cat_from.relationships.value_towards(cat_to.ID, "romantic_love") >= 1
+    )
+
+
+# tag: check whether cat_from and cat_to fulfill it
+TAG_CHECKS = {
+    "siblings": lambda cat_from, cat_to: cat_from.is_sibling(cat_to),
+    "littermates": lambda cat_from, cat_to: cat_from.is_littermate(cat_to),
+    "mates": _are_mates,
+    "not_mates": lambda cat_from, cat_to: not (
+        cat_to.ID in cat_from.mate or cat_from.ID in cat_to.mate
+    ),
+    "parent/child": lambda cat_from, cat_to: cat_from.is_parent(cat_to),
+    "child/parent": lambda cat_from, cat_to: cat_to.is_parent(cat_from),
+    "mentor/app": lambda cat_from, cat_to: cat_to.ID in cat_from.apprentice,
+    "app/mentor": lambda cat_from, cat_to: cat_to.ID == cat_from.mentor,
+    "strangers": _are_strangers,
+}
+
+
+class RelationshipConstraint:
+    """A list of relationship constraint tags, parsed."""
+
+    def __init__(self, tags: Tuple[str, ...], source: Optional[str] = None):
+        """
+        :param tags: The constraint tags
+        :param source: What the constraint belongs to (e.g. the ID of the interaction), for error messages
+        """
+        self.tags = frozenset(tags)
+        # whether all value tags follow the format
+        self.valid = True
+        self.checks = tuple(TAG_CHECKS[tag] for tag in tags if tag in TAG_CHECKS)
+        # (attribute of the relationship, ge or le, threshold)
+        self.thresholds = []
+
+        for v_type, value in RELATIONSHIP_VALUES.items():
+            value_tags = [tag for tag in tags if v_type in tag]
+            if not value_tags:
+                continue
+            if len(value_tags) > 1:
+                self.report(
+                    source, f"has multiple relationship constraints for the value {v_type}"
+                )
+            try:
+                split_tag = value_tags[0].split("_")
+                threshold = int(split_tag[1])
+            except (IndexError, ValueError):
+                self.report(
+                    source,
+                    f"has a relationship constraint for the value {v_type} which doesn't follow the "
+                    f"formatting guidelines",
+                )
+                continue
+            if not 0 < threshold <= 100:
+                self.report(
+                    source,
+                    f"has a relationship constraint for the value {v_type} which is outside of the "
+                    f"values of a relationship (1 to 100)",
+                )
+                continue
+            lower_than = len(split_tag) >= 3
+            self.thresholds.append((value, le if lower_than else ge, threshold))
+        self.thresholds = tuple(self.thresholds)
+
+    def report(self, source, message: str):
+        self.valid = False
+        print(f"ERROR: {source or 'a relationship constraint'} {message}.")
+
+    def __bool__(self):
+        return bool(self.tags)
+
+    def values_fulfilled(self, cat_from, cat_to, relationship=None) -> bool:
+        """
+        Check the value tags for the relationship of cat_from towards cat_to. Without the relationship
+        object, the values are looked up without creating the relationship, and a missing relationship
+        doesn't fulfill any value tag.
+        """
+        if not self.thresholds:
+            return True
+        if relationship is not None:
+            return all(
+                compare(getattr(relationship, value), threshold)
+                for value, compare, threshold in self.thresholds
+            )
+        relationships = cat_from.relationships
+        if cat_to.ID not in relationships:
+            return False
+        return all(
+            compare(relationships.value_towards(cat_to.ID, value), threshold)
+            for value, compare, threshold in self.thresholds
+        )
+
+    def fulfilled_by(self, cat_from, cat_to, relationship=None) -> bool:
+        """Check all tags for cat_from and cat_to, see values_fulfilled()."""
+        for check in self.checks:
+            if not check(cat_from, cat_to):
+                return False
+        return self.values_fulfilled(cat_from, cat_to, relationship)
+
+
+_compiled: Dict[Tuple[str, ...], RelationshipConstraint] = {}
+
+
+def compile_constraint(
+    tags: Optional[Iterable[str]], source: Optional[str] = None
+) -> RelationshipConstraint:
+    """
+    Returns the compiled constraint of the tags. The same tags always give the same object, so they
+    are only parsed (and reported if they are wrong) once.
+    """
+    key = tuple(tags) if tags else ()
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = RelationshipConstraint(key, source)
+    return compiled
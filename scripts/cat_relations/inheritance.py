@@ -30,8 +30,77 @@ BLOOD_RELATIVE_TYPES = [
 ]
 
 
+class FamilyIndex:
+    """
+    Clan-wide index of the parent -> kit edges (blood and adoptive) of every cat in Cat.all_cats.
+    The inheritance uses it to find kits, siblings, parents' siblings and cousins by following
+    these edges, instead of going through every cat of the Clan.
+    """
+
+    def __init__(self):
+        self.kits = {}  # parent ID: set of kit IDs
+        self.parents = {}  # kit ID: parent IDs the kit is currently listed under
+        self.order = {}  # cat ID: position the cat was added in, to keep the order of Cat.all_cats
+        self.next_position = 0
+
+    def clear(self):
+        self.kits.clear()
+        self.parents.clear()
+        self.order.clear()
+        self.next_position = 0
+
+    def rebuild(self, all_cats):
+        """Index all the given cats from scratch, in their current order."""
+        self.clear()
+        for cat in all_cats.values():
+            self.update_cat(cat)
+
+    def update_cat(self, cat):
+        """Add the cat, or move its edges if its parents changed since it was last indexed."""
+        if cat.ID not in self.order:
+            self.order[cat.ID] = self.next_position
+            self.next_position += 1
+
+        parents = [cat.parent1, cat.parent2] + list(cat.adoptive_parents)
+        parents = tuple(dict.fromkeys(i for i in parents if i))
+        old_parents = self.parents.get(cat.ID, ())
+        if parents == old_parents:
+            return
+
+        for parent_id in old_parents:
+            self.kits[parent_id].discard(cat.ID)
+            if not self.kits[parent_id]:
+                del self.kits[parent_id]
+        for parent_id in parents:
+            self.kits.setdefault(parent_id, set()).add(cat.ID)
+        self.parents[cat.ID] = parents
+
+    def remove_cat(self, cat_id):
+        """Remove the cat, which is no longer part of Cat.all_cats. Edges to its kits are kept."""
+        for parent_id in self.parents.pop(cat_id, ()):
+            self.kits[parent_id].discard(cat_id)
+            if not self.kits[parent_id]:
+                del self.kits[parent_id]
+        self.order.pop(cat_id, None)
+
+    def get_kits(self, *parent_ids) -> set:
+        """Returns the IDs of all cats which have at least one of the given cats as a parent."""
+        kits = set()
+        for parent_id in parent_ids:
+            kits.update(self.kits.get(parent_id, ()))
+        return kits
+
+    def in_order(self, cat_ids, all_cats) -> list:
+        """Returns the given IDs, which are in all_cats, in the order the cats were added."""
+        return sorted(
+            (i for i in cat_ids if i in all_cats),
+            key=lambda i: self.order.get(i, self.next_position),
+        )
+
+
 class Inheritance:
     all_inheritances = {}  # ID: object
+    family_index = FamilyIndex()
 
     def __init__(self, cat, born=False):
         self.need_update = False
@@ -89,9 +158,18 @@ class Inheritance:
         # mates
         self.init_mates()
 
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
-                continue
+        # only kits of the cat, its parents and its grandparents and the kits of those can
+        # be related in the ways below, so there is no need to check any other cat
+        self.family_index.update_cat(self.cat)
+        parents_siblings = self.family_index.get_kits(*self.grand_parents)
+        candidates = (
+            self.family_index.get_kits(self.cat.ID, *self.get_parents())
+            | parents_siblings
+            | self.family_index.get_kits(*parents_siblings)
+        )
+        candidates.discard(self.cat.ID)
+        for inter_id in self.family_index.in_order(candidates, self.cat.all_cats):
+            inter_cat = self.cat.all_cats[inter_id]
 
             # kits + their mates
             self.init_kits(inter_id, inter_cat)
@@ -106,9 +184,10 @@ class Inheritance:
             self.init_cousins(inter_id, inter_cat)
 
         # since grand kits depending on kits, ALL KITS HAVE TO BE SET FIRST!
-        for inter_id, inter_cat in self.cat.all_cats.items():
-            if inter_id == self.cat.ID:
-                continue
+        candidates = self.family_index.get_kits(*self.kits)
+        candidates.discard(self.cat.ID)
+        for inter_id in self.family_index.in_order(candidates, self.cat.all_cats):
+            inter_cat = self.cat.all_cats[inter_id]
 
             # grand kits
             self.init_grand_kits(inter_id, inter_cat)
@@ -220,6 +299,7 @@ class Inheritance:
             and parent.ID not in self.cat.adoptive_parents
         ):
             self.cat.adoptive_parents.append(parent.ID)
+            self.family_index.update_cat(self.cat)
         self.all_involved.append(parent.ID)
         self.all_but_cousins.append(parent.ID)
         self.update_all_related_inheritance()
@@ -490,8 +570,11 @@ class Inheritance:
                 }
                 self.other_mates.append(mate_id)
 
-            # iterate over all cats, to get the children of the sibling
-            for _c in self.cat.all_cats.values():
+            # get the children of the sibling
+            for _c_id in self.family_index.in_order(
+                self.family_index.get_kits(inter_id), self.cat.all_cats
+            ):
+                _c = self.cat.all_cats[_c_id]
                 _c_parents = self.get_parents(_c)
                 _c_adoptive = self.get_adoptive_parents(_c)
                 if inter_id in _c_parents:
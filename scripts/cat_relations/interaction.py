@@ -1,5 +1,9 @@
 import i18n
 
+from scripts.cat_relations.constraints import (
+    RelationshipConstraint,
+    compile_constraint,
+)
 from scripts.game_structure.localization import load_lang_resource
 
 
@@ -60,6 +64,15 @@ class SingleInteraction:
         self.reaction_random_cat = reaction_random_cat if reaction_random_cat else {}
         self.also_influences = also_influences if also_influences else {}
 
+    @property
+    def relationship_constraint(self) -> list:
+        return self._relationship_constraint
+
+    @relationship_constraint.setter
+    def relationship_constraint(self, constraint: list):
+        self._relationship_constraint = constraint
+        self.compiled_constraint = compile_constraint(constraint, self.id)
+
 
 class GroupInteraction:
     def __init__(
@@ -102,6 +115,17 @@ class GroupInteraction:
         self.specific_reaction = specific_reaction if specific_reaction else {}
         self.general_reaction = general_reaction if general_reaction else {}
 
+    @property
+    def relationship_constraint(self) -> dict:
+        return self._relationship_constraint
+
+    @relationship_constraint.setter
+    def relationship_constraint(self, constraint: dict):
+        self._relationship_constraint = constraint
+        self.compiled_constraints = {
+            name: compile_constraint(tags, self.id) for name, tags in constraint.items()
+        }
+
 
 # ---------------------------------------------------------------------------- #
 #                some useful functions related to interactions                 #
@@ -109,116 +133,18 @@ class GroupInteraction:
 
 
 def rel_fulfill_rel_constraints(relationship, constraint, interaction_id) -> bool:
-    """Check if the relationship fulfills the interaction relationship constraints."""
+    """
+    Check if the relationship fulfills the interaction relationship constraints.
+    :param constraint: The compiled constraint, or the list of constraint tags
+    """
+    if not isinstance(constraint, RelationshipConstraint):
+        constraint = compile_constraint(constraint, interaction_id)
     # if the constraints are not existing, they are considered to be fulfilled
     if not constraint:
         return True
-    if len(constraint) == 0:
-        return True
-
-    if "siblings" in constraint and not relationship.cat_from.is_sibling(
-        relationship.cat_to
-    ):
-        return False
-
-    if "mates" in constraint and (
-        relationship.cat_from.ID not in relationship.cat_to.mate
-        or relationship.cat_to.ID not in relationship.cat_from.mate
-    ):
-        return False
-
-    if "not_mates" in constraint and (
-        relationship.cat_from.ID in relationship.cat_to.mate
-        or relationship.cat_to.ID in relationship.cat_from.mate
-    ):
-        return False
-
-    if "parent/child" in constraint and not relationship.cat_from.is_parent(
-        relationship.cat_to
-    ):
-        return False
-
-    if "child/parent" in constraint and not relationship.cat_to.is_parent(
-        relationship.cat_from
-    ):
-        return False
-
-    value_types = [
-        "romantic",
-        "platonic",
-        "dislike",
-        "admiration",
-        "comfortable",
-        "jealousy",
-        "trust",
-    ]
-    for v_type in value_types:
-        tags = [i for i in constraint if v_type in i]
-        if len(tags) < 1:
-            continue
-        lower_than = False
-        # try to extract the value/threshold from the text
-        try:
-            splitted = tags[0].split("_")
-            threshold = int(splitted[1])
-            if len(splitted) >= 3:
-                lower_than = True
-        except:  # TODO: find out what this try-except is protecting against and explicitly guard for it
-            print(
-                f"ERROR: interaction {interaction_id} with the relationship constraint for "
-                f"the value {v_type} doesn't follow the formatting guidelines."
-            )
-            break
-
-        if threshold > 100:
-            print(
-                f"ERROR: interaction {interaction_id} has a relationship constraint for the value {v_type}, "
-                f"which is higher than the max value of a relationship (100)."
-            )
-            break
-        elif threshold <= 0:
-            print(
-                f"ERROR: interaction {interaction_id} has a relationship constraints for the value {v_type}, "
-                f"which is lower than the min value of a relationship or 0."
-            )
-            break
-
-        threshold_fulfilled = False
-        if v_type == "romantic":
-            if not lower_than and relationship.romantic_love >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.romantic_love <= threshold:
-                threshold_fulfilled = True
-        if v_type == "platonic":
-            if not lower_than and relationship.platonic_like >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.platonic_like <= threshold:
-                threshold_fulfilled = True
-        if v_type == "dislike":
-            if not lower_than and relationship.dislike >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.dislike <= threshold:
-                threshold_fulfilled = True
-        if v_type == "comfortable":
-            if not lower_than and relationship.comfortable >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.comfortable <= threshold:
-                threshold_fulfilled = True
-        if v_type == "jealousy":
-            if not lower_than and relationship.jealousy >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.jealousy <= threshold:
-                threshold_fulfilled = True
-        if v_type == "trust":
-            if not lower_than and relationship.trust >= threshold:
-                threshold_fulfilled = True
-            elif lower_than and relationship.trust <= threshold:
-                threshold_fulfilled = True
-
-        if not threshold_fulfilled:
-            return False
-
-    return True
+    return constraint.fulfilled_by(
+        relationship.cat_from, relationship.cat_to, relationship
+    )
 
 
 def cats_fulfill_single_interaction_constraints(
@@ -419,6 +345,13 @@ rel_types = [
 
 relationship_lang = None
 
+INTENSITIES = ["low", "medium", "high"]
+# (type, "increase" or "decrease", intensity): the interactions, in the order they were loaded
+# (None, "neutral", None): the neutral interactions
+INTERACTION_POOLS = {}
+# the same keys, with the biome and season added: the interactions of that pool which can happen there
+_local_pools = {}
+
 
 def rebuild_relationship_dicts():
     global INTERACTION_MASTER_DICT, NEUTRAL_INTERACTIONS, relationship_lang
@@ -442,3 +375,44 @@ def rebuild_relationship_dicts():
             f"events/relationship_events/normal_interactions/neutral.json"
         )
     )
+
+    INTERACTION_POOLS.clear()
+    _local_pools.clear()
+    for rel, directions in INTERACTION_MASTER_DICT.items():
+        for direction, interaction_list in directions.items():
+            for intensity in INTENSITIES:
+                INTERACTION_POOLS[(rel, direction, intensity)] = [
+                    interaction
+                    for interaction in interaction_list
+                    if interaction.intensity == intensity
+                ]
+    INTERACTION_POOLS[(None, "neutral", None)] = NEUTRAL_INTERACTIONS
+
+    relationship_lang = i18n.config.get("locale")
+
+
+def get_interaction_pool(
+    rel_type: str, in_de_crease: str, intensity: str, biome: str, season: str
+) -> list:
+    """
+    Returns the interactions which can happen in the biome and season. The list is shared, don't change it.
+    :param rel_type: The relationship value the interactions are about, ignored for neutral interactions
+    :param in_de_crease: "increase", "decrease" or "neutral"
+    :param intensity: "low", "medium" or "high", ignored for neutral interactions
+    :param biome: The Clan's biome, casefolded
+    :param season: The current season, casefolded
+    """
+    if in_de_crease == "neutral":
+        rel_type = intensity = None
+    key = (rel_type, in_de_crease, intensity, biome, season)
+    pool = _local_pools.get(key)
+    if pool is None:
+        allowed_biomes = (biome, "Any", "any")
+        allowed_seasons = (season, "Any", "any")
+        pool = _local_pools[key] = [
+            interaction
+            for interaction in INTERACTION_POOLS.get(key[:3], [])
+            if all(tag in allowed_biomes for tag in interaction.biome)
+            and all(tag in allowed_seasons for tag in interaction.season)
+        ]
+    return pool
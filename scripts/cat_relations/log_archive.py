@@ -0,0 +1,71 @@
+"""
+Old relationship log entries.
+
+A relationship only keeps the newest entries of its log (as many as "log_length" in the "relationship"
+part of game_config.json says). When the Clan is saved, the older ones are moved to the log archive of
+the cat, relationship_logs/<cat ID>.jsonl in the Clan's folder. The archive is only ever appended to,
+one line per relationship and save, so saving doesn't rewrite it, and it's only read when the log of a
+relationship is shown. This keeps the relationship saves, and the logs in memory, from growing for as
+long as the Clan lives.
+"""
+
+import os
+from typing import Dict, Iterable, List
+
+import ujson
+
+ARCHIVE_FOLDER = "relationship_logs"
+
+
+def get_archive_path(clan_directory: str, cat_id: str) -> str:
+    return os.path.join(clan_directory, ARCHIVE_FOLDER, f"{cat_id}.jsonl")
+
+
+def archive_log_entries(clan_directory: str, cat_id: str, entries: Dict[str, List[str]]):
+    """
+    Add log entries to the archive of a cat.
+    :param clan_directory: The Clan's save folder
+    :param cat_id: The ID of the cat the relationships belong to
+    :param entries: ID of the other cat: the entries to archive, oldest first
+    """
+    if not entries:
+        return
+    path = get_archive_path(clan_directory, cat_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as write_file:
+        write_file.write(
+            "".join(
+                ujson.dumps({"cat_to_id": cat_to_id, "log": log}) + "\n"
+                for cat_to_id, log in entries.items()
+            )
+        )
+
+
+def load_archived_log(clan_directory: str, cat_id: str, cat_to_id: str) -> List[str]:
+    """Returns the archived log entries of a relationship, oldest first."""
+    path = get_archive_path(clan_directory, cat_id)
+    if not os.path.exists(path):
+        return []
+
+    log = []
+    with open(path, "r", encoding="utf-8") as read_file:
+        for line in read_file:
+            try:
+                record = ujson.loads(line)
+            except ValueError:
+                # the end of a line can be missing if the game was closed while saving
+                continue
+            if record.get("cat_to_id") == cat_to_id:
+                log.extend(record.get("log", []))
+    return log
+
+
+def remove_archives_except(clan_directory: str, cat_ids: Iterable[str]):
+    """Delete the archives of all cats except the given ones."""
+    folder = os.path.join(clan_directory, ARCHIVE_FOLDER)
+    if not os.path.isdir(folder):
+        return
+    keep = {f"{cat_id}.jsonl" for cat_id in cat_ids}
+    for file_name in os.listdir(folder):
+        if file_name not in keep:
+            os.remove(os.path.join(folder, file_name))
@@ -1,4 +1,5 @@
 import random
+from collections.abc import MutableMapping
 from random import choice
 
 import i18n
@@ -21,6 +22,26 @@ from scripts.utility import get_personality_compatibility, process_text
 
 
 class Relationship:
+    # a Clan has one Relationship for every pair of cats that has interacted, so keep them small
+    __slots__ = (
+        "chosen_interaction",
+        "cat_from",
+        "cat_to",
+        "mates",
+        "family",
+        "opposite_relationship",
+        "interaction_str",
+        "triggered_event",
+        "log",
+        "_romantic_love",
+        "_platonic_like",
+        "_dislike",
+        "_admiration",
+        "_comfortable",
+        "_jealousy",
+        "_trust",
+    )
+
     used_interaction_ids = []
     currently_loaded_lang = None
 
@@ -40,7 +61,6 @@ class Relationship:
         log=None,
     ) -> None:
         self.chosen_interaction = None
-        self.history = History()
         self.cat_from = cat_from
         self.cat_to = cat_to
         self.mates = mates
@@ -74,6 +94,19 @@ class Relationship:
             self.cat_to.relationships[self.cat_from.ID] = relation
             self.opposite_relationship = relation
 
+    def compact_log(self, keep: int) -> list:
+        """
+        Remove all but the newest log entries.
+        :param keep: How many entries to keep
+        :return: The removed entries, oldest first
+        """
+        if len(self.log) <= keep:
+            return []
+        cut = len(self.log) - keep
+        removed = self.log[:cut]
+        del self.log[:cut]
+        return removed
+
     def start_interaction(self) -> None:
         """This function handles the simple interaction of this relationship."""
         # such interactions are only allowed for living Clan members
@@ -118,19 +151,14 @@ class Relationship:
         biome = str(game.clan.biome).casefold()
         game_mode = game.clan.game_mode
 
-        all_interactions = interactions.NEUTRAL_INTERACTIONS.copy()
-        if in_de_crease != "neutral":
-            all_interactions = interactions.INTERACTION_MASTER_DICT[rel_type][
-                in_de_crease
-            ].copy()
-            possible_interactions = self.get_relevant_interactions(
-                all_interactions, intensity, biome, season, game_mode
-            )
-        else:
+        if in_de_crease == "neutral":
             intensity = None
-            possible_interactions = self.get_relevant_interactions(
-                all_interactions, intensity, biome, season, game_mode
-            )
+        possible_interactions = self.get_relevant_interactions(
+            interactions.get_interaction_pool(
+                rel_type, in_de_crease, intensity, biome, season
+            ),
+            game_mode,
+        )
 
         # return if there are no possible interactions.
         if len(possible_interactions) <= 0:
@@ -153,7 +181,7 @@ class Relationship:
 
         # if the chosen_interaction is still in the TRIGGERED_SINGLE_INTERACTIONS, clean the list
         if chosen_interaction in self.used_interaction_ids:
-            self.used_interaction_ids = []
+            Relationship.used_interaction_ids = []
 
         # add the chosen interaction id to the TRIGGERED_SINGLE_INTERACTIONS
         self.chosen_interaction = chosen_interaction
@@ -200,7 +228,7 @@ class Relationship:
 
                 if possible_scar or possible_death:
                     for condition in injuries:
-                        self.history.add_possible_history(
+                        History.add_possible_history(
                             injured_cat,
                             condition,
                             scar_text=possible_scar,
@@ -454,27 +482,15 @@ class Relationship:
         rel_type = choice(types)
         return rel_type
 
-    def get_relevant_interactions(
-        self,
-        interactions: list,
-        intensity: str,
-        biome: str,
-        season: str,
-        game_mode: str,
-    ) -> list:
+    def get_relevant_interactions(self, interactions: list, game_mode: str) -> list:
         """
         Filter interactions based on the status and other constraints.
+        The biome, season and intensity are already filtered by interactions.get_interaction_pool().
 
             Parameters
             ----------
             interactions : list
                 the interactions which need to be filtered
-            intensity : str
-                the intensity of the interactions
-            biome : str
-                biome of the clan
-            season : str
-                current season of the clan
             game_mode : str
                 game mode of the clan
 
@@ -484,33 +500,7 @@ class Relationship:
                 a list of interactions, which fulfill the criteria
         """
         filtered = []
-        _season = [season, "Any", "any"]
-        _biome = [biome, "Any", "any"]
-        # if there are no loaded interactions, return empty list
-        if not interactions:
-            return filtered
-
         for interact in interactions:
-            in_tags = list(
-                filter(
-                    lambda interact_biome: interact_biome not in _biome, interact.biome
-                )
-            )
-            if len(in_tags) > 0:
-                continue
-
-            in_tags = list(
-                filter(
-                    lambda interact_season: interact_season not in _season,
-                    interact.season,
-                )
-            )
-            if len(in_tags) > 0:
-                continue
-
-            if intensity is not None and interact.intensity != intensity:
-                continue
-
             cats_fulfill_conditions = cats_fulfill_single_interaction_constraints(
                 self.cat_from, self.cat_to, interact, game_mode
             )
@@ -518,7 +508,7 @@ class Relationship:
                 continue
 
             relationship_fulfill_conditions = rel_fulfill_rel_constraints(
-                self, interact.relationship_constraint, interact.id
+                self, interact.compiled_constraint, interact.id
             )
             if not relationship_fulfill_conditions:
                 continue
@@ -709,3 +699,95 @@ class Relationship:
         if value < 0:
             value = 0
         self._trust = value
+
+
+# ---------------------------------------------------------------------------- #
+#                        START RelationshipStore class                         #
+# ---------------------------------------------------------------------------- #
+
+
+class RelationshipStore(MutableMapping):
+    """
+    The relationships of one cat, keyed by the ID of the other cat. Works like a dict of Relationships.
+
+    Most relationships keep their default values for their whole life, so those are only stored as
+    the ID of the other cat. The Relationship object is created the first time it is looked up.
+    To check a value against a threshold, use value_towards(), which doesn't create the relationship.
+    A relationship with default values can only be created while the other cat is in Cat.all_cats,
+    so those whose cat was removed (e.g. because they faded) are left out, as if they weren't there.
+    """
+
+    __slots__ = ("cat", "_relationships")
+
+    def __init__(self, cat):
+        self.cat = cat
+        self._relationships = {}  # ID: Relationship, or None while it still has default values
+
+    def __getitem__(self, cat_id) -> Relationship:
+        relationship = self._relationships[cat_id]
+        if relationship is None:
+            cat_to = self.cat.all_cats.get(cat_id)
+            if cat_to is None:
+                raise KeyError(cat_id)
+            relationship = Relationship(self.cat, cat_to)
+            self._relationships[cat_id] = relationship
+        return relationship
+
+    def __setitem__(self, cat_id, relationship: Relationship):
+        self._relationships[cat_id] = relationship
+
+    def __delitem__(self, cat_id):
+        del self._relationships[cat_id]
+
+    def __contains__(self, cat_id):
+        if cat_id not in self._relationships:
+            return False
+        return self._relationships[cat_id] is not None or cat_id in self.cat.all_cats
+
+    def __iter__(self):
+        all_cats = self.cat.all_cats
+        for cat_id, relationship in self._relationships.items():
+            if relationship is not None or cat_id in all_cats:
+                yield cat_id
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"RelationshipStore({self.cat.ID}, {len(self)} relationships)"
+
+    def clear(self):
+        self._relationships.clear()
+
+    def add_default(self, cat_id):
+        """Add (or reset) a relationship to the given cat with default values, without creating it yet."""
+        self._relationships[cat_id] = None
+
+    def discard_default(self, cat_id):
+        """Remove the relationship to the given cat if it still has default values."""
+        if cat_id in self._relationships and self._relationships[cat_id] is None:
+            del self._relationships[cat_id]
+
+    def peek(self, cat_id):
+        """Returns the relationship to the given cat if it was created already, otherwise None."""
+        return self._relationships.get(cat_id)
+
+    def loaded_values(self) -> list:
+        """
+        Returns the relationships which were looked up or changed at some point.
+        All other relationships still have default values, so this is enough when looking for
+        relationships with a value above some threshold.
+        """
+        return [rel for rel in self._relationships.values() if rel is not None]
+
+    def value_towards(self, cat_id, value: str) -> int:
+        """
+        Returns one value of the relationship to the given cat, without creating it.
+        :param cat_id: The ID of the other cat
+        :param value: The name of the value, e.g. "trust" or "romantic_love"
+        :raises KeyError: If there's no relationship to the cat
+        """
+        relationship = self._relationships[cat_id]
+        if relationship is None:
+            return 0
+        return getattr(relationship, value)
@@ -21,6 +21,7 @@ from scripts.cat.cats import Cat, cat_class
 from scripts.cat.history import History
 from scripts.cat.names import names
 from scripts.cat.sprites import sprites
+from scripts.cat_relations.inheritance import Inheritance
 from scripts.clan_resources.freshkill import FreshkillPile, Nutrition
 from scripts.clan_resources.herb.herb_supply import HerbSupply
 from scripts.events_module.generate_events import OngoingEvent
@@ -381,6 +382,11 @@ class Clan:
 
         if ID in Cat.all_cats:
             Cat.all_cats.pop(ID)
+            Cat.membership.remove_cat(ID)
+            Inheritance.family_index.remove_cat(ID)
+            # relationships with default values can't be created to a cat that's gone
+            for other_cat in Cat.all_cats.values():
+                other_cat.relationships.discard_default(ID)
 
         if ID in self.clan_cats:
             self.clan_cats.remove(ID)
@@ -534,6 +540,7 @@ class Clan:
             self.save_freshkill_pile(game.clan)
 
         game.safe_save(f"{get_save_dir()}/{self.name}clan.json", clan_data)
+        game.write_save_manifest(self.name)
 
         if os.path.exists(get_save_dir() + f"/{self.name}clan.txt") & (
             self.name != "current"
@@ -560,7 +567,7 @@ class Clan:
             ]
 
     def save_clan_settings(self):
-        game.safe_save(
+        game.save_if_changed(
             get_save_dir() + f"/{self.name}/clan_settings.json", self.clan_settings
         )
 
@@ -961,7 +968,7 @@ class Clan:
         if not game.clan.name:
             return
 
-        game.safe_save(
+        game.save_if_changed(
             f"{get_save_dir()}/{game.clan.name}/pregnancy.json", clan.pregnancy_data
         )
 
@@ -1061,7 +1068,9 @@ class Clan:
         else:
             disaster = {}
 
-        game.safe_save(f"{get_save_dir()}/{clan.name}/disasters/primary.json", disaster)
+        game.save_if_changed(
+            f"{get_save_dir()}/{clan.name}/disasters/primary.json", disaster
+        )
 
         if clan.secondary_disaster:
             disaster = {
@@ -1078,7 +1087,7 @@ class Clan:
         else:
             disaster = {}
 
-        game.safe_save(
+        game.save_if_changed(
             f"{get_save_dir()}/{clan.name}/disasters/secondary.json", disaster
         )
 
@@ -1127,7 +1136,7 @@ class Clan:
         if not clan.herb_supply:
             return
 
-        game.safe_save(
+        game.save_if_changed(
             f"{get_save_dir()}/{game.clan.name}/herb_supply.json",
             clan.herb_supply.combined_supply_dict
         )
@@ -1177,7 +1186,7 @@ class Clan:
         if clan.game_mode == "classic" or not clan.freshkill_pile:
             return
 
-        game.safe_save(
+        game.save_if_changed(
             f"{get_save_dir()}/{game.clan.name}/freshkill_pile.json",
             clan.freshkill_pile.pile,
         )
@@ -1190,7 +1199,9 @@ class Clan:
                 "percentage": nutr.percentage,
             }
 
-        game.safe_save(f"{get_save_dir()}/{game.clan.name}/nutrition_info.json", data)
+        game.save_if_changed(
+            f"{get_save_dir()}/{game.clan.name}/nutrition_info.json", data
+        )
 
     ## Properties
 
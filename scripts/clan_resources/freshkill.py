@@ -232,11 +232,7 @@ class FreshkillPile:
 
         :return int|float needed_prey: The amount of prey the Clan needs
         """
-        living_cats = [
-            cat
-            for cat in Cat.all_cats.values()
-            if not (cat.dead or cat.outside or cat.exiled)
-        ]
+        living_cats = Cat.membership.select(dead=False, outside=False, exiled=False)
         self._update_needed_food(living_cats)
         return self.needed_prey
 
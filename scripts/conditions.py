@@ -111,7 +111,7 @@ class Illness:
         self.current_mortality = mortality
 
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
-        if medical_cats_condition_fulfilled(game.cat_class.all_cats.values(),
+        if medical_cats_condition_fulfilled(game.cat_class.membership.select(dead=False, outside=False),
                                             amount_per_med):
             self.current_duration = medicine_duration
             self.current_mortality = medicine_mortality
@@ -129,7 +129,7 @@ class Illness:
         TODO: DOCS
         """
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
-        if medical_cats_condition_fulfilled(game.cat_class.all_cats.values(),
+        if medical_cats_condition_fulfilled(game.cat_class.membership.select(dead=False, outside=False),
                                             amount_per_med):
             if value > self.medicine_duration:
                 value = self.medicine_duration
@@ -149,7 +149,7 @@ class Illness:
         TODO: DOCS
         """
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
-        if medical_cats_condition_fulfilled(game.cat_class.all_cats.values(),
+        if medical_cats_condition_fulfilled(game.cat_class.membership.select(dead=False, outside=False),
                                             amount_per_med):
             if value < self.medicine_mortality:
                 value = self.medicine_mortality
@@ -195,7 +195,7 @@ class Injury:
         self.current_mortality = mortality
 
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
-        if medical_cats_condition_fulfilled(game.cat_class.all_cats.values(),
+        if medical_cats_condition_fulfilled(game.cat_class.membership.select(dead=False, outside=False),
                                             amount_per_med):
             self.current_duration = medicine_duration
 
@@ -209,7 +209,7 @@ class Injury:
     @current_duration.setter
     def current_duration(self, value):
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
-        if medical_cats_condition_fulfilled(game.cat_class.all_cats.values(),
+        if medical_cats_condition_fulfilled(game.cat_class.membership.select(dead=False, outside=False),
                                             amount_per_med):
             if value > self.medicine_duration:
                 value = self.medicine_duration
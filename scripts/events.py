@@ -83,9 +83,10 @@ class Events:
         game.patrolled.clear()
         game.just_died.clear()
 
-        if any(
-            str(cat.status)
-            in {
+        if Cat.membership.count(
+            dead=False,
+            outside=False,
+            statuses=[
                 "leader",
                 "deputy",
                 "warrior",
@@ -94,10 +95,7 @@ class Events:
                 "apprentice",
                 "mediator",
                 "mediator apprentice",
-            }
-            and not cat.dead
-            and not cat.outside
-            for cat in Cat.all_cats.values()
+            ],
         ):
             game.switches["no_able_left"] = False
 
@@ -112,13 +110,8 @@ class Events:
             and game.clan.freshkill_pile
         ):
             # feed the cats and update the nutrient status
-            relevant_cats = list(
-                filter(
-                    lambda _cat: _cat.is_alive()
-                    and not _cat.exiled
-                    and not _cat.outside,
-                    Cat.all_cats.values(),
-                )
+            relevant_cats = Cat.membership.select(
+                dead=False, outside=False, exiled=False
             )
             game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
             # get the moonskip freshkill
@@ -135,8 +128,13 @@ class Events:
             self.handle_lost_cats_return()
 
         # Calling of "one_moon" functions.
-        for cat in Cat.all_cats.copy().values():
-            if not cat.outside or cat.dead:
+        # The dead only need to age and fade, so they're handled all at once
+        self.one_moon_dead_cats(Cat.membership.select(dead=True))
+        for cat in Cat.membership.select(dead=False):
+            if cat.dead:
+                # died earlier this moon, before it was their turn
+                self.one_moon_dead_cats([cat])
+            elif not cat.outside:
                 self.one_moon_cat(cat)
             else:
                 self.one_moon_outside_cat(cat)
@@ -188,17 +186,13 @@ class Events:
                 )
 
                 if len(ghost_names) > 2:
-                    alive_cats = list(
-                        filter(
-                            lambda kitty: (
-                                kitty.status != "leader"
-                                and not kitty.dead
-                                and not kitty.outside
-                                and not kitty.exiled
-                            ),
-                            Cat.all_cats.values(),
+                    alive_cats = [
+                        kitty
+                        for kitty in Cat.membership.select(
+                            dead=False, outside=False, exiled=False
                         )
-                    )
+                        if kitty.status != "leader"
+                    ]
                     # finds a percentage of the living Clan to become shaken
 
                     if len(alive_cats) == 0:
@@ -280,18 +274,20 @@ class Events:
         if game.clan.game_mode in ["expanded", "cruel season"]:
             amount_per_med = get_amount_cat_for_one_medic(game.clan)
             med_fulfilled = medical_cats_condition_fulfilled(
-                Cat.all_cats.values(), amount_per_med
+                Cat.membership.select(dead=False, outside=False), amount_per_med
             )
 
             if not med_fulfilled:
                 string = i18n.t("defaults.warn_low_medcats")
                 game.cur_events_list.insert(0, Single_Event(string, "health"))
         else:
-            has_med = any(
-                str(cat.status) in {"medicine cat", "medicine cat apprentice"}
-                and not cat.dead
-                and not cat.outside
-                for cat in Cat.all_cats.values()
+            has_med = (
+                Cat.membership.count(
+                    dead=False,
+                    outside=False,
+                    statuses=["medicine cat", "medicine cat apprentice"],
+                )
+                > 0
             )
             if not has_med:
                 string = i18n.t("defaults.warn_no_medcats")
@@ -308,9 +304,6 @@ class Events:
         if game.sort_type != "id":
             Cat.sort_cats()
 
-        # Clear all the loaded event dicts.
-        GenerateEvents.clear_loaded_events()
-
         # autosave
         if game.clan.clan_settings.get("autosave") and game.clan.age % 5 == 0:
             try:
@@ -554,16 +547,16 @@ class Events:
 
     def get_moon_freshkill(self):
         """Adding auto freshkill for the current moon."""
-        healthy_hunter = list(
-            filter(
-                lambda c: c.status in ["warrior", "apprentice", "leader", "deputy"]
-                and not c.dead
-                and not c.outside
-                and not c.exiled
-                and not c.not_working(),
-                Cat.all_cats.values(),
+        healthy_hunter = [
+            c
+            for c in Cat.membership.select(
+                dead=False,
+                outside=False,
+                exiled=False,
+                statuses=["warrior", "apprentice", "leader", "deputy"],
             )
-        )
+            if not c.not_working()
+        ]
 
         prey_amount = 0
         for cat in healthy_hunter:
@@ -607,31 +600,28 @@ class Events:
             return
         elif game.clan.clan_settings.get("hunting"):
             # handle warrior
-            healthy_warriors = list(
-                filter(
-                    lambda c: c.status in ["warrior", "leader", "deputy"]
-                    and not c.dead
-                    and not c.outside
-                    and not c.exiled
-                    and not c.not_working(),
-                    Cat.all_cats.values(),
+            healthy_warriors = [
+                c
+                for c in Cat.membership.select(
+                    dead=False,
+                    outside=False,
+                    exiled=False,
+                    statuses=["warrior", "leader", "deputy"],
                 )
-            )
+                if not c.not_working()
+            ]
             warrior_amount = (
                 len(healthy_warriors) * game.config["focus"]["hunting"]["warrior"]
             )
 
             # handle apprentices
-            healthy_apprentices = list(
-                filter(
-                    lambda c: c.status == "apprentice"
-                    and not c.dead
-                    and not c.outside
-                    and not c.exiled
-                    and not c.not_working(),
-                    Cat.all_cats.values(),
+            healthy_apprentices = [
+                c
+                for c in Cat.membership.select(
+                    dead=False, outside=False, exiled=False, statuses=["apprentice"]
                 )
-            )
+                if not c.not_working()
+            ]
             app_amount = (
                 len(healthy_apprentices) * game.config["focus"]["hunting"]["apprentice"]
             )
@@ -689,16 +679,16 @@ class Events:
 
             involved_cats = {"injured": [], "sick": []}
             # handle prey
-            healthy_warriors = list(
-                filter(
-                    lambda c: c.status in ["warrior", "leader", "deputy"]
-                    and not c.dead
-                    and not c.outside
-                    and not c.exiled
-                    and not c.not_working(),
-                    Cat.all_cats.values(),
+            healthy_warriors = [
+                c
+                for c in Cat.membership.select(
+                    dead=False,
+                    outside=False,
+                    exiled=False,
+                    statuses=["warrior", "leader", "deputy"],
                 )
-            )
+                if not c.not_working()
+            ]
             warrior_amount = len(healthy_warriors) * info_dict["prey_warrior"]
             game.clan.freshkill_pile.add_freshkill(warrior_amount)
             game.freshkill_event_list.append(
@@ -706,16 +696,13 @@ class Events:
             )
 
             # handle herbs
-            healthy_meds = list(
-                filter(
-                    lambda c: c.status == "medicine cat"
-                    and not c.dead
-                    and not c.outside
-                    and not c.exiled
-                    and not c.not_working(),
-                    Cat.all_cats.values(),
+            healthy_meds = [
+                c
+                for c in Cat.membership.select(
+                    dead=False, outside=False, exiled=False, statuses=["medicine cat"]
                 )
-            )
+                if not c.not_working()
+            ]
 
             herb_focus_text = game.clan.herb_supply.handle_focus(healthy_meds)
 
@@ -802,14 +789,13 @@ class Events:
 
         if not predetermined_cat_IDs:
             eligible_cats = []
-            for cat in Cat.all_cats.values():
-                if cat.outside and cat.ID not in Cat.outside_cats:
+            for cat in Cat.membership.select(outside=True):
+                if cat.ID not in Cat.outside_cats:
                     # The outside-value must be set to True before the cat can go to cotc
                     Cat.outside_cats.update({cat.ID: cat})
 
                 if (
-                    cat.outside
-                    and cat.status
+                    cat.status
                     not in [
                         "kittypet",
                         "loner",
@@ -879,19 +865,40 @@ class Events:
                 elif x.moons > 120:
                     x.status_change("elder")
 
-    def handle_fading(self, cat):
+    def one_moon_dead_cats(self, cats):
         """
-        TODO: DOCS
+        Ages the given dead cats by a moon and fades the ones who have been dead long enough.
+        They don't get a new thought every moon, as hardly any of them are looked at. Instead, they get one
+        the next time their profile is opened.
         """
-        if (
-            game.clan.clan_settings["fading"]
-            and not cat.prevent_fading
-            and cat.ID != game.clan.instructor.ID
-            and not cat.faded
-        ):
-            age_to_fade = game.config["fading"]["age_to_fade"]
-            opacity_at_fade = game.config["fading"]["opacity_at_fade"]
-            fading_speed = game.config["fading"]["visual_fading_speed"]
+        just_died = set(game.just_died)
+        for cat in cats:
+            if cat.ID in just_died:
+                cat.moons += 1
+            else:
+                cat.dead_for += 1
+                cat.thought_pending = True
+        self.handle_fading(cats)
+
+    def handle_fading(self, cats):
+        """
+        Makes the given dead cats more see-through the longer they have been dead, and marks the ones who
+        have been dead for long enough to fade away at the next save.
+        """
+        if not game.clan.clan_settings["fading"]:
+            return
+
+        age_to_fade = game.config["fading"]["age_to_fade"]
+        opacity_at_fade = game.config["fading"]["opacity_at_fade"]
+        fading_speed = game.config["fading"]["visual_fading_speed"]
+        for cat in cats:
+            if (
+                cat.prevent_fading
+                or cat.ID == game.clan.instructor.ID
+                or cat.faded
+            ):
+                continue
+
             # Handle opacity
             cat.pelt.opacity = int(
                 (100 - opacity_at_fade)
@@ -956,7 +963,7 @@ class Events:
     def one_moon_cat(self, cat):
         """
         Triggers various moon events for a cat.
-        -If dead, cat is given thought, dead_for count increased, and fading handled (then function is returned)
+        -If dead, the cat is handled by one_moon_dead_cats (then function is returned)
         -Outbreak chance is handled, death event is attempted, and conditions are handled (if death happens, return)
         -cat.one_moon() is triggered
         -mediator events are triggered (this includes the cat choosing to become a mediator)
@@ -968,12 +975,7 @@ class Events:
         and new cat events
         """
         if cat.dead:
-            cat.thoughts()
-            if cat.ID in game.just_died:
-                cat.moons += 1
-            else:
-                cat.dead_for += 1
-            self.handle_fading(cat)  # Deal with fading.
+            self.one_moon_dead_cats([cat])
             return
 
         # all actions, which do not trigger an event display and
@@ -1278,7 +1280,7 @@ class Events:
 
                     # check if the Clan has sufficient med cats
                     has_med = medical_cats_condition_fulfilled(
-                        Cat.all_cats.values(),
+                        Cat.membership.select(dead=False, outside=False),
                         amount_per_med=get_amount_cat_for_one_medic(game.clan),
                     )
 
@@ -1849,14 +1851,11 @@ class Events:
         """
         chance = 200
 
-        alive_cats = list(
-            filter(
-                lambda kitty: (
-                    kitty.status != "leader" and not kitty.dead and not kitty.outside
-                ),
-                Cat.all_cats.values(),
-            )
-        )
+        alive_cats = [
+            kitty
+            for kitty in Cat.membership.select(dead=False, outside=False)
+            if kitty.status != "leader"
+        ]
 
         clan_size = len(alive_cats)
 
@@ -2014,7 +2013,7 @@ class Events:
 
     def handle_murder(self, cat):
         """Handles murder"""
-        relationships = cat.relationships.values()
+        relationships = cat.relationships.loaded_values()
         targets = []
 
         if cat.age.is_baby():
@@ -2176,23 +2175,19 @@ class Events:
             return
 
         # check how many kitties are already ill
-        already_sick = list(
-            filter(
-                lambda kitty: (not kitty.dead and not kitty.outside and kitty.is_ill()),
-                Cat.all_cats.values(),
-            )
-        )
+        already_sick = [
+            kitty
+            for kitty in Cat.membership.select(dead=False, outside=False)
+            if kitty.is_ill()
+        ]
         already_sick_count = len(already_sick)
 
         # round up the living kitties
-        alive_cats = list(
-            filter(
-                lambda kitty: (
-                    not kitty.dead and not kitty.outside and not kitty.is_ill()
-                ),
-                Cat.all_cats.values(),
-            )
-        )
+        alive_cats = [
+            kitty
+            for kitty in Cat.membership.select(dead=False, outside=False)
+            if not kitty.is_ill()
+        ]
         alive_count = len(alive_cats)
 
         # if large amount of the population is already sick, stop spreading
@@ -2226,15 +2221,8 @@ class Events:
 
                 if illness == "kittencough":
                     # adjust alive cats list to only include kittens
-                    alive_cats = list(
-                        filter(
-                            lambda kitty: (
-                                kitty.status in ["kitten", "newborn"]
-                                and not kitty.dead
-                                and not kitty.outside
-                            ),
-                            Cat.all_cats.values(),
-                        )
+                    alive_cats = Cat.membership.select(
+                        dead=False, outside=False, statuses=["kitten", "newborn"]
                     )
                     alive_count = len(alive_cats)
 
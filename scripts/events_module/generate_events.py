@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: ascii -*-
 import random
+from typing import Dict, List
 
 import i18n
 import ujson
@@ -33,8 +34,81 @@ def get_resource_directory(fallback=False):
 # ---------------------------------------------------------------------------- #
 
 
+class ShortEventCatalogue:
+    """
+    The short events of one type for one biome, biome specific ones first and general ones after.
+    The events are loaded once per language. Which of them fit a cat is mostly decided by things
+    that are the same for many cats (sub_type, location, season, game mode, the age and status of the
+    main cat), so candidates() remembers those results and filter_possible_short_events only has to
+    look at the events that could happen.
+    """
+
+    game_modes = ["classic", "expanded", "cruel_season"]
+
+    def __init__(self, events: List[ShortEvent]):
+        self.events = events
+        self._candidates: Dict[tuple, List[ShortEvent]] = {}
+
+        # formatting mistakes are reported once, when the events are loaded
+        for event in events:
+            if event.history:
+                if (
+                    not isinstance(event.history, list)
+                    or "cats" not in event.history[0]
+                ):
+                    print(f"{event.event_id} history formatted incorrectly")
+            if event.injury:
+                if not isinstance(event.injury, list) or "cats" not in event.injury[0]:
+                    print(f"{event.event_id} injury formatted incorrectly")
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+    def candidates(self, sub_types, cat) -> List[ShortEvent]:
+        """The events which could happen to cat, as far as things that aren't specific to cat go."""
+        age = cat.age.value if cat.age else None
+        key = (
+            frozenset(sub_types),
+            game.clan.biome.lower(),
+            game.clan.camp_bg,
+            game.clan.current_season.lower(),
+            game.clan.game_mode,
+            age,
+            cat.status,
+        )
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = self._candidates[key] = [
+                event
+                for event in self.events
+                if set(event.sub_type) == key[0]
+                and event_for_location(event.location)
+                and event_for_season(event.season)
+                and not any(
+                    mode in event.tags and mode != key[4] for mode in self.game_modes
+                )
+                and (
+                    not event.m_c
+                    or (
+                        _allows(event.m_c.get("age", []), age)
+                        and _allows(event.m_c.get("status", []), cat.status)
+                    )
+                )
+            ]
+        return candidates
+
+
+def _allows(allowed: list, value) -> bool:
+    return not allowed or "any" in allowed or value in allowed
+
+
 class GenerateEvents:
     loaded_events = {}
+    # (language, event type, biome): ShortEventCatalogue
+    short_event_catalogues = {}
 
     INJURY_DISTRIBUTION = None
     with open(
@@ -104,17 +178,21 @@ class GenerateEvents:
 
     @staticmethod
     def clear_loaded_events():
+        """Forget all loaded events, so they are read from their files again the next time they're needed."""
         GenerateEvents.loaded_events = {}
+        GenerateEvents.short_event_catalogues = {}
 
     @staticmethod
     def generate_short_events(event_triggered, biome):
-        file_path = f"{event_triggered}/{biome}.json"
+        file_path = f"{i18n.config.get('locale')}/{event_triggered}/{biome}.json"
 
         try:
             if file_path in GenerateEvents.loaded_events:
                 return GenerateEvents.loaded_events[file_path]
             else:
-                events_dict = GenerateEvents.get_short_event_dicts(file_path)
+                events_dict = GenerateEvents.get_short_event_dicts(
+                    f"{event_triggered}/{biome}.json"
+                )
 
                 event_list = []
                 if not events_dict:
@@ -212,9 +290,7 @@ class GenerateEvents:
                 return event
 
     @staticmethod
-    def possible_short_events(event_type=None):
-        event_list = []
-
+    def possible_short_events(event_type=None) -> ShortEventCatalogue:
         # skip the rest of the loading if there is an unrecognised biome
         if game.clan.biome not in game.clan.BIOME_TYPES:
             print(
@@ -224,13 +300,23 @@ class GenerateEvents:
 
         biome = game.clan.biome.lower()
 
-        # biome specific events
-        event_list.extend(GenerateEvents.generate_short_events(event_type, biome))
+        key = (i18n.config.get("locale"), event_type, biome)
+        catalogue = GenerateEvents.short_event_catalogues.get(key)
+        if catalogue is None:
+            event_list = []
+
+            # biome specific events
+            event_list.extend(GenerateEvents.generate_short_events(event_type, biome))
 
-        # any biome events
-        event_list.extend(GenerateEvents.generate_short_events(event_type, "general"))
+            # any biome events
+            event_list.extend(
+                GenerateEvents.generate_short_events(event_type, "general")
+            )
 
-        return event_list
+            catalogue = ShortEventCatalogue(event_list)
+            GenerateEvents.short_event_catalogues[key] = catalogue
+
+        return catalogue
 
     @staticmethod
     def filter_possible_short_events(
@@ -244,7 +330,6 @@ class GenerateEvents:
         sub_types=None,
     ):
         final_events = []
-        incorrect_format = []
 
         # Chance to bypass the skill or trait requirements.
         trait_skill_bypass = 15
@@ -253,29 +338,10 @@ class GenerateEvents:
         if "war" in sub_types and random.randint(1, 10) == 1:
             sub_types.remove("war")
 
-        for event in possible_events:
-            if event.history:
-                if (
-                    not isinstance(event.history, list)
-                    or "cats" not in event.history[0]
-                ):
-                    if (
-                        f"{event.event_id} history formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} history formatted incorrectly"
-                        )
-            if event.injury:
-                if not isinstance(event.injury, list) or "cats" not in event.injury[0]:
-                    if (
-                        f"{event.event_id} injury formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} injury formatted incorrectly"
-                        )
+        if isinstance(possible_events, ShortEventCatalogue):
+            possible_events = possible_events.candidates(sub_types, cat)
 
+        for event in possible_events:
             # check for event sub_type
             if set(event.sub_type) != set(sub_types):
                 continue
@@ -459,9 +525,6 @@ class GenerateEvents:
 
             final_events.extend([event] * event.weight)
 
-        for notice in incorrect_format:
-            print(notice)
-
         return final_events
 
     @staticmethod
@@ -15,6 +15,11 @@ from scripts.cat.cats import Cat
 from scripts.cat.enums import CatAgeEnum
 from scripts.clan import Clan
 from scripts.game_structure.game_essentials import game
+from scripts.events_module.patrol.patrol_catalogue import (
+    PatrolGroup,
+    generate_patrol_events,
+    get_patrol_group,
+)
 from scripts.events_module.patrol.patrol_event import PatrolEvent
 from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
 from scripts.special_dates import get_special_date, contains_special_date_tag
@@ -27,8 +32,8 @@ from scripts.utility import (
     filter_relationship_type,
     get_special_snippet_list,
     adjust_list_text,
+    adjust_article,
 )
-from scripts.game_structure.localization import load_lang_resource
 
 # ---------------------------------------------------------------------------- #
 #                              PATROL CLASS START                              #
@@ -57,7 +62,7 @@ class Patrol:
         # Holds new cats for easy access
         self.new_cats: List[List[Cat]] = []
 
-        # the patrols
+        # the patrols, as PatrolGroups
         self.HUNTING_SZN = None
         self.HUNTING = None
         self.TRAINING_SZN = None
@@ -121,6 +126,8 @@ class Patrol:
             self.patrol_event = romantic_event_choice
         else:
             self.patrol_event = normal_event_choice
+        # the loaded patrols are shared, and the outcomes remember their stat cat
+        self.patrol_event = deepcopy(self.patrol_event)
 
         Patrol.used_patrols.append(self.patrol_event.patrol_id)
 
@@ -271,7 +278,7 @@ class Patrol:
         biome_dir = f"{biome}/"
         self.update_resources(biome_dir, leaf)
 
-        possible_patrols = []
+        possible_patrols: List[PatrolGroup] = []
         # This is for debugging purposes, load-in *ALL* the possible patrols when debug_override_patrol_stat_requirements is true. (May require longer loading time)
         if game.config["patrol_generation"]["debug_override_patrol_stat_requirements"]:
             leaves = ["greenleaf", "leaf-bare", "leaf-fall", "newleaf", "any"]
@@ -279,47 +286,23 @@ class Patrol:
                 for leaf in leaves:
                     biome_dir = f"{biome.lower()}/"
                     self.update_resources(biome_dir, leaf)
-                    possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_SZN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_GEN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                    )
+                    possible_patrols.append(self.HUNTING)
+                    possible_patrols.append(self.HUNTING_SZN)
+                    possible_patrols.append(self.BORDER)
+                    possible_patrols.append(self.BORDER_SZN)
+                    possible_patrols.append(self.TRAINING)
+                    possible_patrols.append(self.TRAINING_SZN)
+                    possible_patrols.append(self.MEDCAT)
+                    possible_patrols.append(self.MEDCAT_SZN)
+                    possible_patrols.append(self.HUNTING_GEN)
+                    possible_patrols.append(self.BORDER_GEN)
+                    possible_patrols.append(self.TRAINING_GEN)
+                    possible_patrols.append(self.MEDCAT_GEN)
+                    possible_patrols.append(self.DISASTER)
+                    possible_patrols.append(self.NEW_CAT_WELCOMING)
+                    possible_patrols.append(self.NEW_CAT_HOSTILE)
+                    possible_patrols.append(self.OTHER_CLAN_ALLIES)
+                    possible_patrols.append(self.OTHER_CLAN_HOSTILE)
 
         # this next one is needed for Classic specifically
         patrol_type = (
@@ -373,49 +356,41 @@ class Patrol:
             welcoming_rep = True
             chance = welcoming_chance
 
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_GEN))
+        possible_patrols.append(self.HUNTING)
+        possible_patrols.append(self.HUNTING_SZN)
+        possible_patrols.append(self.BORDER)
+        possible_patrols.append(self.BORDER_SZN)
+        possible_patrols.append(self.TRAINING)
+        possible_patrols.append(self.TRAINING_SZN)
+        possible_patrols.append(self.MEDCAT)
+        possible_patrols.append(self.MEDCAT_SZN)
+        possible_patrols.append(self.HUNTING_GEN)
+        possible_patrols.append(self.BORDER_GEN)
+        possible_patrols.append(self.TRAINING_GEN)
+        possible_patrols.append(self.MEDCAT_GEN)
 
         if game_setting_disaster:
             dis_chance = int(random.getrandbits(3))  # disaster patrol chance
             if dis_chance == 1:
-                possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
+                possible_patrols.append(self.DISASTER)
 
         # new cat patrols
         if chance == 1:
             if welcoming_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                )
+                possible_patrols.append(self.NEW_CAT_WELCOMING)
             elif neutral_rep:
-                possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
+                possible_patrols.append(self.NEW_CAT)
             elif hostile_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                )
+                possible_patrols.append(self.NEW_CAT_HOSTILE)
 
         # other Clan patrols
         if other_clan_chance == 1:
             if clan_neutral:
-                possible_patrols.extend(self.generate_patrol_events(self.OTHER_CLAN))
+                possible_patrols.append(self.OTHER_CLAN)
             elif clan_allies:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                )
+                possible_patrols.append(self.OTHER_CLAN_ALLIES)
             elif clan_hostile:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                )
+                possible_patrols.append(self.OTHER_CLAN_HOSTILE)
 
         final_patrols, final_romance_patrols = self.get_filtered_patrols(
             possible_patrols, biome, camp, current_season, patrol_type
@@ -423,7 +398,9 @@ class Patrol:
 
         # This is a debug option, this allows you to remove any constraints of a patrol regarding location, session, biomes, etc.
         if game.config["patrol_generation"]["debug_override_patrol_stat_requirements"]:
-            final_patrols = final_romance_patrols = possible_patrols
+            final_patrols = final_romance_patrols = [
+                patrol for group in possible_patrols for patrol in group
+            ]
             # Logging
             print(
                 "All patrol filters regarding location, session, etc. have been removed."
@@ -544,7 +521,7 @@ class Patrol:
 
     def _filter_patrols(
         self,
-        possible_patrols: List[PatrolEvent],
+        possible_patrols: List[PatrolGroup],
         biome: str,
         camp: str,
         current_season: str,
@@ -559,7 +536,19 @@ class Patrol:
             patrol_type = random.choice(["hunting", "border", "training"])
 
         # makes sure that it grabs patrols in the correct biomes, season, with the correct number of cats
-        for patrol in possible_patrols:
+        candidates = [
+            group.candidates(
+                biome,
+                camp,
+                current_season,
+                patrol_type,
+                self.patrol_statuses,
+                len(self.patrol_cats),
+                game.clan.game_mode,
+            )
+            for group in possible_patrols
+        ]
+        for patrol in (patrol for group in candidates for patrol in group):
             if not self._check_constraints(patrol):
                 continue
 
@@ -577,42 +566,6 @@ class Patrol:
                 if not special_date or special_date.patrol_tag not in patrol.tags:
                     continue
 
-            if not (patrol.min_cats <= len(self.patrol_cats) <= patrol.max_cats):
-                continue
-
-            flag = False
-            for sta, num in patrol.min_max_status.items():
-                if len(num) != 2:
-                    print(f"Issue with status limits: {patrol.patrol_id}")
-                    continue
-
-                if not (num[0] <= self.patrol_statuses.get(sta, -1) <= num[1]):
-                    flag = True
-                    break
-            if flag:
-                continue
-
-            if biome not in patrol.biome and "any" not in patrol.biome:
-                continue
-            if camp not in patrol.camp and "any" not in patrol.camp:
-                continue
-            if current_season not in patrol.season and "any" not in patrol.season:
-                continue
-
-            if "hunting" not in patrol.types and patrol_type == "hunting":
-                continue
-            elif "border" not in patrol.types and patrol_type == "border":
-                continue
-            elif "training" not in patrol.types and patrol_type == "training":
-                continue
-            elif "herb_gathering" not in patrol.types and patrol_type == "med":
-                continue
-
-            # cruel season tag check
-            if "cruel_season" in patrol.tags:
-                if game.clan and game.clan.game_mode != "cruel_season":
-                    continue
-
             if "romantic" in patrol.tags:
                 romantic_patrols.append(patrol)
             else:
@@ -664,44 +617,7 @@ class Patrol:
         return filtered_patrols, romantic_patrols
 
     def generate_patrol_events(self, patrol_dict):
-        all_patrol_events = []
-        for patrol in patrol_dict:
-            patrol_event = PatrolEvent(
-                patrol_id=patrol.get("patrol_id"),
-                biome=patrol.get("biome"),
-                camp=patrol.get("camp"),
-                season=patrol.get("season"),
-                tags=patrol.get("tags"),
-                weight=patrol.get("weight", 20),
-                types=patrol.get("types"),
-                intro_text=patrol.get("intro_text"),
-                patrol_art=patrol.get("patrol_art"),
-                patrol_art_clean=patrol.get("patrol_art_clean"),
-                success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("success_outcomes")
-                ),
-                fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("fail_outcomes"), success=False
-                ),
-                decline_text=patrol.get("decline_text"),
-                chance_of_success=patrol.get("chance_of_success"),
-                min_cats=patrol.get("min_cats", 1),
-                max_cats=patrol.get("max_cats", 6),
-                min_max_status=patrol.get("min_max_status"),
-                antag_success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_success_outcomes"), antagonize=True
-                ),
-                antag_fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_fail_outcomes"), success=False, antagonize=True
-                ),
-                relationship_constraints=patrol.get("relationship_constraint"),
-                pl_skill_constraints=patrol.get("pl_skill_constraint"),
-                pl_trait_constraints=patrol.get("pl_trait_constraints"),
-            )
-
-            all_patrol_events.append(patrol_event)
-
-        return all_patrol_events
+        return generate_patrol_events(patrol_dict)
 
     def determine_outcome(self, antagonize=False) -> Tuple[str, str, Optional[str]]:
         if self.patrol_event is None:
@@ -835,9 +751,7 @@ class Patrol:
         ]
         for patrol_property, location in resources:
             try:
-                setattr(
-                    self, patrol_property, load_lang_resource(f"patrols/{location}")
-                )
+                setattr(self, patrol_property, get_patrol_group(location))
             except:
                 raise Exception("Something went wrong loading patrols!")
 
@@ -943,7 +857,6 @@ class Patrol:
     def process_text(self, text, stat_cat: Optional[Cat]) -> str:
         """Processes text"""
 
-        vowels = ["A", "E", "I", "O", "U"]
         if not text:
             text = "This should not appear, report as a bug please!"
 
@@ -1030,47 +943,11 @@ class Patrol:
         text = adjust_prey_abbr(text)
 
         other_clan_name = self.other_clan.name
-        s = 0
-        for x in range(text.count("o_c_n")):
-            if "o_c_n" in text:
-                for y in vowels:
-                    if str(other_clan_name).startswith(y):
-                        modify = text.split()
-                        pos = 0
-                        if "o_c_n" in modify:
-                            pos = modify.index("o_c_n")
-                        if "o_c_n's" in modify:
-                            pos = modify.index("o_c_n's")
-                        if "o_c_n." in modify:
-                            pos = modify.index("o_c_n.")
-                        if modify[pos - 1] == "a":
-                            modify.remove("a")
-                            modify.insert(pos - 1, "an")
-                        text = " ".join(modify)
-                        break
-
+        text = adjust_article(text, "o_c_n", other_clan_name)
         text = text.replace("o_c_n", str(other_clan_name) + "Clan")
 
         clan_name = game.clan.name
-        s = 0
-        pos = 0
-        for x in range(text.count("c_n")):
-            if "c_n" in text:
-                for y in vowels:
-                    if str(clan_name).startswith(y):
-                        modify = text.split()
-                        if "c_n" in modify:
-                            pos = modify.index("c_n")
-                        if "c_n's" in modify:
-                            pos = modify.index("c_n's")
-                        if "c_n." in modify:
-                            pos = modify.index("c_n.")
-                        if modify[pos - 1] == "a":
-                            modify.remove("a")
-                            modify.insert(pos - 1, "an")
-                        text = " ".join(modify)
-                        break
-
+        text = adjust_article(text, "c_n", clan_name)
         text = text.replace("c_n", str(game.clan.name) + "Clan")
 
         text, senses, list_type, _ = find_special_list_types(text)
@@ -0,0 +1,159 @@
+"""
+Patrols, loaded once per language.
+
+Every patrol file is read and turned into PatrolEvents the first time it's needed, and kept after
+that, so starting a patrol doesn't read and rebuild all of them again. Which patrols of a file fit
+a patrol mostly depends on things that are the same for many patrols (biome, camp, season, patrol
+type, game mode and how many cats of which status go), so each file remembers which of its patrols
+fit those, and the patrol only has to check the rest.
+"""
+
+from typing import Dict, List, Tuple
+
+import i18n
+
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
+from scripts.game_structure.localization import load_lang_resource
+
+# the tag a patrol needs for each patrol type. Other patrol types don't care about tags.
+TYPE_TAGS = {
+    "hunting": "hunting",
+    "border": "border",
+    "training": "training",
+    "med": "herb_gathering",
+}
+
+
+def generate_patrol_events(patrol_dicts: list) -> List[PatrolEvent]:
+    all_patrol_events = []
+    for patrol in patrol_dicts:
+        patrol_event = PatrolEvent(
+            patrol_id=patrol.get("patrol_id"),
+            biome=patrol.get("biome"),
+            camp=patrol.get("camp"),
+            season=patrol.get("season"),
+            tags=patrol.get("tags"),
+            weight=patrol.get("weight", 20),
+            types=patrol.get("types"),
+            intro_text=patrol.get("intro_text"),
+            patrol_art=patrol.get("patrol_art"),
+            patrol_art_clean=patrol.get("patrol_art_clean"),
+            success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("success_outcomes")
+            ),
+            fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("fail_outcomes"), success=False
+            ),
+            decline_text=patrol.get("decline_text"),
+            chance_of_success=patrol.get("chance_of_success"),
+            min_cats=patrol.get("min_cats", 1),
+            max_cats=patrol.get("max_cats", 6),
+            min_max_status=patrol.get("min_max_status"),
+            antag_success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_success_outcomes"), antagonize=True
+            ),
+            antag_fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_fail_outcomes"), success=False, antagonize=True
+            ),
+            relationship_constraints=patrol.get("relationship_constraint"),
+            pl_skill_constraints=patrol.get("pl_skill_constraint"),
+            pl_trait_constraints=patrol.get("pl_trait_constraints"),
+        )
+
+        all_patrol_events.append(patrol_event)
+
+    return all_patrol_events
+
+
+class PatrolGroup:
+    """The patrols of one patrol file. Iterating over it gives all of them, in the order of the file."""
+
+    def __init__(self, patrols: List[PatrolEvent]):
+        self.patrols = patrols
+        self._candidates: Dict[tuple, List[PatrolEvent]] = {}
+
+        for patrol in patrols:
+            if any(len(limits) != 2 for limits in patrol.min_max_status.values()):
+                print(f"Issue with status limits: {patrol.patrol_id}")
+
+    def __iter__(self):
+        return iter(self.patrols)
+
+    def __len__(self):
+        return len(self.patrols)
+
+    def candidates(
+        self,
+        biome: str,
+        camp: str,
+        season: str,
+        patrol_type: str,
+        patrol_statuses: dict,
+        patrol_size: int,
+        game_mode: str,
+    ) -> List[PatrolEvent]:
+        """
+        The patrols which fit the given patrol, as far as things that aren't about the particular cats
+        on it go. Relationship, skill and trait constraints, special dates and used patrols
+        still have to be checked.
+        """
+        key = (
+            biome,
+            camp,
+            season,
+            patrol_type,
+            frozenset(patrol_statuses.items()),
+            patrol_size,
+            game_mode,
+        )
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            candidates = self._candidates[key] = [
+                patrol
+                for patrol in self.patrols
+                if patrol.min_cats <= patrol_size <= patrol.max_cats
+                and _statuses_allowed(patrol, patrol_statuses)
+                and ("any" in patrol.biome or biome in patrol.biome)
+                and ("any" in patrol.camp or camp in patrol.camp)
+                and ("any" in patrol.season or season in patrol.season)
+                and (
+                    patrol_type not in TYPE_TAGS
+                    or TYPE_TAGS[patrol_type] in patrol.types
+                )
+                and ("cruel_season" not in patrol.tags or game_mode == "cruel_season")
+            ]
+        return candidates
+
+
+def _statuses_allowed(patrol: PatrolEvent, patrol_statuses: dict) -> bool:
+    for status, limits in patrol.min_max_status.items():
+        # broken limits are reported when the patrol is loaded, and ignored
+        if len(limits) != 2:
+            continue
+        if not limits[0] <= patrol_statuses.get(status, -1) <= limits[1]:
+            return False
+    return True
+
+
+# (language, patrol file): PatrolGroup
+_groups: Dict[Tuple[str, str], PatrolGroup] = {}
+
+
+def get_patrol_group(location: str) -> PatrolGroup:
+    """
+    The patrols of the given file, for the current language.
+    :param location: The file's path relative to the patrols folder of a language
+    """
+    key = (str(i18n.config.get("locale")), location)
+    group = _groups.get(key)
+    if group is None:
+        group = _groups[key] = PatrolGroup(
+            generate_patrol_events(load_lang_resource(f"patrols/{location}"))
+        )
+    return group
+
+
+def forget_patrols():
+    """Drop all loaded patrols, so their files are read again the next time they're needed."""
+    _groups.clear()
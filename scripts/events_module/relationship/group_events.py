@@ -1,6 +1,5 @@
 import os
-from copy import deepcopy
-from random import choice, shuffle
+from random import choice, sample
 
 import i18n.config
 
@@ -9,7 +8,6 @@ from scripts.cat.history import History
 from scripts.cat_relations.interaction import (
     create_group_interaction,
     GroupInteraction,
-    rel_fulfill_rel_constraints,
 )
 from scripts.event_class import Single_Event
 from scripts.game_structure.game_essentials import game
@@ -20,11 +18,82 @@ from scripts.utility import (
 from scripts.game_structure.localization import load_lang_resource
 
 
+class CatCandidates:
+    """
+    The cats a group interaction can be about, indexed by status, trait and backstory. The cats which fit
+    the constraints of an abbreviation are looked up in the index instead of checking every cat against
+    every interaction.
+    """
+
+    def __init__(self, cats: list):
+        # the IDs in the order of the given cats, so the results don't depend on the order of sets
+        self.order = [cat.ID for cat in cats]
+        self.all_ids = frozenset(self.order)
+        self.cats = cats
+        self.by_status = {}
+        self.by_trait = {}
+        self.by_backstory = {}
+        for cat in cats:
+            self.by_status.setdefault(cat.status, set()).add(cat.ID)
+            self.by_trait.setdefault(cat.personality.trait, set()).add(cat.ID)
+            self.by_backstory.setdefault(cat.backstory, set()).add(cat.ID)
+        # (constraint type, constraint): the IDs of the cats which fulfill it
+        self.checked = {}
+
+    @staticmethod
+    def _from_index(index: dict, values: list) -> set:
+        found = set()
+        for value in values:
+            found |= index.get(value, set())
+        return found
+
+    def _checked(self, kind: str, constraint: list, check) -> set:
+        key = (kind, tuple(constraint))
+        if key not in self.checked:
+            self.checked[key] = {cat.ID for cat in self.cats if check(cat, constraint)}
+        return self.checked[key]
+
+    def fitting(self, interaction: GroupInteraction, abbreviation: str) -> list:
+        """Returns the IDs of the cats which fulfill the constraints of the interaction for the abbreviation."""
+        ids = self.all_ids
+        if abbreviation in interaction.status_constraint:
+            ids = ids & self._from_index(
+                self.by_status, interaction.status_constraint[abbreviation]
+            )
+        if abbreviation in interaction.trait_constraint:
+            ids = ids & self._from_index(
+                self.by_trait, interaction.trait_constraint[abbreviation]
+            )
+        if abbreviation in interaction.backstory_constraint:
+            ids = ids & self._from_index(
+                self.by_backstory, interaction.backstory_constraint[abbreviation]
+            )
+        if abbreviation in interaction.skill_constraint:
+            ids = ids & self._checked(
+                "skill",
+                interaction.skill_constraint[abbreviation],
+                lambda cat, constraint: cat.skills.check_skill_requirement_list(
+                    constraint
+                ),
+            )
+        if abbreviation in interaction.has_injuries:
+            ids = ids & self._checked(
+                "injuries",
+                interaction.has_injuries[abbreviation],
+                lambda cat, constraint: any(inj in constraint for inj in cat.injuries),
+            )
+        if ids is self.all_ids:
+            return list(self.order)
+        return [cat_id for cat_id in self.order if cat_id in ids]
+
+
 class GroupEvents:
     abbreviations_cat_id = {}
-    cat_abbreviations_counter = {}
     chosen_interaction = None
     current_lang = None
+    # how many complete sets of cats are checked against the relationship constraints of an interaction
+    # before it's given up on
+    MAX_CHECKED_CASTS = 20
 
     # ---------------------------------------------------------------------------- #
     #                   build master dictionary for interactions                   #
@@ -98,16 +167,13 @@ class GroupEvents:
             possibilities, biome, season, abbreviations_cat_id
         )
 
-        # get possible interactions, considering the possible interacting cats
-        possibilities = GroupEvents.get_filtered_interactions(
-            possibilities, int(cat_amount), interact_cats, abbreviations_cat_id
+        # choose one interaction, which has cats that fit it
+        chosen_interaction = GroupEvents.choose_interaction(
+            possibilities, interact_cats, abbreviations_cat_id
         )
-
         # if there is no possibility return
-        if len(possibilities) < 1:
+        if not chosen_interaction:
             return []
-        # choose one interaction and
-        chosen_interaction = choice(possibilities)
 
         # TRIGGER ALL NEEDED FUNCTIONS TO REFLECT THE INTERACTION
         GroupEvents.injuring_cats(chosen_interaction, abbreviations_cat_id)
@@ -218,215 +284,82 @@ class GroupEvents:
         return filtered_interactions
 
     @staticmethod
-    def get_filtered_interactions(
-        interactions: list, amount: int, interact_cats: list, abbreviations_cat_id: dict
+    def choose_interaction(
+        interactions: list, interact_cats: list, abbreviations_cat_id: dict
     ):
-        """First assign which cat is which abbreviation, then filtered interaction list based on all constraints, which include the other cats.
+        """Choose one of the interactions at random, from the ones there are cats for.
 
         Parameters
         ----------
         interactions : list
-            the interactions which need to be filtered
-        amount : int
-            the amount of cats which are be needed for these interactions
+            the interactions which are already filtered for the main cat
         interact_cats : list
             a list of cats, which are open to interact with the main cat
+        abbreviations_cat_id : dict
+            dictionary which contains all abbreviation, the cats which are chosen are added to it
 
         Returns
         -------
-        filtered : list
-            a list of interactions, which fulfill the criteria
-
+        chosen : GroupInteraction
+            the chosen interaction, or None if there are no cats for any of them
         """
-        # first handle the abbreviations possibilities for the cats
-        (
-            abbr_per_interaction,
-            cat_abbreviations_counter,
-        ) = GroupEvents.get_abbreviations_possibilities(
-            interactions, int(amount), interact_cats
-        )
-        abbr_per_interaction = GroupEvents.remove_abbreviations_missing_cats(
-            abbr_per_interaction
-        )
-        abbreviations_cat_id = GroupEvents.set_abbreviations_cats(
-            interact_cats, abbreviations_cat_id, cat_abbreviations_counter
-        )
-
-        # check if any abbreviations_cat_ids is None, if so return
-        not_none = [abbr != None for abbr in abbreviations_cat_id.values()]
-        if not all(not_none):
-            return []
-
-        # last filter based on relationships between the cats
-        filtered = []
-        for interact in interactions:
-            # if this interaction is not in the  abbreviations dictionary,
-            # there is no solution for the cat-abbreviations problem and thus, this
-            # interaction is not possible
-            if interact.id not in abbr_per_interaction.keys():
-                continue
-
-            # check how the cats are and if they are fulfill the constraints like: status, trait, skill, ...
-            cat_allow_interaction = GroupEvents.cat_allow_interaction(
-                interact, abbreviations_cat_id
-            )
-            if not cat_allow_interaction:
-                continue
-
-            # now check for relationship constraints
-            relationship_allow_interaction = GroupEvents.relationship_allow_interaction(
-                interact, abbreviations_cat_id
-            )
-            if not relationship_allow_interaction:
-                continue
-
-            filtered.append(interact)
-
-        return filtered
-
-    @staticmethod
-    def get_abbreviations_possibilities(
-        interactions: list, amount: int, interact_cats: list
-    ) -> tuple:
-        """Iterate over all pre-filtered interactions and
-        check which cat fulfills skill/trait/status condition of which abbreviation.
-
-        Parameters
-        ----------
-        interactions : list
-            the interactions which need to be filtered
-        amount : int
-            the amount of cats for the current interaction
-        interact_cats : list
-            a list of cats, which are open to interact with the main cat
-        """
-        cat_abbreviations_counter = {}
-        possibilities = {}
-        # prepare how the base dictionary should look,
-        # this depends on the chosen cat amount -> which abbreviation are needed
-        base_dictionary = {}
-        for integer in range(amount):
-            new_key = "r_c" + str(integer + 1)
-            base_dictionary[new_key] = []
-
-        # iterate over all interactions and checks for each abbreviation, which cat is possible
-        for interact in interactions:
-            dictionary = deepcopy(base_dictionary)
-
-            for abbreviation in dictionary:
-                dictionary[abbreviation] = []
-                status_ids = []
-                skill_ids = []
-                trait_ids = []
-
-                # if the abbreviation has a status constraint, check in details
-                if abbreviation in interact.status_constraint:
-                    # if the cat status is in the status constraint, add the id to the list
-                    status_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if cat.status in interact.status_constraint[abbreviation]
-                    ]
-                else:
-                    # if there is no constraint, add all ids to the list
-                    status_ids = [cat.ID for cat in interact_cats]
-
-                # same as status
-                if abbreviation in interact.skill_constraint:
-                    skill_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if cat.skill in interact.skill_constraint[abbreviation]
-                    ]
-                else:
-                    skill_ids = [cat.ID for cat in interact_cats]
-
-                if abbreviation in interact.trait_constraint:
-                    trait_ids = [
-                        cat.ID
-                        for cat in interact_cats
-                        if cat.personality.trait
-                        in interact.trait_constraint[abbreviation]
-                    ]
-                else:
-                    trait_ids = [cat.ID for cat in interact_cats]
-
-                # only add the id if it is in all other lists
-                for cat_id in [cat.ID for cat in interact_cats]:
-                    if (
-                        cat_id in status_ids
-                        and cat_id in skill_ids
-                        and cat_id in trait_ids
-                    ):
-                        dictionary[abbreviation].append(cat_id)
-
-                        if (
-                            cat_id in cat_abbreviations_counter
-                            and abbreviation in cat_abbreviations_counter[cat_id]
-                        ):
-                            cat_abbreviations_counter[cat_id][abbreviation] += 1
-                        elif (
-                            cat_id in cat_abbreviations_counter
-                            and abbreviation not in cat_abbreviations_counter[cat_id]
-                        ):
-                            cat_abbreviations_counter[cat_id][abbreviation] = 1
-                        else:
-                            cat_abbreviations_counter[cat_id] = {}
-                            cat_abbreviations_counter[cat_id][abbreviation] = 1
-
-            possibilities[interact.id] = dictionary
-        return possibilities, cat_abbreviations_counter
+        candidates = CatCandidates(interact_cats)
+        for interaction in sample(interactions, len(interactions)):
+            if GroupEvents.assign_abbreviations_cats(
+                interaction, candidates, abbreviations_cat_id
+            ):
+                return interaction
+        return None
 
     @staticmethod
-    def remove_abbreviations_missing_cats(abbreviations_per_interaction: dict):
+    def assign_abbreviations_cats(
+        interaction: GroupInteraction,
+        candidates: CatCandidates,
+        abbreviations_cat_id: dict,
+    ) -> bool:
         """
-        Check which combinations of abbreviations are allowed and possible and which are not, only return a dictionary,
-        with possible combinations together with the id for the interaction.
+        Look for a different cat for each abbreviation, so all cats fulfill the constraints of the interaction.
+        The abbreviations with the fewest fitting cats are filled first, trying the cats in random order.
+        The relationship constraints are only checked once every abbreviation has a cat, for up to
+        MAX_CHECKED_CASTS sets of cats.
+        Returns if cats were found, they are set in abbreviations_cat_id.
         """
-        filtered_abbreviations = {}
-        for interaction_id, dictionary in abbreviations_per_interaction.items():
-            # check if there is any abbreviation, which is empty
-            abbr_length = [len(val) for abr, val in dictionary.items()]
-            # if one length is 0 the all function returns false
-            if not all(abbr_length):
-                continue
-
-            filtered_abbreviations[interaction_id] = dictionary
-        return filtered_abbreviations
-
-    @staticmethod
-    def set_abbreviations_cats(
-        interact_cats: list, abbreviations_cat_id: dict, cat_abbreviations_counter: dict
-    ):
-        """Choose which cat is which abbreviations."""
-        free_to_choose = [cat.ID for cat in interact_cats]
-        # shuffle the list to prevent choosing the same cats every time
-        shuffle(free_to_choose)
+        abbreviations = [abbr for abbr in abbreviations_cat_id if abbr != "m_c"]
+        options = {}
+        for abbr in abbreviations:
+            fitting = candidates.fitting(interaction, abbr)
+            if not fitting:
+                return False
+            options[abbr] = sample(fitting, len(fitting))
+        abbreviations.sort(key=lambda abbr: len(options[abbr]))
+
+        chosen = dict(abbreviations_cat_id)
+        used = set()
+        checked_casts = 0
+
+        def assign(index: int) -> bool:
+            nonlocal checked_casts
+            if index == len(abbreviations):
+                checked_casts += 1
+                return GroupEvents.relationship_allow_interaction(interaction, chosen)
+            abbr = abbreviations[index]
+            for cat_id in options[abbr]:
+                if cat_id in used:
+                    continue
+                chosen[abbr] = cat_id
+                used.add(cat_id)
+                if assign(index + 1):
+                    return True
+                used.remove(cat_id)
+                if checked_casts >= GroupEvents.MAX_CHECKED_CASTS:
+                    break
+            return False
 
-        for abbr_key in list(abbreviations_cat_id.keys()):
-            if abbr_key == "m_c":
-                continue
-            highest_value = 0
-            highest_id = None
-
-            # gets the cat id which fits the abbreviations most of the time
-            for cat_id in free_to_choose:
-                # first set some values if there are none
-                if cat_id not in cat_abbreviations_counter:
-                    cat_abbreviations_counter[cat_id] = {}
-                if abbr_key not in cat_abbreviations_counter[cat_id]:
-                    cat_abbreviations_counter[cat_id][abbr_key] = 0
-
-                # find the highest value
-                curr_value = cat_abbreviations_counter[cat_id][abbr_key]
-                if highest_value < curr_value:
-                    highest_value = curr_value
-                    highest_id = cat_id
-
-            abbreviations_cat_id[abbr_key] = highest_id
-            if highest_id in free_to_choose:
-                free_to_choose.remove(highest_id)
-        return abbreviations_cat_id
+        if not assign(0):
+            return False
+        abbreviations_cat_id.update(chosen)
+        GroupEvents.create_missing_relationships(interaction, abbreviations_cat_id)
+        return True
 
     # ---------------------------------------------------------------------------- #
     #                  helper functions for filtering interactions                 #
@@ -436,106 +369,40 @@ class GroupEvents:
     def relationship_allow_interaction(
         interaction: GroupInteraction, abbreviations_cat_id: dict
     ):
-        """Check if the interaction is allowed with the current chosen cats."""
-        fulfilled_list = []
-
-        for name, rel_constraint in interaction.relationship_constraint.items():
+        """
+        Check if the interaction is allowed with the current chosen cats.
+        The values are read without creating the relationships which still have default values, and
+        a missing relationship doesn't stop the interaction, see create_missing_relationships().
+        """
+        for name, rel_constraint in interaction.compiled_constraints.items():
             abbre_from = name.split("_to_")[0]
             abbre_to = name.split("_to_")[1]
 
-            cat_from_id = abbreviations_cat_id[abbre_from]
-            cat_to_id = abbreviations_cat_id[abbre_to]
-            cat_from = Cat.all_cats[cat_from_id]
-            cat_to = Cat.all_cats[cat_to_id]
-
-            if cat_to_id not in cat_from.relationships:
-                cat_from.create_one_relationship(cat_to)
-                if cat_from.ID not in cat_to.relationships:
-                    cat_to.create_one_relationship(cat_from)
+            cat_from = Cat.all_cats[abbreviations_cat_id[abbre_from]]
+            cat_to = Cat.all_cats[abbreviations_cat_id[abbre_to]]
+            if cat_to.ID not in cat_from.relationships:
                 continue
 
-            relationship = cat_from.relationships[cat_to_id]
-
-            fulfilled = rel_fulfill_rel_constraints(
-                relationship, rel_constraint, interaction.id
-            )
-            fulfilled_list.append(fulfilled)
+            if not rel_constraint.fulfilled_by(cat_from, cat_to):
+                return False
 
-        return all(fulfilled_list)
+        return True
 
     @staticmethod
-    def cat_allow_interaction(
+    def create_missing_relationships(
         interaction: GroupInteraction, abbreviations_cat_id: dict
     ):
-        """Check if the assigned cats fulfill the constraints of the interaction."""
-
-        all_fulfilled = True
-        for abbr, constraint in interaction.status_constraint.items():
-            # main cat is already filtered
-            if abbr == "m_c":
-                continue
-            # check if the current abbreviations cat fulfill the constraint
-            relevant_cat = Cat.all_cats[abbreviations_cat_id[abbr]]
-            if relevant_cat.status not in constraint:
-                all_fulfilled = False
-        if not all_fulfilled:
-            return False
-
-        # check if all cats fulfill the skill constraints
-        all_fulfilled = True
-        for abbr, constraint in interaction.skill_constraint.items():
-            # main cat is already filtered
-            if abbr == "m_c":
-                continue
-            # check if the current abbreviations cat fulfill the constraint
-            relevant_cat = Cat.all_cats[abbreviations_cat_id[abbr]]
-            if not relevant_cat.skills.check_skill_requirement_list(constraint):
-                all_fulfilled = False
-        if not all_fulfilled:
-            return False
-
-        # check if all cats fulfill the trait constraints
-        all_fulfilled = True
-        for abbr, constraint in interaction.trait_constraint.items():
-            # main cat is already filtered
-            if abbr == "m_c":
-                continue
-            # check if the current abbreviations cat fulfill the constraint
-            relevant_cat = Cat.all_cats[abbreviations_cat_id[abbr]]
-            if relevant_cat.personality.trait not in constraint:
-                all_fulfilled = False
-        if not all_fulfilled:
-            return False
-
-        # check if all cats fulfill the backstory constraints
-        all_fulfilled = True
-        for abbr, constraint in interaction.backstory_constraint.items():
-            # main cat is already filtered
-            if abbr == "m_c":
-                continue
-            # check if the current abbreviations cat fulfill the constraint
-            relevant_cat = Cat.all_cats[abbreviations_cat_id[abbr]]
-            if relevant_cat.backstory not in constraint:
-                all_fulfilled = False
-        if not all_fulfilled:
-            return False
+        """Create the relationships of the chosen cats which the relationship constraints found missing."""
+        for name in interaction.compiled_constraints:
+            abbre_from = name.split("_to_")[0]
+            abbre_to = name.split("_to_")[1]
 
-        # check if all cats fulfill the injuries constraints
-        all_fulfilled = True
-        for abbr, constraint in interaction.has_injuries.items():
-            # main cat is already filtered
-            if abbr == "m_c":
-                continue
-            # check if the current abbreviations cat fulfill the constraint
-            relevant_cat = Cat.all_cats[abbreviations_cat_id[abbr]]
-            injuries_in_needed = list(
-                filter(lambda inj: inj in constraint, relevant_cat.injuries.keys())
-            )
-            if len(injuries_in_needed) <= 0:
-                all_fulfilled = False
-        if not all_fulfilled:
-            return False
-        return True
+            cat_from = Cat.all_cats[abbreviations_cat_id[abbre_from]]
+            cat_to = Cat.all_cats[abbreviations_cat_id[abbre_to]]
+            if cat_to.ID not in cat_from.relationships:
+                cat_from.create_one_relationship(cat_to)
+                if cat_from.ID not in cat_to.relationships:
+                    cat_to.create_one_relationship(cat_from)
 
     # ---------------------------------------------------------------------------- #
     #                      functions after interaction decision                    #
@@ -58,9 +58,7 @@ class Pregnancy_Events:
     def biggest_family_is_big():
         """Returns if the current biggest family is big enough to 'activates' additional inbreeding counters."""
 
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if not (i.dead or i.outside or i.exiled)]
-        )
+        living_cats = Cat.membership.count(dead=False, outside=False, exiled=False)
         return len(Pregnancy_Events.biggest_family) > (living_cats / 10)
 
     @staticmethod
@@ -407,7 +405,7 @@ class Pregnancy_Events:
                     kit.backstory = "outsider2"
                 if cat.outside and not cat.exiled:
                     kit.backstory = "outsider3"
-                kit.relationships = {}
+                kit.relationships.clear()
                 kit.create_one_relationship(cat)
 
         insert = i18n.t("conditions.pregnancy.kit_amount", count=kits_amount)
@@ -696,15 +694,18 @@ class Pregnancy_Events:
 
             # even it is a random affair, the cats should not hate each other or something like that
             p_affairs = []
-            if len(possible_affair_partners) > 0:
-                for p_affair in possible_affair_partners:
-                    if p_affair.ID in cat.relationships:
-                        p_rel = cat.relationships[p_affair.ID]
-                        if not p_rel.opposite_relationship:
-                            p_rel.link_relationship()
-                        p_rel_opp = p_rel.opposite_relationship
-                        if p_rel.dislike < 20 and p_rel_opp.dislike < 20:
-                            p_affairs.append(p_affair)
+            for p_affair in possible_affair_partners:
+                if p_affair.ID not in cat.relationships:
+                    continue
+                if cat.relationships.value_towards(p_affair.ID, "dislike") >= 20:
+                    continue
+                # a missing relationship back is created with no dislike
+                if (
+                    cat.ID in p_affair.relationships
+                    and p_affair.relationships.value_towards(cat.ID, "dislike") >= 20
+                ):
+                    continue
+                p_affairs.append(p_affair)
             possible_affair_partners = p_affairs
 
             if len(possible_affair_partners) > 0:
@@ -721,7 +722,7 @@ class Pregnancy_Events:
         """
 
         highest_romantic_relation = get_highest_romantic_relation(
-            cat.relationships.values(), exclude_mate=True, potential_mate=True
+            cat.relationships.loaded_values(), exclude_mate=True, potential_mate=True
         )
 
         if mate and highest_romantic_relation:
@@ -1103,9 +1104,7 @@ class Pregnancy_Events:
 
         # CURRENT CAT AMOUNT
         # - increase the inverse chance if the clan is bigger
-        living_cats = len(
-            [i for i in Cat.all_cats.values() if not (i.dead or i.outside or i.exiled)]
-        )
+        living_cats = Cat.membership.count(dead=False, outside=False, exiled=False)
         if living_cats < 10:
             inverse_chance = int(inverse_chance * 0.5)
         elif living_cats > 30:
@@ -5,6 +5,7 @@ from random import choice, randint
 import ujson
 
 from scripts.cat.cats import Cat
+from scripts.cat_relations.constraints import compile_constraint
 from scripts.events_module.relationship.group_events import GroupEvents
 from scripts.events_module.relationship.romantic_events import RomanticEvents
 from scripts.events_module.relationship.welcoming_events import Welcoming_Events
@@ -27,6 +28,10 @@ class Relation_Events:
     types_path = os.path.join(base_path, "group_interactions", "group_types.json")
     with open(types_path, "r", encoding="utf-8") as read_file:
         GROUP_TYPES = ujson.load(read_file)
+    GROUP_CONSTRAINTS = {
+        name: compile_constraint(group.get("constraint"), f"group type {name}")
+        for name, group in GROUP_TYPES.items()
+    }
     del base_path
 
     @staticmethod
@@ -179,11 +184,8 @@ class Relation_Events:
 
         if cat.status == "leader":
             chosen_type = "all"
-        possible_interaction_cats = list(
-            filter(
-                lambda cat: (not cat.dead and not cat.outside and not cat.exiled),
-                Cat.all_cats.values(),
-            )
+        possible_interaction_cats = Cat.membership.select(
+            dead=False, outside=False, exiled=False
         )
         if cat in possible_interaction_cats:
             possible_interaction_cats.remove(cat)
@@ -191,7 +193,7 @@ class Relation_Events:
         if chosen_type != "all":
             possible_interaction_cats = (
                 Relation_Events.cats_with_relationship_constraints(
-                    cat, Relation_Events.GROUP_TYPES[chosen_type]["constraint"]
+                    cat, Relation_Events.GROUP_CONSTRAINTS[chosen_type]
                 )
             )
 
@@ -225,9 +227,7 @@ class Relation_Events:
 
         for new_cat in new_cats:
             same_age_cats = get_cats_same_age(Cat, new_cat)
-            alive_cats = [
-                i for i in new_cat.all_cats.values() if not i.dead and not i.outside
-            ]
+            alive_cats = Cat.membership.select(dead=False, outside=False)
             number = game.config["new_cat"]["cat_amount_welcoming"]
 
             if len(alive_cats) == 0:
@@ -267,13 +267,11 @@ class Relation_Events:
 
     @staticmethod
     def cats_with_relationship_constraints(main_cat, constraint):
-        """Returns a list of cats, where the relationship from main_cat towards the cat fulfill the given constraints."""
-        cat_list = list(
-            filter(
-                lambda cat: (not cat.dead and not cat.outside and not cat.exiled),
-                Cat.all_cats.values(),
-            )
-        )
+        """
+        Returns a list of cats, where the relationship from main_cat towards the cat fulfill the given constraints.
+        :param RelationshipConstraint constraint: The compiled constraint, see compile_constraint()
+        """
+        cat_list = Cat.membership.select(dead=False, outside=False, exiled=False)
         cat_list.remove(main_cat)
         filtered_cat_list = []
 
@@ -284,105 +282,13 @@ class Relation_Events:
             if inter_cat.ID == main_cat.ID:
                 continue
             if cat_to.ID not in cat_from.relationships:
-                cat_from.create_one_relationship(cat_to)
+                cat_from.relationships.add_default(cat_to.ID)
                 if cat_from.ID not in cat_to.relationships:
-                    cat_to.create_one_relationship(cat_from)
-                continue
-
-            relationship = cat_from.relationships[cat_to.ID]
-
-            if "siblings" in constraint and not cat_from.is_sibling(cat_to):
+                    cat_to.relationships.add_default(cat_from.ID)
                 continue
 
-            if "mates" in constraint and not relationship.mates:
-                continue
-
-            if "not_mates" in constraint and relationship.mates:
-                continue
-
-            if "parent/child" in constraint and not cat_from.is_parent(cat_to):
-                continue
-
-            if "child/parent" in constraint and not cat_to.is_parent(cat_from):
-                continue
-
-            value_types = [
-                "romantic",
-                "platonic",
-                "dislike",
-                "admiration",
-                "comfortable",
-                "jealousy",
-                "trust",
-            ]
-            fulfilled = True
-            for v_type in value_types:
-                tags = [i for i in constraint if v_type in i]
-                if len(tags) < 1:
-                    continue
-                threshold = 0
-                lower_than = False
-                # try to extract the value/threshold from the text
-                try:
-                    splitted = tags[0].split("_")
-                    threshold = int(splitted[1])
-                    if len(splitted) > 3:
-                        lower_than = True
-                except:
-                    print(
-                        f"ERROR: while creating a cat group, the relationship constraint for the value {v_type} follows not the formatting guidelines."
-                    )
-                    break
-
-                if threshold > 100:
-                    print(
-                        f"ERROR: while creating a cat group, the relationship constraints for the value {v_type}, which is higher than the max value of a relationship."
-                    )
-                    break
-
-                if threshold <= 0:
-                    print(
-                        f"ERROR: while creating a cat group, the relationship constraints for the value {v_type}, which is lower than the min value of a relationship or 0."
-                    )
-                    break
-
-                threshold_fulfilled = False
-                if v_type == "romantic":
-                    if not lower_than and relationship.romantic_love >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.romantic_love <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "platonic":
-                    if not lower_than and relationship.platonic_like >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.platonic_like <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "dislike":
-                    if not lower_than and relationship.dislike >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.dislike <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "comfortable":
-                    if not lower_than and relationship.comfortable >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.comfortable <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "jealousy":
-                    if not lower_than and relationship.jealousy >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.jealousy <= threshold:
-                        threshold_fulfilled = True
-                if v_type == "trust":
-                    if not lower_than and relationship.trust >= threshold:
-                        threshold_fulfilled = True
-                    elif lower_than and relationship.trust <= threshold:
-                        threshold_fulfilled = True
-
-                if not threshold_fulfilled:
-                    fulfilled = False
-                    continue
-
-            if not fulfilled:
+            # the values are read without creating the relationships which still have default values
+            if not constraint.fulfilled_by(cat_from, cat_to):
                 continue
 
             filtered_cat_list.append(inter_cat)
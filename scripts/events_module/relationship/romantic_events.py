@@ -8,6 +8,7 @@ import i18n
 from scripts.cat.cats import Cat
 from scripts.cat.history import History
 from scripts.cat_relations.relationship import (
+    Relationship,
     rel_fulfill_rel_constraints,
     cats_fulfill_single_interaction_constraints,
 )
@@ -191,7 +192,7 @@ class RomanticEvents:
                 continue
 
             rel_fulfilled = rel_fulfill_rel_constraints(
-                relationship, interaction.relationship_constraint, interaction.id
+                relationship, interaction.compiled_constraint, interaction.id
             )
             if not rel_fulfilled:
                 continue
@@ -223,7 +224,7 @@ class RomanticEvents:
 
         # if the chosen_interaction is still in the TRIGGERED_SINGLE_INTERACTIONS, clean the list
         if chosen_interaction in relationship.used_interaction_ids:
-            relationship.used_interaction_ids = []
+            Relationship.used_interaction_ids = []
         relationship.used_interaction_ids.append(chosen_interaction.id)
 
         # affect relationship - it should always be in a romantic way
@@ -505,7 +506,7 @@ class RomanticEvents:
         """
 
         # get the highest romantic love relationships and
-        rel_list = cat_from.relationships.values()
+        rel_list = cat_from.relationships.loaded_values()
         highest_romantic_relation = get_highest_romantic_relation(
             rel_list, exclude_mate=True
         )
@@ -1086,7 +1086,8 @@ class Condition_Events:
             # adjust chance of risk gain if Clan has enough meds
             chance = risk["chance"]
             if medical_cats_condition_fulfilled(
-                Cat.all_cats.values(), get_amount_cat_for_one_medic(game.clan)
+                Cat.membership.select(dead=False, outside=False),
+                get_amount_cat_for_one_medic(game.clan),
             ):
                 chance += 10  # lower risk if enough meds
             if game.clan.medicine_cat is None and chance != 0:
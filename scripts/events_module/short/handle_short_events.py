@@ -1,4 +1,5 @@
 import random
+from copy import copy
 from typing import List
 
 import i18n
@@ -164,7 +165,8 @@ class HandleShortEvents:
         #                               do the event                                   #
         # ---------------------------------------------------------------------------- #
         try:
-            self.chosen_event = random.choice(final_events)
+            # the events are shared between moons, so changes to the text must not stick
+            self.chosen_event = copy(random.choice(final_events))
             # this print is good for testing, but gets spammy in large clans
             # print(f"CHOSEN: {self.chosen_event.event_id}")
         except IndexError:
@@ -466,11 +468,7 @@ class HandleShortEvents:
         cats that will die are added to self.dead_cats
         """
         # gather living clan cats except leader bc leader lives would be frustrating to handle in these
-        alive_cats = [
-            i
-            for i in Cat.all_cats.values()
-            if not i.dead and not i.outside and not i.exiled
-        ]
+        alive_cats = Cat.membership.select(dead=False, outside=False, exiled=False)
 
         # make sure all cats in the pool fit the event requirements
         requirements = self.chosen_event.m_c
@@ -96,7 +96,7 @@ class Scar_Events:
 
         amount_per_med = get_amount_cat_for_one_medic(game.clan)
         if medical_cats_condition_fulfilled(
-            game.cat_class.all_cats.values(), amount_per_med
+            game.cat_class.membership.select(dead=False, outside=False), amount_per_med
         ):
             chance += 2
 
@@ -0,0 +1,237 @@
+"""
+Single-file save format.
+
+With the "single_file_save" Clan setting on, the cats, relationships, histories, conditions and faded
+cats of a Clan are stored in one SQLite file (clan.db in the Clan's save folder) instead of one JSON
+file per cat and kind of data. A save is written in a single transaction, so it is either written
+completely or not at all, and the disk only has to be synced once. Records which are the same as
+the ones already in the file are skipped, so a save only writes what changed.
+
+Everything else about the Clan (clan.json, events, herbs, ...) is still saved as separate files.
+If clan.db exists, it is where the cats are loaded from, whatever the setting says.
+"""
+
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import ujson
+
+from scripts.game_structure.history_store import get_history_store
+from scripts.game_structure.save_manifest import fingerprint
+from scripts.housekeeping.datadir import get_save_dir
+
+TABLES = ("cats", "relationships", "history", "conditions", "faded_cats")
+
+# the folders the same records are kept in when the single-file save is off,
+# and the suffix of their file names. Cats are kept in clan_cats.json instead,
+# and histories in history/histories.jsonl (see history_store.py).
+FILE_FOLDERS = {
+    "relationships": ("relationships", "_relations.json"),
+    "conditions": ("conditions", "_conditions.json"),
+    "faded_cats": ("faded_cats", ".json"),
+}
+
+
+class ClanDatabase:
+    """
+    One Clan's clan.db. Every table holds JSON records keyed by cat ID.
+    Use get_clan_database() to get one, rather than creating it directly.
+    """
+
+    file_name = "clan.db"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.in_transaction = False
+        # (table, ID): (position, fingerprint) of the records as they are in the file
+        self._saved = {}
+        for table in TABLES:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(id TEXT PRIMARY KEY, position INTEGER, data TEXT NOT NULL)"
+            )
+        self.connection.commit()
+
+    @contextmanager
+    def transaction(self):
+        """All writes inside this block are saved together, or not at all if an error happens."""
+        self.in_transaction = True
+        try:
+            with self.connection:
+                yield self
+        except BaseException:
+            # what was written in this block is gone again
+            self._saved.clear()
+            raise
+        finally:
+            self.in_transaction = False
+
+    def _commit(self):
+        if not self.in_transaction:
+            self.connection.commit()
+
+    def get(self, table: str, record_id: str):
+        """Returns the record with the given ID, or None if there isn't one."""
+        row = self.connection.execute(
+            f"SELECT position, data FROM {table} WHERE id = ?", (record_id,)
+        ).fetchone()
+        if not row:
+            return None
+        self._saved[(table, record_id)] = (row[0], fingerprint(row[1]))
+        return ujson.loads(row[1])
+
+    def iter_records(self, table: str) -> Iterator:
+        """Yields the records of a table one at a time, in the order they were saved."""
+        for _, record in self.iter_items(table):
+            yield record
+
+    def iter_items(self, table: str) -> Iterator[Tuple[str, object]]:
+        """Yields (ID, record) pairs of a table, in the order they were saved."""
+        cursor = self.connection.execute(
+            f"SELECT id, position, data FROM {table} ORDER BY position, rowid"
+        )
+        for record_id, position, data in cursor:
+            self._saved[(table, record_id)] = (position, fingerprint(data))
+            yield record_id, ujson.loads(data)
+
+    def _write(self, table: str, record_id: str, data, position) -> bool:
+        text = ujson.dumps(data)
+        saved = (position, fingerprint(text))
+        if self._saved.get((table, record_id)) == saved:
+            return False
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {table} (id, position, data) VALUES (?, ?, ?)",
+            (record_id, position, text),
+        )
+        self._saved[(table, record_id)] = saved
+        return True
+
+    def put(self, table: str, record_id: str, data, position: int = None):
+        """Save a record. Nothing is written if the record is already saved with the same data."""
+        if self._write(table, record_id, data, position):
+            self._commit()
+
+    def delete(self, table: str, record_id: str):
+        self.connection.execute(f"DELETE FROM {table} WHERE id = ?", (record_id,))
+        self._saved.pop((table, record_id), None)
+        self._commit()
+
+    def delete_all_except(self, table: str, record_ids: Iterable[str]):
+        """Delete every record of a table whose ID isn't one of the given ones."""
+        keep = set(record_ids)
+        stale = [
+            record_id
+            for (record_id,) in self.connection.execute(f"SELECT id FROM {table}")
+            if record_id not in keep
+        ]
+        self.connection.executemany(
+            f"DELETE FROM {table} WHERE id = ?", ((record_id,) for record_id in stale)
+        )
+        for record_id in stale:
+            self._saved.pop((table, record_id), None)
+        self._commit()
+
+    def replace_all(self, table: str, records: Iterable[Tuple[str, object]]):
+        """
+        Replace the whole table with the given (ID, record) pairs, keeping their order.
+        Only the records that are new, changed or moved are written.
+        """
+        record_ids = []
+        for position, (record_id, data) in enumerate(records):
+            self._write(table, record_id, data, position)
+            record_ids.append(record_id)
+        self.delete_all_except(table, record_ids)
+
+    def clear(self, table: str):
+        self.connection.execute(f"DELETE FROM {table}")
+        self._saved = {key: saved for key, saved in self._saved.items() if key[0] != table}
+        self._commit()
+
+    def import_files(self, clan_directory: str):
+        """Copy the records which are only kept on disk (histories and faded cats) into the database."""
+        with self.transaction():
+            for cat_id, data in get_history_store(clan_directory).items():
+                self.put("history", cat_id, data)
+
+            folder, suffix = FILE_FOLDERS["faded_cats"]
+            folder = os.path.join(clan_directory, folder)
+            if not os.path.isdir(folder):
+                return
+            for file_name in os.listdir(folder):
+                if not file_name.endswith(suffix):
+                    continue
+                try:
+                    with open(
+                        os.path.join(folder, file_name), "r", encoding="utf-8"
+                    ) as read_file:
+                        data = ujson.loads(read_file.read())
+                except (OSError, ValueError):
+                    print(f"WARNING: Couldn't copy {file_name} into {self.path}")
+                    continue
+                self.put("faded_cats", file_name[: -len(suffix)], data)
+
+    def export_files(self, clan_directory: str, safe_save):
+        """Write the records which are only kept in the database (histories and faded cats) to disk."""
+        history_store = get_history_store(clan_directory)
+        for record_id, data in self.iter_items("history"):
+            history_store.put(record_id, data)
+        history_store.flush()
+
+        folder, suffix = FILE_FOLDERS["faded_cats"]
+        for record_id, data in self.iter_items("faded_cats"):
+            safe_save(os.path.join(clan_directory, folder, record_id + suffix), data)
+
+    def close(self):
+        self.connection.close()
+
+
+_databases: Dict[str, ClanDatabase] = {}
+
+
+def get_clan_database_path(clanname: str) -> str:
+    return f"{get_save_dir()}/{clanname}/{ClanDatabase.file_name}"
+
+
+def get_clan_database(clanname: str, create=False) -> Optional[ClanDatabase]:
+    """
+    Returns the database of the given Clan. If the Clan doesn't use the single-file save,
+    returns None, unless create is True.
+    """
+    path = get_clan_database_path(clanname)
+    database = _databases.get(path)
+    if database:
+        if os.path.exists(path):
+            return database
+        database.close()
+        del _databases[path]
+
+    if not create and not os.path.exists(path):
+        return None
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    new_database = not os.path.exists(path)
+    database = ClanDatabase(path)
+    if new_database:
+        database.import_files(os.path.dirname(path))
+    _databases[path] = database
+    return database
+
+
+def remove_clan_database(clanname: str):
+    """Close and delete the database of the given Clan, if it has one."""
+    path = get_clan_database_path(clanname)
+    database = _databases.pop(path, None)
+    if database:
+        database.close()
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def close_clan_databases():
+    """Close all open databases, so their files can be moved or deleted."""
+    for database in _databases.values():
+        database.close()
+    _databases.clear()
@@ -0,0 +1,61 @@
+"""
+The events of the Clan, one file per moon.
+
+The events of each moon are saved to events/<moon>.json in the Clan's folder. Saving only writes the
+file of the current moon, and leaves the files of earlier moons alone, so the events of older moons
+are kept, and the events screen reads them with load_moon_events() when they are paged to. saved_moons()
+lists them.
+Clans saved before this have only the events of their last moon, in events.json. That file is read
+if there are no moon files yet, and removed once the first moon file is written.
+"""
+
+import os
+from typing import List
+
+import ujson
+
+from scripts.event_class import Single_Event
+
+EVENTS_FOLDER = "events"
+LEGACY_EVENTS_FILE = "events.json"
+
+
+def get_moon_path(clan_directory: str, moon: int) -> str:
+    return os.path.join(clan_directory, EVENTS_FOLDER, f"{moon}.json")
+
+
+def saved_moons(clan_directory: str) -> List[int]:
+    """Returns the moons whose events are saved, oldest first."""
+    folder = os.path.join(clan_directory, EVENTS_FOLDER)
+    if not os.path.isdir(folder):
+        return []
+    moons = []
+    for file_name in os.listdir(folder):
+        name, extension = os.path.splitext(file_name)
+        if extension == ".json" and name.isdigit():
+            moons.append(int(name))
+    return sorted(moons)
+
+
+def load_moon_events(clan_directory: str, moon: int, cat_class) -> List[Single_Event]:
+    """
+    Returns the saved events of the given moon.
+    :param clan_directory: The Clan's save folder
+    :param moon: The Clan's age at that moon. If there are no moon files, the events of events.json are
+        returned for any moon.
+    :param cat_class: The Cat class, to look up the cats of the events
+    """
+    path = get_moon_path(clan_directory, moon)
+    if not os.path.exists(path):
+        path = os.path.join(clan_directory, LEGACY_EVENTS_FILE)
+        if saved_moons(clan_directory) or not os.path.exists(path):
+            return []
+
+    with open(path, "r", encoding="utf-8") as read_file:
+        events_list = ujson.loads(read_file.read())
+    events = []
+    for event_dict in events_list:
+        event_obj = Single_Event.from_dict(event_dict, cat_class)
+        if event_obj:
+            events.append(event_obj)
+    return events
@@ -6,7 +6,20 @@ from shutil import move as shutil_move
 import pygame
 import ujson
 
+from scripts.cat_relations.log_archive import remove_archives_except
 from scripts.event_class import Single_Event
+from scripts.game_structure.clan_database import (
+    get_clan_database,
+    remove_clan_database,
+)
+from scripts.game_structure.event_journal import (
+    LEGACY_EVENTS_FILE,
+    get_moon_path,
+    load_moon_events,
+    saved_moons,
+)
+from scripts.game_structure.history_store import get_history_store, release_histories
+from scripts.game_structure.save_manifest import get_save_manifest
 from scripts.game_structure.screen_settings import toggle_fullscreen
 from scripts.housekeeping.datadir import get_save_dir, get_temp_dir
 
@@ -27,6 +40,7 @@ class Game:
     just_died = []  # keeps track of which cats died this moon via die()
 
     cur_events_list = []
+    saved_events = None  # (cur_events_list, (Clan, moon, number of events)) at the last save_events()
     ceremony_events_list = []
     birth_death_events_list = []
     relation_events_list = []
@@ -230,6 +244,7 @@ class Game:
             if not file_name:
                 raise RuntimeError(f"Safe_Save: No file name was found in {path}")
 
+            os.makedirs(get_temp_dir(), exist_ok=True)
             temp_file_path = get_temp_dir() + "/" + file_name + ".tmp"
             i = 0
             while True:
@@ -268,6 +283,42 @@ class Game:
                 write_file.flush()
                 os.fsync(write_file.fileno())
 
+    def save_if_changed(self, path: str, write_data) -> bool:
+        """Like safe_save, but leaves the file alone if the last save already wrote the same data to it.
+        Only works this way for files inside a Clan's folder, other files are always written.
+        Call write_save_manifest() once everything is saved.
+
+        :return: Whether the file was written
+        """
+        if type(write_data) is not str:
+            write_data = ujson.dumps(write_data, indent=4)
+
+        clanname = os.path.relpath(path, get_save_dir()).replace(os.sep, "/").split("/")[0]
+        manifest = get_save_manifest(clanname)
+        if manifest and manifest.is_unchanged(path, write_data):
+            return False
+
+        self.safe_save(path, write_data)
+        if manifest:
+            manifest.record(path, write_data)
+        return True
+
+    @staticmethod
+    def remove_save_file(path: str, clanname: str):
+        """Delete a file from a Clan's folder, if it exists."""
+        if os.path.exists(path):
+            os.remove(path)
+        manifest = get_save_manifest(clanname)
+        if manifest:
+            manifest.forget(path)
+
+    def write_save_manifest(self, clanname: str):
+        """Record which files the save that just finished consists of. See save_manifest.py."""
+        manifest = get_save_manifest(clanname)
+        if manifest and manifest.changed:
+            self.safe_save(manifest.path, manifest.to_text(), check_integrity=True)
+            manifest.changed = False
+
     def read_clans(self):
         """with open(get_save_dir() + '/clanlist.txt', 'r') as read_file:
             clan_list = read_file.read()
@@ -406,33 +457,91 @@ class Game:
         if not os.path.exists(directory):
             os.makedirs(directory)
 
-        # Delete all existing relationship files
+        if game.clan is not None and game.clan.clan_settings["single_file_save"]:
+            self.save_cats_to_database(clanname)
+            return
+
+        database = get_clan_database(clanname)
+        if database:
+            # the single-file save was switched off, so move what only the database holds back into files
+            database.export_files(directory, self.safe_save)
+            remove_clan_database(clanname)
+
         if not os.path.exists(directory + "/relationships"):
             os.makedirs(directory + "/relationships")
-        for f in os.listdir(directory + "/relationships"):
-            os.remove(os.path.join(directory + "/relationships", f))
 
         self.save_faded_cats(clanname)  # Fades cat and saves them, if needed
 
+        # only files whose contents changed since the last save are written
         clan_cats = []
+        relationship_files = set()
+        living_cats = []
+        history_store = get_history_store(directory)
         for inter_cat in self.cat_class.all_cats.values():
             cat_data = inter_cat.get_save_dict()
             clan_cats.append(cat_data)
 
             inter_cat.save_condition()
 
-            if inter_cat.history:
-                inter_cat.save_history(directory + "/history")
-                # after saving, dump the history info
-                inter_cat.history = None
+            if inter_cat.history_loaded:
+                inter_cat.save_history(history_store)
             if not inter_cat.dead:
                 inter_cat.save_relationship_of_cat(directory + "/relationships")
+                relationship_files.add(f"{inter_cat.ID}_relations.json")
+                living_cats.append(inter_cat.ID)
+
+        # only living cats keep their relationships
+        for f in os.listdir(directory + "/relationships"):
+            if f not in relationship_files:
+                self.remove_save_file(
+                    os.path.join(directory + "/relationships", f), clanname
+                )
+        remove_archives_except(directory, living_cats)
+        # the histories of older saves are in histories.jsonl now
+        for path in history_store.flush():
+            self.remove_save_file(path, clanname)
+
+        self.save_if_changed(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
+        self.write_save_manifest(clanname)
+        # the histories are saved, so the ones that weren't used lately can be unloaded
+        release_histories(self.cat_class.all_cats)
+
+    def save_cats_to_database(self, clanname):
+        """Save the cat data into the Clan's single-file save, in one transaction."""
+        directory = get_save_dir() + "/" + clanname
+        database = get_clan_database(clanname, create=True)
+
+        with database.transaction():
+            self.save_faded_cats(clanname, database)
 
-        self.safe_save(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
+            # the database skips records which didn't change since the last save
+            clan_cats = []
+            living_cats = []
+            for inter_cat in self.cat_class.all_cats.values():
+                clan_cats.append((inter_cat.ID, inter_cat.get_save_dict()))
 
-    def save_faded_cats(self, clanname):
-        """Deals with fades cats, if needed, adding them as faded"""
-        if game.cat_to_fade:
+                inter_cat.save_condition(database)
+
+                if inter_cat.history_loaded:
+                    inter_cat.save_history(None, database)
+                if not inter_cat.dead:
+                    inter_cat.save_relationship_of_cat(
+                        directory + "/relationships", database
+                    )
+                    living_cats.append(inter_cat.ID)
+
+            # only living cats keep their relationships
+            database.delete_all_except("relationships", living_cats)
+            remove_archives_except(directory, living_cats)
+            database.replace_all("cats", clan_cats)
+        release_histories(self.cat_class.all_cats)
+
+    def save_faded_cats(self, clanname, database=None):
+        """Deals with fades cats, if needed, adding them as faded
+
+        :param database: The Clan's single-file save, if it uses one
+        """
+        if game.cat_to_fade and not database:
             directory = get_save_dir() + "/" + clanname + "/faded_cats"
             if not os.path.exists(directory):
                 os.makedirs(directory)
@@ -469,9 +578,12 @@ class Game:
             # SAVE TO IT'S OWN LITTLE FILE. This is a trimmed-down version for relation keeping only.
             cat_data = inter_cat.get_save_dict(faded=True)
 
-            self.safe_save(
-                f"{get_save_dir()}/{clanname}/faded_cats/{cat}.json", cat_data
-            )
+            if database:
+                database.put("faded_cats", cat, cat_data)
+            else:
+                self.safe_save(
+                    f"{get_save_dir()}/{clanname}/faded_cats/{cat}.json", cat_data
+                )
 
             # Remove the cat from the active cats lists
             self.clan.remove_cat(cat)
@@ -508,17 +620,49 @@ class Game:
 
     def save_events(self):
         """
-        Save current events list to events.json
+        Save the events of the current moon, see event_journal.py
         """
-        events_list = []
-        for event in game.cur_events_list:
-            events_list.append(event.to_dict())
-        game.safe_save(f"{get_save_dir()}/{game.clan.name}/events.json", events_list)
+        clanname = game.clan.name
+        clan_directory = f"{get_save_dir()}/{clanname}"
+        moon = game.clan.age
+
+        # during a moon, events are only added, so if it's the same list and it didn't grow, it's saved already
+        events_state = (clanname, moon, len(game.cur_events_list))
+        if (
+            self.saved_events
+            and self.saved_events[0] is game.cur_events_list
+            and self.saved_events[1] == events_state
+        ):
+            return
+
+        os.makedirs(os.path.dirname(get_moon_path(clan_directory, moon)), exist_ok=True)
+        self.save_if_changed(
+            get_moon_path(clan_directory, moon),
+            [event.to_dict() for event in game.cur_events_list],
+        )
+        # later moons are left over from a save that was played further and then went back
+        for saved_moon in saved_moons(clan_directory):
+            if saved_moon > moon:
+                self.remove_save_file(get_moon_path(clan_directory, saved_moon), clanname)
+        self.remove_save_file(f"{clan_directory}/{LEGACY_EVENTS_FILE}", clanname)
+        self.write_save_manifest(clanname)
+
+        self.saved_events = (game.cur_events_list, events_state)
 
     def add_faded_offspring_to_faded_cat(self, parent, offspring):
         """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
         both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file.
         """
+        database = get_clan_database(self.clan.name)
+        if database:
+            cat_info = database.get("faded_cats", parent)
+            if cat_info is None:
+                print("ERROR: loading faded cat")
+                return False
+            cat_info["faded_offspring"].append(offspring)
+            database.put("faded_cats", parent, cat_info)
+            return True
+
         try:
             with open(
                 get_save_dir()
@@ -545,21 +689,13 @@ class Game:
 
     def load_events(self):
         """
-        Load events from events.json and place into game.cur_events_list.
+        Load the events of the current moon and place them into game.cur_events_list.
         """
-
-        clanname = self.clan.name
-        events_path = f"{get_save_dir()}/{clanname}/events.json"
-        events_list = []
-        try:
-            with open(events_path, "r", encoding="utf-8") as f:
-                events_list = ujson.loads(f.read())
-            for event_dict in events_list:
-                event_obj = Single_Event.from_dict(event_dict, game.cat_class)
-                if event_obj:
-                    game.cur_events_list.append(event_obj)
-        except FileNotFoundError:
-            pass
+        game.cur_events_list.extend(
+            load_moon_events(
+                f"{get_save_dir()}/{self.clan.name}", self.clan.age, game.cat_class
+            )
+        )
 
     def get_config_value(self, *args):
         """Fetches a value from the self.config dictionary. Pass each key as a
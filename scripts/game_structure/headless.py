@@ -0,0 +1,457 @@
+"""
+Headless moon-skip simulation.
+
+Runs Events.one_moon without a display, either on an existing save or on a freshly generated Clan,
+and reports moons per second, the time spent in each subsystem and the peak resident memory.
+
+Run it from the root of the repository:
+
+    python -m scripts.game_structure.headless --cats 60 --moons 50 --seed 1
+    python -m scripts.game_structure.headless --clan MyClan --moons 20
+
+With --memory, the memory the Clan takes up is traced as well, and reported per cat and per
+relationship once the Clan is set up and again after the moons. Tracing makes the moons a lot slower.
+To see how large Clans fit into memory:
+
+    python -m scripts.game_structure.headless --cats 2000 --moons 0 --memory
+
+Generated Clans live in a temporary data directory which is removed afterwards (unless
+CLANGEN_DATA_DIR is set), also when HeadlessSimulation is used from other code. Loaded saves are
+never written to, since autosave is switched off for the duration of the run.
+Set PYTHONHASHSEED as well as --seed if you need runs to be identical across processes.
+"""
+
+import argparse
+import atexit
+import inspect
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# the (owner, attribute name) pairs that make up each subsystem. Owners are given as
+# (module, class name) so that nothing from the game is imported before the data directory is set.
+SUBSYSTEMS: Dict[str, List[Tuple[str, str, str]]] = {
+    "freshkill": [
+        ("scripts.clan_resources.freshkill", "FreshkillPile", "time_skip"),
+        ("scripts.events", "Events", "get_moon_freshkill"),
+        ("scripts.events_module.short.condition_events", "Condition_Events", "handle_nutrient"),
+    ],
+    "herbs": [
+        ("scripts.clan_resources.herb.herb_supply", "HerbSupply", "handle_moon"),
+    ],
+    "relationships": [
+        ("scripts.cat.cats", "Cat", "relationship_interaction"),
+        ("scripts.events_module.relationship.relation_events", "Relation_Events", "handle_relationships"),
+    ],
+    "conditions": [
+        ("scripts.events_module.short.condition_events", "Condition_Events", "handle_injuries"),
+        ("scripts.events_module.short.condition_events", "Condition_Events", "handle_illnesses"),
+        ("scripts.events_module.short.condition_events", "Condition_Events", "handle_already_disabled"),
+        ("scripts.events", "Events", "handle_outbreaks"),
+    ],
+    "thoughts": [
+        ("scripts.cat.cats", "Cat", "thoughts"),
+    ],
+    "events": [
+        ("scripts.events_module.short.handle_short_events", "HandleShortEvents", "handle_event"),
+        ("scripts.events", "Events", "perform_ceremonies"),
+        ("scripts.events", "Events", "handle_murder"),
+        ("scripts.events_module.relationship.pregnancy_events", "Pregnancy_Events", "handle_having_kits"),
+    ],
+}
+
+
+class SubsystemTimer:
+    """
+    Attributes wall time to named subsystems by temporarily wrapping the functions that implement them.
+    Time is exclusive: while a nested subsystem runs, the time of the outer one is paused, so the totals
+    never add up to more than the time that was actually spent.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self._stack: List[List] = []
+        self._patched: List[Tuple[object, str, object]] = []
+
+    def start(self, subsystem: str):
+        now = self.clock()
+        if self._stack:
+            outer = self._stack[-1]
+            self.totals[outer[0]] += now - outer[1]
+        self._stack.append([subsystem, now])
+        self.calls[subsystem] += 1
+
+    def stop(self):
+        now = self.clock()
+        subsystem, started = self._stack.pop()
+        self.totals[subsystem] += now - started
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def wrap(self, owner, attr: str, subsystem: str):
+        """Replace owner.attr with a timed version. Keeps staticmethods and classmethods intact."""
+        original = inspect.getattr_static(owner, attr)
+        if isinstance(original, (staticmethod, classmethod)):
+            func = original.__func__
+        else:
+            func = original
+
+        timer = self
+
+        def timed(*args, **kwargs):
+            timer.start(subsystem)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.stop()
+
+        if isinstance(original, staticmethod):
+            replacement = staticmethod(timed)
+        elif isinstance(original, classmethod):
+            replacement = classmethod(timed)
+        else:
+            replacement = timed
+
+        self._patched.append((owner, attr, original))
+        setattr(owner, attr, replacement)
+
+    def restore(self):
+        """Put back every function that was wrapped."""
+        while self._patched:
+            owner, attr, original = self._patched.pop()
+            setattr(owner, attr, original)
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Returns the peak resident set size of this process in bytes, or None where it can't be measured."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, everything else reports kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class HeadlessSimulation:
+    """
+    Sets up a Clan without a display and skips moons on it.
+    Create the Clan with either load_save() or generate_clan(), then call run(), and close() once done.
+    """
+
+    def __init__(self, seed: Optional[int] = None, temp_data_dir: bool = True):
+        """
+        :param seed: Seed for random
+        :param temp_data_dir: Whether to keep everything the game writes (settings, the generated Clan)
+            in a temporary data directory, which close() removes again. Pass False to load a save from
+            the game's data directory. Ignored if CLANGEN_DATA_DIR is set.
+        """
+        self.seed = seed
+        self.temp_dir = None
+        self._data_dir = None
+        if temp_data_dir:
+            self.use_temp_dir()
+        if seed is not None:
+            random.seed(seed)
+
+        from scripts.cat.sprites import sprites
+        from scripts.events import events_class
+
+        sprites.load_all()
+        self.events = events_class
+
+    def load_save(self, clan_name: str):
+        """Load an existing save, the same way the game does at startup."""
+        if self.temp_dir:
+            raise ValueError(
+                "Saves can't be loaded from a temporary data directory, pass temp_data_dir=False"
+            )
+        from scripts.clan import clan_class
+        from scripts.game_structure.game_essentials import game
+        from scripts.game_structure.load_cat import load_cats, version_convert
+
+        game.switches["clan_list"] = [clan_name]
+        load_cats()
+        version_info = clan_class.load_clan()
+        version_convert(version_info)
+
+    def generate_clan(
+        self,
+        size: int = 12,
+        biome: str = "Forest",
+        game_mode: str = "expanded",
+        season: str = "Newleaf",
+        name: str = "Headless",
+    ):
+        """
+        Generate a new Clan with size starting members, the same way the Clan creation screen does.
+        Creating a Clan writes its save, so it's always written to a temporary data directory (unless
+        CLANGEN_DATA_DIR is set), never to the game's own.
+        """
+        self.use_temp_dir()
+
+        from scripts.cat.cats import Cat, create_cat
+        from scripts.clan import Clan
+        from scripts.game_structure.game_essentials import game
+
+        leader = create_cat(status="warrior")
+        deputy = create_cat(status="warrior")
+        medicine_cat = create_cat(status="medicine cat")
+        members = [leader, deputy, medicine_cat]
+        for _ in range(max(size - len(members), 0)):
+            members.append(
+                create_cat(
+                    status=random.choice(
+                        ["kitten", "apprentice", "warrior", "warrior", "elder"]
+                    )
+                )
+            )
+
+        game.switches["game_mode"] = game_mode
+        game.switches["camp_bg"] = "camp1"
+        game.clan = Clan(
+            name=name,
+            leader=leader,
+            deputy=deputy,
+            medicine_cat=medicine_cat,
+            biome=biome,
+            camp_bg="camp1",
+            game_mode=game_mode,
+            starting_members=members[3:],
+            starting_season=season,
+        )
+        game.clan.create_clan()
+        game.cur_events_list.clear()
+        game.herb_events_list.clear()
+        game.clan.herb_supply.start_storage(len(members))
+        game.clan.save_herb_supply(game.clan)
+        Cat.grief_strings.clear()
+        Cat.sort_cats()
+        # the herb supply is only fully set up once a Clan is loaded, so do what loading would
+        game.clan.load_herb_supply(game.clan)
+
+    def use_temp_dir(self):
+        """Point the data directory at a new temporary directory until close() is called."""
+        if self.temp_dir or os.environ.get("CLANGEN_DATA_DIR"):
+            return
+        self._data_dir = os.environ.get("CLANGEN_DATA_DIR")
+        self.temp_dir = tempfile.mkdtemp(prefix="clangen_headless_")
+        os.environ["CLANGEN_DATA_DIR"] = self.temp_dir
+        atexit.register(self.close)
+
+    def close(self):
+        """Remove the temporary data directory, if there is one."""
+        if not self.temp_dir:
+            return
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        if self._data_dir is None:
+            os.environ.pop("CLANGEN_DATA_DIR", None)
+        else:
+            os.environ["CLANGEN_DATA_DIR"] = self._data_dir
+        self.temp_dir = None
+        atexit.unregister(self.close)
+
+    def run(self, moons: int, timed: bool = True) -> dict:
+        """
+        Skip the given number of moons and return a report of how long it took.
+        :param moons: How many moons to skip
+        :param timed: Whether to break the time down by subsystem
+        """
+        from scripts.cat.cats import Cat
+        from scripts.cat.sprites import sprites
+        from scripts.game_structure.game_essentials import game
+        from scripts.utility import get_living_clan_cat_count
+
+        # never write to the save that is being measured
+        game.clan.clan_settings["autosave"] = False
+
+        timer = SubsystemTimer()
+        if timed:
+            import importlib
+
+            for subsystem, targets in SUBSYSTEMS.items():
+                for module_name, class_name, attr in targets:
+                    owner = getattr(importlib.import_module(module_name), class_name)
+                    timer.wrap(owner, attr, subsystem)
+
+        start_cats = len(Cat.all_cats)
+        start_living = get_living_clan_cat_count(Cat)
+        moon_times = []
+        try:
+            for _ in range(moons):
+                started = time.perf_counter()
+                self.events.one_moon()
+                moon_times.append(time.perf_counter() - started)
+        finally:
+            timer.restore()
+
+        total = sum(moon_times)
+        subsystems = dict(timer.totals)
+        subsystems["other"] = max(total - sum(subsystems.values()), 0.0)
+
+        return {
+            "seed": self.seed,
+            "moons": moons,
+            "total_seconds": total,
+            "moons_per_second": moons / total if total else 0.0,
+            "slowest_moon_seconds": max(moon_times) if moon_times else 0.0,
+            "subsystem_seconds": subsystems,
+            "subsystem_calls": dict(timer.calls),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "sprites": sprites.memory_report(),
+            "cats_before": start_cats,
+            "cats_after": len(Cat.all_cats),
+            "living_before": start_living,
+            "living_after": get_living_clan_cat_count(Cat),
+        }
+
+
+def measure_memory(baseline: int = 0) -> dict:
+    """
+    Measure the memory taken up by the Clan. tracemalloc has to be tracing.
+    :param baseline: The traced memory before the Clan was set up
+    """
+    from scripts.cat.cats import Cat
+    from scripts.cat_relations.relationship import Relationship
+
+    cats = list(Cat.all_cats.values())
+    clan_bytes = tracemalloc.get_traced_memory()[0] - baseline
+
+    # what each further relationship costs
+    relationship_bytes = 0
+    if cats:
+        before = tracemalloc.get_traced_memory()[0]
+        sample = [Relationship(cats[0], cats[-1]) for _ in range(1000)]
+        relationship_bytes = (tracemalloc.get_traced_memory()[0] - before) / len(sample)
+        del sample
+
+    return {
+        "cats": len(cats),
+        "relationships": sum(len(cat.relationships) for cat in cats),
+        "loaded_relationships": sum(
+            len(cat.relationships.loaded_values()) for cat in cats
+        ),
+        "clan_bytes": clan_bytes,
+        "bytes_per_cat": clan_bytes / len(cats) if cats else 0,
+        "bytes_per_relationship": relationship_bytes,
+    }
+
+
+def format_memory(report: dict) -> str:
+    """Turns a report from measure_memory() into readable text."""
+    return (
+        f"Memory: {report['clan_bytes'] / 1024 ** 2:.1f} MiB for {report['cats']} cats "
+        f"({report['bytes_per_cat'] / 1024:.1f} KiB per cat), "
+        f"{report['relationships']} relationships of which {report['loaded_relationships']} are loaded "
+        f"({report['bytes_per_relationship']:.0f} bytes per loaded relationship)"
+    )
+
+
+def format_report(report: dict) -> str:
+    """Turns a report from HeadlessSimulation.run() into readable text."""
+    lines = [
+        f"Skipped {report['moons']} moons in {report['total_seconds']:.2f}s "
+        f"({report['moons_per_second']:.2f} moons/sec, slowest moon {report['slowest_moon_seconds']:.2f}s)",
+        f"Cats: {report['cats_before']} -> {report['cats_after']} "
+        f"(living in Clan: {report['living_before']} -> {report['living_after']})",
+    ]
+    total = report["total_seconds"] or 1
+    for subsystem, seconds in sorted(
+        report["subsystem_seconds"].items(), key=lambda x: x[1], reverse=True
+    ):
+        calls = report["subsystem_calls"].get(subsystem)
+        lines.append(
+            f"  {subsystem:<14}{seconds:>9.3f}s {seconds / total:>7.1%}"
+            + (f"  ({calls} calls)" if calls else "")
+        )
+    sprite_report = report.get("sprites")
+    if sprite_report:
+        lines.append(
+            f"Sprites: {sprite_report['sprites_cut_out']}/{sprite_report['sprites']} cut out, "
+            f"{sprite_report['spritesheets_loaded']}/{sprite_report['spritesheets']} spritesheets loaded "
+            f"({sprite_report['spritesheet_bytes'] / 1024 ** 2:.1f} MiB), "
+            f"{sprite_report['cat_sprites']} cat sprites cached "
+            f"({sprite_report['cat_sprite_bytes'] / 1024 ** 2:.1f} MiB)"
+        )
+    if report["peak_rss_bytes"] is not None:
+        lines.append(f"Peak RSS: {report['peak_rss_bytes'] / 1024 ** 2:.1f} MiB")
+    else:
+        lines.append("Peak RSS: not available on this platform")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Skip moons without a display and report how long they took."
+    )
+    parser.add_argument(
+        "--clan", help="name of an existing save to load, instead of generating a Clan"
+    )
+    parser.add_argument(
+        "--cats", type=int, default=12, help="starting members of a generated Clan"
+    )
+    parser.add_argument("--moons", type=int, default=10, help="moons to skip")
+    parser.add_argument("--seed", type=int, default=None, help="seed for random")
+    parser.add_argument("--biome", default="Forest")
+    parser.add_argument(
+        "--game-mode", default="expanded", choices=["classic", "expanded", "cruel season"]
+    )
+    parser.add_argument(
+        "--no-subsystems",
+        action="store_true",
+        help="don't break the time down by subsystem",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report the memory taken up per cat and per relationship",
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    simulation = HeadlessSimulation(seed=args.seed, temp_data_dir=not args.clan)
+    try:
+        if args.memory:
+            tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        if args.clan:
+            from scripts.game_structure.load_cat import load_timings
+
+            simulation.load_save(args.clan)
+            print(
+                "Loaded cats: "
+                + ", ".join(
+                    f"{stage} {seconds:.2f}s" for stage, seconds in load_timings.items()
+                )
+            )
+        else:
+            simulation.generate_clan(
+                size=args.cats, biome=args.biome, game_mode=args.game_mode
+            )
+        print(f"Set up in {time.perf_counter() - started:.2f}s")
+        if args.memory:
+            print(format_memory(measure_memory(baseline)))
+        print(format_report(simulation.run(args.moons, timed=not args.no_subsystems)))
+        if args.memory:
+            print(format_memory(measure_memory(baseline)))
+    finally:
+        simulation.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+The histories of a Clan's cats, in one file.
+
+Histories are saved to history/histories.jsonl in the Clan's folder, one line per history:
+{"cat": <ID>, "history": {...}}. A save only appends the histories that changed since they were last
+read or written, so the history of a cat is the last line with its ID. The file is read through once
+to note where the last line of each cat starts. After that, a history is read by seeking straight to
+its line, so loading histories doesn't take a file per cat. Once more than half of the lines are
+outdated, the file is rewritten with only the last line of each cat.
+
+Clans saved before this have one file per cat, history/<ID>_history.json. The file of a cat is read
+as long as the cat has no line, and the next save copies all of them into histories.jsonl.
+
+Cats load their history the first time it's needed (see Cat.history). Loaded histories are kept
+between saves, since they can have changes that aren't saved yet, and after a save, the
+RESIDENT_HISTORIES histories that were used most recently stay loaded. See release_histories().
+If the Clan uses the single-file save, histories are kept in its clan.db instead (see clan_database.py),
+but they are loaded and kept in memory the same way.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import ujson
+
+from scripts.game_structure.save_manifest import fingerprint
+
+HISTORY_FOLDER = "history"
+HISTORY_FILE = "histories.jsonl"
+LEGACY_SUFFIX = "_history.json"
+# how many histories stay loaded after a save
+RESIDENT_HISTORIES = 200
+# the file isn't rewritten while it has fewer lines than this
+MIN_COMPACT_LINES = 64
+
+
+class HistoryStore:
+    """
+    The histories.jsonl of one Clan.
+    Use get_history_store() to get one, rather than creating it directly.
+    """
+
+    def __init__(self, clan_directory: str):
+        self.folder = os.path.join(clan_directory, HISTORY_FOLDER)
+        self.path = os.path.join(self.folder, HISTORY_FILE)
+        # cat ID: where its last line starts
+        self.offsets: Dict[str, int] = {}
+        self.lines = 0
+        # cat ID: fingerprint of its history as it is in the file
+        self._saved: Dict[str, str] = {}
+        # (cat ID, line, fingerprint) to append on the next flush()
+        self._pending: List[Tuple[str, str, str]] = []
+        # (size, modification time) of the file when it was last read or written
+        self._stat = None
+        self._ends_with_newline = True
+        self._index()
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _index(self):
+        self.offsets = {}
+        self.lines = 0
+        self._saved = {}
+        self._ends_with_newline = True
+        if os.path.exists(self.path):
+            offset = 0
+            with open(self.path, "rb") as read_file:
+                for line in read_file:
+                    try:
+                        cat_id = ujson.loads(line)["cat"]
+                    except (ValueError, KeyError, TypeError):
+                        # the end of the file can be missing if the game was closed while saving
+                        cat_id = None
+                    if cat_id is not None:
+                        self.offsets[cat_id] = offset
+                        self.lines += 1
+                    offset += len(line)
+                    self._ends_with_newline = line.endswith(b"\n")
+        self._stat = self._file_stat()
+
+    def _check_file(self):
+        """Read the file through again if something else changed it, e.g. a backup was put back."""
+        if self._file_stat() != self._stat:
+            self._index()
+
+    def _legacy_path(self, cat_id: str) -> str:
+        return os.path.join(self.folder, cat_id + LEGACY_SUFFIX)
+
+    def get(self, cat_id: str) -> Optional[dict]:
+        """
+        Returns the saved history of a cat, or None if it doesn't have one.
+        Raises ValueError if it can't be read.
+        """
+        self._check_file()
+        offset = self.offsets.get(cat_id)
+        if offset is None:
+            path = self._legacy_path(cat_id)
+            if not os.path.exists(path):
+                return None
+            with open(path, "r", encoding="utf-8") as read_file:
+                return ujson.loads(read_file.read())
+
+        with open(self.path, "rb") as read_file:
+            read_file.seek(offset)
+            history = ujson.loads(read_file.readline())["history"]
+        self._saved[cat_id] = fingerprint(ujson.dumps(history))
+        return history
+
+    def items(self) -> Iterator[Tuple[str, dict]]:
+        """Yields (cat ID, history) pairs of all saved histories, including those of older saves."""
+        self._check_file()
+        for cat_id in list(self.offsets):
+            yield cat_id, self.get(cat_id)
+        for cat_id, path in self._legacy_files():
+            try:
+                with open(path, "r", encoding="utf-8") as read_file:
+                    yield cat_id, ujson.loads(read_file.read())
+            except (OSError, ValueError):
+                print(f"WARNING: Couldn't read {path}")
+
+    def _legacy_files(self) -> List[Tuple[str, str]]:
+        """(cat ID, path) of the files of older saves, of the cats which don't have a line."""
+        if not os.path.isdir(self.folder):
+            return []
+        files = []
+        for file_name in os.listdir(self.folder):
+            if file_name.endswith(LEGACY_SUFFIX):
+                cat_id = file_name[: -len(LEGACY_SUFFIX)]
+                if cat_id not in self.offsets:
+                    files.append((cat_id, os.path.join(self.folder, file_name)))
+        return files
+
+    def put(self, cat_id: str, history: dict):
+        """Save a history on the next flush(), unless it's already saved like this."""
+        text = ujson.dumps(history)
+        saved = fingerprint(text)
+        if self._saved.get(cat_id) == saved:
+            return
+        self._pending.append(
+            (cat_id, f'{{"cat":{ujson.dumps(cat_id)},"history":{text}}}\n', saved)
+        )
+
+    def flush(self) -> List[str]:
+        """
+        Append the histories given to put() since the last flush, and copy the histories of older saves
+        into the file. Returns the paths of the files of older saves, which aren't needed anymore.
+        """
+        self._check_file()
+        pending_ids = {cat_id for cat_id, _, _ in self._pending}
+        copied = []
+        for cat_id, path in self._legacy_files():
+            if cat_id not in pending_ids:
+                try:
+                    with open(path, "r", encoding="utf-8") as read_file:
+                        self.put(cat_id, ujson.loads(read_file.read()))
+                except (OSError, ValueError):
+                    print(f"WARNING: Couldn't copy {path} into {self.path}")
+                    continue
+            copied.append(path)
+        pending, self._pending = self._pending, []
+        if not pending:
+            return copied
+
+        os.makedirs(self.folder, exist_ok=True)
+        with open(self.path, "ab") as write_file:
+            if not self._ends_with_newline:
+                write_file.write(b"\n")
+            offset = write_file.tell()
+            for cat_id, line, saved in pending:
+                data = line.encode("utf-8")
+                self.offsets[cat_id] = offset
+                self._saved[cat_id] = saved
+                offset += len(data)
+                write_file.write(data)
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        self.lines += len(pending)
+        self._ends_with_newline = True
+        self._stat = self._file_stat()
+
+        if self.lines > max(2 * len(self.offsets), MIN_COMPACT_LINES):
+            self._compact()
+        return copied
+
+    def _compact(self):
+        """Rewrite the file with only the last line of each cat."""
+        temp_path = self.path + ".tmp"
+        offsets = {}
+        with open(self.path, "rb") as read_file, open(temp_path, "wb") as write_file:
+            for cat_id, offset in self.offsets.items():
+                read_file.seek(offset)
+                line = read_file.readline()
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                offsets[cat_id] = write_file.tell()
+                write_file.write(line)
+            write_file.flush()
+            os.fsync(write_file.fileno())
+        os.replace(temp_path, self.path)
+        self.offsets = offsets
+        self.lines = len(offsets)
+        self._stat = self._file_stat()
+
+
+_stores: Dict[str, HistoryStore] = {}
+
+
+def get_history_store(clan_directory: str) -> HistoryStore:
+    """Returns the history store of the Clan with the given save folder."""
+    path = os.path.normpath(clan_directory)
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = HistoryStore(path)
+    return store
+
+
+# IDs of the cats whose history is loaded, least recently used first
+_resident: "OrderedDict[str, None]" = OrderedDict()
+
+
+def mark_history_used(cat_id: str):
+    try:
+        _resident.move_to_end(cat_id)
+    except KeyError:
+        _resident[cat_id] = None
+
+
+def release_histories(all_cats: dict, limit: int = RESIDENT_HISTORIES):
+    """
+    Unload the histories that were used least recently, until only limit of them are loaded. Only
+    call this right after a save, so no history with unsaved changes is unloaded.
+    :param all_cats: ID: cat, of the cats whose histories can be unloaded
+    """
+    while len(_resident) > limit:
+        cat_id, _ = _resident.popitem(last=False)
+        cat = all_cats.get(cat_id)
+        if cat is not None:
+            cat.history = None
@@ -1,7 +1,10 @@
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from math import floor
 from random import choice
+from typing import Dict, Iterable
 
 import i18n
 import ujson
@@ -12,12 +15,16 @@ from ..cat.personality import Personality
 from scripts.cat.pelts import Pelt
 from scripts.cat_relations.inheritance import Inheritance
 from scripts.housekeeping.version import SAVE_VERSION_NUMBER
+from .clan_database import get_clan_database
 from .game_essentials import game
 from ..cat.skills import CatSkills
 from ..housekeeping.datadir import get_save_dir
 
 logger = logging.getLogger(__name__)
 
+# how long each stage of the last json_load() took, in seconds
+load_timings: Dict[str, float] = {}
+
 
 def load_cats():
     try:
@@ -31,7 +38,49 @@ def load_cats():
             raise
 
 
+def read_cat_files(clanname: str, cats: Iterable) -> Dict[str, Dict[str, object]]:
+    """
+    Read and parse the relationship and condition files of the given cats, several at a time.
+    Only living cats have their relationships read.
+
+    :return: {"relationships": {ID: data}, "conditions": {ID: data}}. Files which don't exist or
+        can't be read are left out, so the cat deals with them when it loads them itself.
+    """
+    directory = f"{get_save_dir()}/{clanname}"
+    paths = {"relationships": {}, "conditions": {}}
+    for cat in cats:
+        if not cat.dead:
+            paths["relationships"][
+                cat.ID
+            ] = f"{directory}/relationships/{cat.ID}_relations.json"
+        paths["conditions"][cat.ID] = f"{directory}/conditions/{cat.ID}_conditions.json"
+
+    files = {kind: {} for kind in paths}
+    jobs = [
+        (kind, cat_id, path)
+        for kind, cat_paths in paths.items()
+        for cat_id, path in cat_paths.items()
+    ]
+    # reading is mostly waiting for the disk, so this is faster even though parsing holds the GIL
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(lambda job: _read_json(job[2]), jobs)
+        for (kind, cat_id, _), data in zip(jobs, results):
+            if data is not None:
+                files[kind][cat_id] = data
+    return files
+
+
+def _read_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as read_file:
+            return ujson.loads(read_file.read())
+    except (OSError, ValueError):
+        return None
+
+
 def json_load():
+    load_timings.clear()
+    started = time.perf_counter()
     all_cats = []
     clanname = game.switches["clan_list"][0]
     clan_cats_json_path = f"{get_save_dir()}/{clanname}/clan_cats.json"
@@ -39,9 +88,14 @@ def json_load():
         f"resources/dicts/conversion_dict.json", "r", encoding="utf-8"
     ) as read_file:
         convert = ujson.loads(read_file.read())
+    database = get_clan_database(clanname)
     try:
-        with open(clan_cats_json_path, "r", encoding="utf-8") as read_file:
-            cat_data = ujson.loads(read_file.read())
+        if database:
+            # cats are read one at a time while they are created, rather than all at once
+            cat_data = database.iter_records("cats")
+        else:
+            with open(clan_cats_json_path, "r", encoding="utf-8") as read_file:
+                cat_data = ujson.loads(read_file.read())
     except PermissionError as e:
         game.switches["error_message"] = f"Can\t open {clan_cats_json_path}!"
         game.switches["traceback"] = e
@@ -247,9 +301,24 @@ def json_load():
             game.switches["traceback"] = e
             raise
 
+    # the adoptive parents are only known once the cats are created, so index the families afterwards
+    Inheritance.family_index.rebuild(Cat.all_cats)
+
+    load_timings["cats"] = time.perf_counter() - started
+    started = time.perf_counter()
+
+    # the single-file save reads its records quickly by itself, and can only be used by one thread
+    if database:
+        cat_files = {"relationships": {}, "conditions": {}}
+    else:
+        cat_files = read_cat_files(clanname, all_cats)
+
+    load_timings["files"] = time.perf_counter() - started
+    started = time.perf_counter()
+
     # replace cat ids with cat objects and add other needed variables
     for cat in all_cats:
-        cat.load_conditions()
+        cat.load_conditions(cat_files["conditions"].get(cat.ID))
 
         # this is here to handle paralyzed cats in old saves
         if cat.pelt.paralyzed and "paralyzed" not in cat.permanent_condition:
@@ -260,11 +329,11 @@ def json_load():
         # load the relationships
         try:
             if not cat.dead:
-                cat.load_relationship_of_cat()
+                cat.load_relationship_of_cat(cat_files["relationships"].get(cat.ID))
                 if cat.relationships is not None and len(cat.relationships) < 1:
                     cat.init_all_relationships()
             else:
-                cat.relationships = {}
+                cat.relationships.clear()
         except Exception as e:
             logger.exception(
                 f"There was an error loading relationships for cat #{cat}."
@@ -278,8 +347,11 @@ def json_load():
         cat.inheritance = Inheritance(cat)
 
         try:
-            # initialization of thoughts
-            cat.thoughts()
+            # initialization of thoughts. The dead get theirs when their profile is opened.
+            if cat.dead:
+                cat.thought_pending = True
+            else:
+                cat.thoughts()
         except Exception as e:
             logger.exception(
                 f"There was an error when thoughts for cat #{cat} are created."
@@ -294,6 +366,13 @@ def json_load():
         if game.config["save_load"]["load_integrity_checks"]:
             save_check()
 
+    load_timings["links"] = time.perf_counter() - started
+    logger.info(
+        "Loaded %s cats: %s",
+        len(all_cats),
+        ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in load_timings.items()),
+    )
+
 
 def csv_load(all_cats):
     if game.switches["clan_list"][0].strip() == "":
@@ -6,6 +6,7 @@ import i18n.translations
 import ujson
 
 from scripts.game_structure.game_essentials import game
+from scripts.housekeeping import startup_trace
 
 lang_config: Optional[Dict] = None
 _lang_config_directory = os.path.join("resources", "lang", "{locale}", "config.json")
@@ -81,20 +82,21 @@ def load_lang_resource(location: str, *, root_directory=None):
     resource_directory = os.path.join(root_directory, locale)
     fallback_directory = os.path.join(root_directory, fallback)
     location = location.lstrip("\\/")  # just in case someone is an egg and does add it
-    try:
-        with open(
-            os.path.join(resource_directory, location.replace("{lang}", locale)),
-            "r",
-            encoding="utf-8",
-        ) as string_file:
-            return ujson.loads(string_file.read())
-    except FileNotFoundError:
-        with open(
-            os.path.join(fallback_directory, location.replace("{lang}", fallback)),
-            "r",
-            encoding="utf-8",
-        ) as string_file:
-            return ujson.loads(string_file.read())
+    with startup_trace.stage(f"load {location}"):
+        try:
+            with open(
+                os.path.join(resource_directory, location.replace("{lang}", locale)),
+                "r",
+                encoding="utf-8",
+            ) as string_file:
+                return ujson.loads(string_file.read())
+        except FileNotFoundError:
+            with open(
+                os.path.join(fallback_directory, location.replace("{lang}", fallback)),
+                "r",
+                encoding="utf-8",
+            ) as string_file:
+                return ujson.loads(string_file.read())
 
 
 def get_lang_config() -> Dict:
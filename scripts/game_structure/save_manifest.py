@@ -0,0 +1,98 @@
+"""
+Incremental saves.
+
+Each Clan folder holds a save_manifest.json, which lists every file written by the last save
+together with a fingerprint of its contents and the size and modification time the file had
+right after it was written. When the game saves again, a file is only rewritten if its new
+contents have a different fingerprint, or if the file on disk no longer matches what the manifest
+says (it was deleted, edited by hand or written by an older version of the game).
+
+Files are still written one by one, so the manifest is written last and replaced in one step. It
+never lists a file as up to date unless that file was completely written.
+"""
+
+import hashlib
+import os
+from typing import Dict, List, Optional
+
+import ujson
+
+from scripts.housekeeping.datadir import get_save_dir
+
+MANIFEST_VERSION = 1
+
+
+def fingerprint(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SaveManifest:
+    """
+    The manifest of one Clan folder. Paths in it are relative to that folder.
+    Use get_save_manifest() to get one, rather than creating it directly.
+    """
+
+    file_name = "save_manifest.json"
+
+    def __init__(self, clan_directory: str):
+        self.directory = clan_directory
+        self.path = os.path.join(clan_directory, self.file_name)
+        # relative path: [fingerprint, size, modification time in ns]
+        self.records: Dict[str, List] = {}
+        self.changed = False
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as read_file:
+                    manifest = ujson.loads(read_file.read())
+                if manifest.get("version") == MANIFEST_VERSION:
+                    self.records = manifest["records"]
+            except (OSError, ValueError, KeyError):
+                print(f"WARNING: {self.path} couldn't be read, the next save will be a full save")
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self.directory).replace(os.sep, "/")
+
+    def is_unchanged(self, path: str, text: str) -> bool:
+        """Whether the file at path already holds exactly this text, as far as the last save knows."""
+        record = self.records.get(self._key(path))
+        if not record or record[0] != fingerprint(text):
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return record[1] == stat.st_size and record[2] == stat.st_mtime_ns
+
+    def record(self, path: str, text: str):
+        """Remember that text was just written to the file at path."""
+        stat = os.stat(path)
+        self.records[self._key(path)] = [fingerprint(text), stat.st_size, stat.st_mtime_ns]
+        self.changed = True
+
+    def forget(self, path: str):
+        if self.records.pop(self._key(path), None) is not None:
+            self.changed = True
+
+    def to_text(self) -> str:
+        return ujson.dumps({"version": MANIFEST_VERSION, "records": self.records})
+
+
+_manifests: Dict[str, SaveManifest] = {}
+
+
+def get_save_manifest(clanname: str) -> Optional[SaveManifest]:
+    """Returns the manifest of the given Clan's folder, or None if the folder doesn't exist."""
+    directory = f"{get_save_dir()}/{clanname}"
+    if not os.path.isdir(directory):
+        _manifests.pop(directory, None)
+        return None
+    manifest = _manifests.get(directory)
+    if manifest is None:
+        manifest = _manifests[directory] = SaveManifest(directory)
+    return manifest
+
+
+def forget_save_manifests():
+    """Drop the manifests held in memory, so they are read from disk again when next needed."""
+    _manifests.clear()
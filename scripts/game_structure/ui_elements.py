@@ -13,6 +13,7 @@ from pygame_gui.core.text.text_box_layout import TextBoxLayout
 from pygame_gui.core.utility import translate
 from pygame_gui.elements import UIAutoResizingContainer
 
+from scripts.cat.sprite_queue import sprite_queue
 from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import game
 from scripts.utility import (
@@ -651,19 +652,7 @@ class UISpriteButton:
             container=container,
             anchors=anchors,
         )
-        input_sprite = sprite.premul_alpha()
-        # if it's going to be small on the screen, smoothscale out the crunch
-        input_sprite = (
-            pygame.transform.smoothscale(input_sprite, relative_rect.size)
-            if (
-                (
-                    relative_rect.height <= ui_scale_value(sprite.get_height())
-                    or relative_rect.width <= ui_scale_value(sprite.get_height())
-                )
-                and not game.settings["no sprite antialiasing"]
-            )
-            else pygame.transform.scale(input_sprite, relative_rect.size)
-        )
+        input_sprite = self._prepare_sprite(sprite, relative_rect.size)
 
         self.image = pygame_gui.elements.UIImage(
             relative_rect,
@@ -677,6 +666,26 @@ class UISpriteButton:
         del input_sprite
         self.button.join_focus_sets(self.image)
 
+    @staticmethod
+    def _prepare_sprite(sprite, size):
+        input_sprite = sprite.premul_alpha()
+        # if it's going to be small on the screen, smoothscale out the crunch
+        return (
+            pygame.transform.smoothscale(input_sprite, size)
+            if (
+                (
+                    size[1] <= ui_scale_value(sprite.get_height())
+                    or size[0] <= ui_scale_value(sprite.get_height())
+                )
+                and not game.settings["no sprite antialiasing"]
+            )
+            else pygame.transform.scale(input_sprite, size)
+        )
+
+    def set_sprite(self, sprite):
+        """Replace the cat sprite, scaled the same way as the one given when this was created."""
+        self.image.set_image(self._prepare_sprite(sprite, self.image.rect.size))
+
     def return_cat_id(self):
         return self.button.return_cat_id()
 
@@ -698,6 +707,8 @@ class UISpriteButton:
         self.button.show()
 
     def kill(self):
+        # a sprite that is still being drawn isn't needed anymore
+        sprite_queue.cancel(self)
         self.button.kill()
         self.image.kill()
         del self
@@ -1305,10 +1316,15 @@ class UICatListDisplay(UIContainer):
                 for i, kitty in enumerate(display_cats)
             ]
 
+        # draw the pages next to this one in the background, so turning the page is quick
+        for page in (self.current_page, self.current_page - 2):
+            if 0 <= page < len(self.cat_chunks):
+                sprite_queue.prefetch(self.cat_chunks[page])
+
     def create_cat_button(self, i, kitty, container):
         self.cat_sprites[f"sprite{i}"] = UISpriteButton(
             ui_scale(pygame.Rect((0, 15), (50, 50))),
-            kitty.sprite,
+            sprite_queue.placeholder,
             cat_object=kitty,
             cat_id=kitty.ID,
             container=container,
@@ -1317,6 +1333,12 @@ class UICatListDisplay(UIContainer):
             starting_height=1,
             anchors={"centerx": "centerx"},
         )
+        # the sprite is drawn in the background if it isn't ready yet
+        sprite_queue.request(
+            kitty,
+            self.cat_sprites[f"sprite{i}"].set_sprite,
+            owner=self.cat_sprites[f"sprite{i}"],
+        )
 
     def create_name(self, i, kitty, container):
         self.cat_names[f"name{i}"] = pygame_gui.elements.UILabel(
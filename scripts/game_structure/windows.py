@@ -19,7 +19,9 @@ from pygame_gui.windows import UIMessageWindow
 
 from scripts.cat.history import History
 from scripts.cat.names import Name
+from scripts.cat_relations.log_archive import load_archived_log
 from scripts.game_structure import image_cache
+from scripts.game_structure.clan_database import close_clan_databases
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.localization import (
     get_lang_config,
@@ -396,6 +398,8 @@ class DeleteCheck(UIWindow):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             if event.ui_element == self.delete_it_button:
                 rempath = get_save_dir() + "/" + self.clan_name
+                # an open single-file save can't be deleted on Windows
+                close_clan_databases()
                 shutil.rmtree(rempath)
                 if os.path.exists(rempath + "clan.json"):
                     os.remove(rempath + "clan.json")
@@ -1605,15 +1609,30 @@ class RelationshipLog(UIWindow):
         opposite_log_string = None
         if not relationship.opposite_relationship:
             relationship.link_relationship()
-        if (
-            relationship.opposite_relationship
-            and len(relationship.opposite_relationship.log) > 0
-        ):
-            opposite_log_string = f"{f'<br>-----------------------------<br>'.join(relationship.opposite_relationship.log)}<br>"
+        # older entries are kept in the log archive
+        clan_directory = f"{get_save_dir()}/{game.clan.name}"
+        log = (
+            load_archived_log(
+                clan_directory, relationship.cat_from.ID, relationship.cat_to.ID
+            )
+            + relationship.log
+        )
+        opposite_log = []
+        if relationship.opposite_relationship:
+            opposite_log = (
+                load_archived_log(
+                    clan_directory, relationship.cat_to.ID, relationship.cat_from.ID
+                )
+                + relationship.opposite_relationship.log
+            )
+        if len(opposite_log) > 0:
+            opposite_log_string = (
+                f"{f'<br>-----------------------------<br>'.join(opposite_log)}<br>"
+            )
 
         log_string = (
-            f"{f'<br>-----------------------------<br>'.join(relationship.log)}<br>"
-            if len(relationship.log) > 0
+            f"{f'<br>-----------------------------<br>'.join(log)}<br>"
+            if len(log) > 0
             else i18n.t("windows.no_relation_logs")
         )
 
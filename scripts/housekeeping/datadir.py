@@ -26,6 +26,10 @@ def setup_data_dir():
 
 
 def get_data_dir():
+    # Allows tools (such as the headless simulation) to run against a throwaway data directory
+    if os.environ.get("CLANGEN_DATA_DIR"):
+        return os.environ["CLANGEN_DATA_DIR"]
+
     if get_version_info().is_source_build:
         return "."
 
@@ -0,0 +1,104 @@
+"""
+Startup tracing.
+
+Start the game with the environment variable CLANGEN_TRACE_STARTUP set to see where the time until the
+start screen goes. Every module import is timed, as well as the stages the game marks with stage()
+(loading resources, sprites and the Clan, creating screens, ...). Once the start screen is shown, the
+slowest of them are printed and tracing stops.
+
+When the variable isn't set, nothing is recorded and stage() does nothing.
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from typing import Dict, List, Tuple
+
+enabled = bool(os.environ.get("CLANGEN_TRACE_STARTUP"))
+
+_started = time.perf_counter()
+# (module, seconds including the modules it imported, how deeply it was nested), in the order they finished
+imports: List[Tuple[str, float, int]] = []
+# label: [seconds, times]
+stages: Dict[str, list] = {}
+_depth = 0
+
+
+class _TimingLoader(Loader):
+    """Wraps the loader of a module to time how long the module takes to run."""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        global _depth
+        started = time.perf_counter()
+        _depth += 1
+        try:
+            self.loader.exec_module(module)
+        finally:
+            _depth -= 1
+            if enabled:
+                imports.append((module.__name__, time.perf_counter() - started, _depth))
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+
+class _TimingFinder(MetaPathFinder):
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if enabled and spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimingLoader(spec.loader)
+        return spec
+
+
+def install():
+    """Start timing imports, if tracing is enabled. Call this as early as possible."""
+    if enabled and not any(isinstance(f, _TimingFinder) for f in sys.meta_path):
+        sys.meta_path.insert(0, _TimingFinder())
+
+
+@contextmanager
+def stage(label: str):
+    """Time the code inside this block. Stages with the same label are added up."""
+    if not enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = stages.setdefault(label, [0.0, 0])
+        record[0] += time.perf_counter() - started
+        record[1] += 1
+
+
+def report(limit: int = 25):
+    """Print the slowest imports and stages, and stop tracing."""
+    global enabled
+    if not enabled:
+        return
+    enabled = False
+
+    print(f"Startup took {time.perf_counter() - _started:.2f}s")
+    print("Slowest imports (including what they import):")
+    for name, seconds, depth in sorted(imports, key=lambda i: -i[1])[:limit]:
+        print(f"  {seconds:8.3f}s  {'  ' * depth}{name}")
+    print("Slowest stages:")
+    for label, (seconds, times) in sorted(stages.items(), key=lambda s: -s[1][0])[
+        :limit
+    ]:
+        print(f"  {seconds:8.3f}s  {label}" + (f" ({times} times)" if times > 1 else ""))
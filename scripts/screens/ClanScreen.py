@@ -7,6 +7,7 @@ import pygame_gui
 from pygame_gui.core import ObjectID
 
 from scripts.cat.cats import Cat
+from scripts.cat.sprite_queue import sprite_queue
 from scripts.game_structure import image_cache
 from scripts.game_structure.game_essentials import (
     game,
@@ -148,40 +149,22 @@ class ClanScreen(Screens):
                     break
 
                 try:
-                    image = Cat.all_cats[x].sprite.convert_alpha()
-                    blend_layer = (
-                        self.game_bgs[self.active_bg]
-                        .subsurface(
-                            ui_scale(
-                                pygame.Rect(tuple(Cat.all_cats[x].placement), (50, 50))
-                            )
-                        )
-                        .convert_alpha()
+                    button = UISpriteButton(
+                        ui_scale(
+                            pygame.Rect(tuple(Cat.all_cats[x].placement), (50, 50))
+                        ),
+                        sprite_queue.placeholder,
+                        cat_id=x,
+                        starting_height=i,
                     )
-                    blend_layer = pygame.transform.box_blur(
-                        blend_layer, self.layout["cat_shading"]["blur"]
-                    )
-
-                    sprite = image.copy()
-                    sprite.fill(
-                        (255, 255, 255, 255), special_flags=pygame.BLEND_RGB_MAX
-                    )
-                    sprite.blit(
-                        blend_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
-                    )
-                    image.set_alpha(self.layout["cat_shading"]["blend_strength"])
-                    sprite.blit(image, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-                    sprite.set_alpha(255)
-
-                    self.cat_buttons.append(
-                        UISpriteButton(
-                            ui_scale(
-                                pygame.Rect(tuple(Cat.all_cats[x].placement), (50, 50))
-                            ),
-                            sprite,
-                            cat_id=x,
-                            starting_height=i,
-                        )
+                    self.cat_buttons.append(button)
+                    # the sprite is drawn in the background if it isn't ready yet
+                    sprite_queue.request(
+                        Cat.all_cats[x],
+                        lambda image, button=button, cat=Cat.all_cats[x]: self.set_cat_sprite(
+                            button, cat, image
+                        ),
+                        owner=button,
                     )
                 except:
                     print(
@@ -300,6 +283,30 @@ class ClanScreen(Screens):
 
         self.update_buttons_and_text()
 
+    def set_cat_sprite(self, button, cat, image):
+        """Shade a cat's sprite to match the camp around it and show it on its button."""
+        try:
+            image = image.convert_alpha()
+            blend_layer = (
+                self.game_bgs[self.active_bg]
+                .subsurface(ui_scale(pygame.Rect(tuple(cat.placement), (50, 50))))
+                .convert_alpha()
+            )
+            blend_layer = pygame.transform.box_blur(
+                blend_layer, self.layout["cat_shading"]["blur"]
+            )
+
+            sprite = image.copy()
+            sprite.fill((255, 255, 255, 255), special_flags=pygame.BLEND_RGB_MAX)
+            sprite.blit(blend_layer, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            image.set_alpha(self.layout["cat_shading"]["blend_strength"])
+            sprite.blit(image, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+            sprite.set_alpha(255)
+
+            button.set_sprite(sprite)
+        except:
+            print(f"ERROR: placing {cat.name}'s sprite on Clan page")
+
     def exit_screen(self):
         # removes the cat sprites.
         for button in self.cat_buttons:
@@ -8,8 +8,10 @@ from scripts.cat.cats import Cat
 from scripts.event_class import Single_Event
 from scripts.events import events_class
 from scripts.game_structure import image_cache
+from scripts.game_structure.event_journal import load_moon_events, saved_moons
 from scripts.game_structure.game_essentials import game
 from scripts.game_structure.screen_settings import MANAGER
+from scripts.housekeeping.datadir import get_save_dir
 from scripts.game_structure.ui_elements import (
     UIModifiedScrollingContainer,
     IDImageButton,
@@ -65,6 +67,10 @@ class EventsScreen(Screens):
         self.event_screen_container = None
         self.clan_info = {}
         self.timeskip_button = None
+        self.earlier_moon_button = None
+        self.later_moon_button = None
+        # the moon whose events are shown, None for the current one
+        self.shown_moon = None
 
         self.full_event_display_container = None
         self.events_frame = None
@@ -130,6 +136,10 @@ class EventsScreen(Screens):
                 self.events_thread = self.loading_screen_start_work(
                     events_class.one_moon
                 )
+            elif element == self.earlier_moon_button:
+                self.show_moon(self.earlier_saved_moon())
+            elif element == self.later_moon_button:
+                self.show_moon(self.later_saved_moon())
             elif element in self.involved_cat_buttons:
                 self.make_cat_buttons(element)
             elif element in self.cat_profile_buttons:
@@ -294,6 +304,27 @@ class EventsScreen(Screens):
             sound_id="timeskip",
         )
 
+        self.earlier_moon_button = UISurfaceImageButton(
+            ui_scale(pygame.Rect((270, 216), (34, 34))),
+            Icon.ARROW_LEFT,
+            get_button_dict(ButtonStyles.ICON, (34, 34)),
+            object_id="@buttonstyles_icon",
+            tool_tip_text="screens.events.earlier_moon_tooltip",
+            starting_height=1,
+            container=self.event_screen_container,
+            manager=MANAGER,
+        )
+        self.later_moon_button = UISurfaceImageButton(
+            ui_scale(pygame.Rect((496, 216), (34, 34))),
+            Icon.ARROW_RIGHT,
+            get_button_dict(ButtonStyles.ICON, (34, 34)),
+            object_id="@buttonstyles_icon",
+            tool_tip_text="screens.events.later_moon_tooltip",
+            starting_height=1,
+            container=self.event_screen_container,
+            manager=MANAGER,
+        )
+
         self.full_event_display_container = pygame_gui.core.UIContainer(
             ui_scale(pygame.Rect((45, 266), (700, 700))),
             starting_height=1,
@@ -352,6 +383,7 @@ class EventsScreen(Screens):
         variable_dict = super().display_change_save()
 
         variable_dict["current_display"] = self.current_display
+        variable_dict["shown_moon"] = self.shown_moon
 
         return variable_dict
 
@@ -364,6 +396,10 @@ class EventsScreen(Screens):
             except KeyError:
                 continue
 
+        if self.shown_moon is not None:
+            self.update_display_events_lists(
+                load_moon_events(self.clan_directory(), self.shown_moon, Cat)
+            )
         self.handle_tab_switch(self.current_display, is_rescale=True)
         MANAGER.update(1)
 
@@ -531,28 +567,60 @@ class EventsScreen(Screens):
         self.event_display.kill()  # event display isn't put in the screen container due to lag issues
         self.event_screen_container.kill()
 
-    def update_display_events_lists(self):
+    def update_display_events_lists(self, events=None):
         """
-        Categorize events from game.cur_events_list into display categories for screen
+        Categorize events into display categories for screen
+        :param events: The events to show, game.cur_events_list if None
         """
-
-        self.all_events = [
-            x for x in game.cur_events_list if "interaction" not in x.types
-        ]
-        self.ceremony_events = [
-            x for x in game.cur_events_list if "ceremony" in x.types
-        ]
-        self.birth_death_events = [
-            x for x in game.cur_events_list if "birth_death" in x.types
-        ]
-        self.relation_events = [
-            x for x in game.cur_events_list if "relation" in x.types
-        ]
-        self.health_events = [x for x in game.cur_events_list if "health" in x.types]
-        self.other_clans_events = [
-            x for x in game.cur_events_list if "other_clans" in x.types
+        if events is None:
+            events = game.cur_events_list
+
+        self.all_events = [x for x in events if "interaction" not in x.types]
+        self.ceremony_events = [x for x in events if "ceremony" in x.types]
+        self.birth_death_events = [x for x in events if "birth_death" in x.types]
+        self.relation_events = [x for x in events if "relation" in x.types]
+        self.health_events = [x for x in events if "health" in x.types]
+        self.other_clans_events = [x for x in events if "other_clans" in x.types]
+        self.misc_events = [x for x in events if "misc" in x.types]
+
+    @staticmethod
+    def clan_directory():
+        return f"{get_save_dir()}/{game.clan.name}"
+
+    def earlier_saved_moon(self):
+        """Returns the latest moon before the shown one whose events are saved, or None."""
+        shown = game.clan.age if self.shown_moon is None else self.shown_moon
+        earlier = [
+            moon
+            for moon in saved_moons(self.clan_directory())
+            if moon < shown
         ]
-        self.misc_events = [x for x in game.cur_events_list if "misc" in x.types]
+        return earlier[-1] if earlier else None
+
+    def later_saved_moon(self):
+        """Returns the moon after the shown one whose events are saved, or None for the current moon."""
+        if self.shown_moon is None:
+            return None
+        for moon in saved_moons(self.clan_directory()):
+            if self.shown_moon < moon < game.clan.age:
+                return moon
+        return None
+
+    def show_moon(self, moon):
+        """
+        Show the events of the given moon, which are read from its saved file (see event_journal.py).
+        :param moon: The moon, None for the current one
+        """
+        self.save_scroll_position()
+        game.switches["saved_scroll_positions"] = {}
+        self.shown_moon = moon
+        if moon is None:
+            self.update_display_events_lists()
+        else:
+            self.update_display_events_lists(
+                load_moon_events(self.clan_directory(), moon, Cat)
+            )
+        self.handle_tab_switch(self.current_display, is_rescale=True)
 
     def update_events_display(self):
         """
@@ -567,9 +635,22 @@ class EventsScreen(Screens):
                 "season": i18n.t(game.clan.current_season.lower()).capitalize()
             },
         )
-        self.clan_info["age"].set_text(
-            "screens.events.age", text_kwargs={"count": game.clan.age}
-        )
+        if self.shown_moon is None:
+            self.clan_info["age"].set_text(
+                "screens.events.age", text_kwargs={"count": game.clan.age}
+            )
+        else:
+            self.clan_info["age"].set_text(
+                "screens.events.shown_moon", text_kwargs={"count": self.shown_moon}
+            )
+        if self.earlier_saved_moon() is None:
+            self.earlier_moon_button.disable()
+        else:
+            self.earlier_moon_button.enable()
+        if self.shown_moon is None:
+            self.later_moon_button.disable()
+        else:
+            self.later_moon_button.enable()
 
         self.make_event_scrolling_container()
 
@@ -729,6 +810,7 @@ class EventsScreen(Screens):
         if get_living_clan_cat_count(Cat) == 0:
             GameOver("events screen")
 
+        self.shown_moon = None
         self.update_display_events_lists()
 
         self.current_display = "all events"
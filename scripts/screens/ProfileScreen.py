@@ -535,6 +535,8 @@ class ProfileScreen(Screens):
         is_df_instructor = False
         if self.the_cat is None:
             return
+        if self.the_cat.thought_pending:
+            self.the_cat.thoughts()
         if (
             self.the_cat.dead
             and game.clan.instructor.ID == self.the_cat.ID
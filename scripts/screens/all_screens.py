@@ -1,29 +1,8 @@
-from .AllegiancesScreen import AllegiancesScreen
-from .CeremonyScreen import CeremonyScreen
-from .ChangeGenderScreen import ChangeGenderScreen
-from .ChooseAdoptiveParentScreen import ChooseAdoptiveParentScreen
-from .ChooseMateScreen import ChooseMateScreen
-from .ChooseMentorScreen import ChooseMentorScreen
-from .ClanScreen import ClanScreen
-from .ClanSettingsScreen import ClanSettingsScreen
-from .ClearingScreen import ClearingScreen
-from .EventsScreen import EventsScreen
-from .FamilyTreeScreen import FamilyTreeScreen
-from .LeaderDenScreen import LeaderDenScreen
-from .ListScreen import ListScreen
-from .MakeClanScreen import MakeClanScreen
-from .MedDenScreen import MedDenScreen
-from .MediationScreen import MediationScreen
-from .PatrolScreen import PatrolScreen
-from .ProfileScreen import ProfileScreen
-from .RelationshipScreen import RelationshipScreen
-from .RoleScreen import RoleScreen
+from importlib import import_module
+
 from .Screens import Screens
-from .SettingsScreen import SettingsScreen
-from .SpriteInspectScreen import SpriteInspectScreen
-from .StartScreen import StartScreen
-from .SwitchClanScreen import SwitchClanScreen
-from .WarriorDenScreen import WarriorDenScreen
+from ..game_structure.game_essentials import game
+from ..housekeeping import startup_trace
 
 # ---------------------------------------------------------------------------- #
 #                                  UI RULES                                    #
@@ -45,76 +24,83 @@ BUTTONS:
 """
 
 
+class LazyScreen:
+    """
+    A screen of AllScreens. It's created, and its module imported, the first time it's used,
+    so starting the game doesn't have to build every screen.
+    """
+
+    def __init__(self, class_name: str):
+        """:param class_name: The screen's class, which is in the module of the same name"""
+        self.class_name = class_name
+        self.name = None
+
+    def __set_name__(self, owner, attribute_name):
+        self.name = attribute_name.replace("_", " ")
+
+    def __get__(self, instance, owner):
+        return game.all_screens[self.name]
+
+    def create(self):
+        with startup_trace.stage(f"create {self.name}"):
+            module = import_module(f"scripts.screens.{self.class_name}")
+            # the screen adds itself to game.all_screens
+            return getattr(module, self.class_name)(self.name)
+
+
+class ScreenDict(dict):
+    """game.all_screens: the screens by name, created when they are first looked up."""
+
+    def __init__(self, lazy_screens):
+        super().__init__()
+        self.lazy_screens = {screen.name: screen for screen in lazy_screens}
+
+    def __missing__(self, name):
+        return self.lazy_screens[name].create()
+
+
 class AllScreens:
     screens = Screens()
 
-    profile_screen = ProfileScreen("profile screen")
-    ceremony_screen = CeremonyScreen("ceremony screen")
-    role_screen = RoleScreen("role screen")
-    sprite_inspect_screen = SpriteInspectScreen("sprite inspect screen")
+    profile_screen = LazyScreen("ProfileScreen")
+    ceremony_screen = LazyScreen("CeremonyScreen")
+    role_screen = LazyScreen("RoleScreen")
+    sprite_inspect_screen = LazyScreen("SpriteInspectScreen")
 
-    make_clan_screen = MakeClanScreen("make clan screen")
+    make_clan_screen = LazyScreen("MakeClanScreen")
 
-    allegiances_screen = AllegiancesScreen("allegiances screen")
-    camp_screen = ClanScreen("camp screen")
-    list_screen = ListScreen("list screen")
-    med_den_screen = MedDenScreen("med den screen")
-    clearing_screen = ClearingScreen("clearing screen")
-    warrior_den_screen = WarriorDenScreen("warrior den screen")
-    leader_den_screen = LeaderDenScreen("leader den screen")
+    allegiances_screen = LazyScreen("AllegiancesScreen")
+    camp_screen = LazyScreen("ClanScreen")
+    list_screen = LazyScreen("ListScreen")
+    med_den_screen = LazyScreen("MedDenScreen")
+    clearing_screen = LazyScreen("ClearingScreen")
+    warrior_den_screen = LazyScreen("WarriorDenScreen")
+    leader_den_screen = LazyScreen("LeaderDenScreen")
 
-    events_screen = EventsScreen("events screen")
+    events_screen = LazyScreen("EventsScreen")
 
-    settings_screen = SettingsScreen("settings screen")
-    clan_settings_screen = ClanSettingsScreen("clan settings screen")
-    start_screen = StartScreen("start screen")
-    switch_clan_screen = SwitchClanScreen("switch clan screen")
+    settings_screen = LazyScreen("SettingsScreen")
+    clan_settings_screen = LazyScreen("ClanSettingsScreen")
+    start_screen = LazyScreen("StartScreen")
+    switch_clan_screen = LazyScreen("SwitchClanScreen")
 
-    patrol_screen = PatrolScreen("patrol screen")
+    patrol_screen = LazyScreen("PatrolScreen")
 
-    choose_mate_screen = ChooseMateScreen("choose mate screen")
-    choose_mentor_screen = ChooseMentorScreen("choose mentor screen")
-    choose_adoptive_parent_screen = ChooseAdoptiveParentScreen(
-        "choose adoptive parent screen"
-    )
-    relationship_screen = RelationshipScreen("relationship screen")
-    family_tree_screen = FamilyTreeScreen("family tree screen")
-    mediation_screen = MediationScreen("mediation screen")
-    change_gender_screen = ChangeGenderScreen("change gender screen")
+    choose_mate_screen = LazyScreen("ChooseMateScreen")
+    choose_mentor_screen = LazyScreen("ChooseMentorScreen")
+    choose_adoptive_parent_screen = LazyScreen("ChooseAdoptiveParentScreen")
+    relationship_screen = LazyScreen("RelationshipScreen")
+    family_tree_screen = LazyScreen("FamilyTreeScreen")
+    mediation_screen = LazyScreen("MediationScreen")
+    change_gender_screen = LazyScreen("ChangeGenderScreen")
 
     @classmethod
     def rebuild_all_screens(cls):
+        """Throw away all screens, so they are created again the next time they're used."""
         cls.screens = Screens()
-        cls.profile_screen = ProfileScreen("profile screen")
-        cls.ceremony_screen = CeremonyScreen("ceremony screen")
-        cls.role_screen = RoleScreen("role screen")
-        cls.sprite_inspect_screen = SpriteInspectScreen("sprite inspect screen")
-
-        cls.make_clan_screen = MakeClanScreen("make clan screen")
-
-        cls.allegiances_screen = AllegiancesScreen("allegiances screen")
-        cls.camp_screen = ClanScreen("camp screen")
-        cls.list_screen = ListScreen("list screen")
-        cls.med_den_screen = MedDenScreen("med den screen")
-        cls.clearing_screen = ClearingScreen("clearing screen")
-        cls.warrior_den_screen = WarriorDenScreen("warrior den screen")
-        cls.leader_den_screen = LeaderDenScreen("leader den screen")
-
-        cls.events_screen = EventsScreen("events screen")
-
-        cls.settings_screen = SettingsScreen("settings screen")
-        cls.clan_settings_screen = ClanSettingsScreen("clan settings screen")
-        cls.start_screen = StartScreen("start screen")
-        cls.switch_clan_screen = SwitchClanScreen("switch clan screen")
-
-        cls.patrol_screen = PatrolScreen("patrol screen")
-
-        cls.choose_mate_screen = ChooseMateScreen("choose mate screen")
-        cls.choose_mentor_screen = ChooseMentorScreen("choose mentor screen")
-        cls.choose_adoptive_parent_screen = ChooseAdoptiveParentScreen(
-            "choose adoptive parent screen"
-        )
-        cls.relationship_screen = RelationshipScreen("relationship screen")
-        cls.family_tree_screen = FamilyTreeScreen("family tree screen")
-        cls.mediation_screen = MediationScreen("mediation screen")
-        cls.change_gender_screen = ChangeGenderScreen("change gender screen")
+        game.all_screens.clear()
+
+
+game.all_screens = ScreenDict(
+    value for value in vars(AllScreens).values() if isinstance(value, LazyScreen)
+)
@@ -9,11 +9,12 @@ TODO: Docs
 import logging
 import os
 import re
+from functools import lru_cache
 from itertools import combinations
 from math import floor
 from random import choice, choices, randint, random, sample, randrange, getrandbits
 from sys import exit as sys_exit
-from typing import List, Tuple, TYPE_CHECKING, Type, Union
+from typing import List, NamedTuple, Tuple, TYPE_CHECKING, Type, Union
 
 import i18n
 import pygame
@@ -29,6 +30,7 @@ from scripts.game_structure.localization import (
 logger = logging.getLogger(__name__)
 from scripts.game_structure import image_cache, localization
 from scripts.cat.enums import CatAgeEnum
+from scripts.cat_relations.constraints import RELATIONSHIP_VALUES, compile_constraint
 from scripts.cat.history import History
 from scripts.cat.names import names
 from scripts.cat.sprites import sprites
@@ -100,11 +102,7 @@ def get_alive_status_cats(
     :param bool sort: default False, set to True if you would like list sorted by descending moon age
     """
 
-    alive_cats = [
-        i
-        for i in Cat.all_cats.values()
-        if i.status in get_status and not i.dead and not i.outside
-    ]
+    alive_cats = Cat.membership.select(dead=False, outside=False, statuses=get_status)
 
     if working:
         alive_cats = [i for i in alive_cats if not i.not_working()]
@@ -120,12 +118,7 @@ def get_living_cat_count(Cat):
     Returns the int of all living cats, both in and out of the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if the_cat.dead:
-            continue
-        count += 1
-    return count
+    return Cat.membership.count(dead=False)
 
 
 def get_living_clan_cat_count(Cat):
@@ -133,12 +126,7 @@ def get_living_clan_cat_count(Cat):
     Returns the int of all living cats within the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if the_cat.dead or the_cat.exiled or the_cat.outside:
-            continue
-        count += 1
-    return count
+    return Cat.membership.count(dead=False, outside=False, exiled=False)
 
 
 def get_cats_same_age(Cat, cat, age_range=10):
@@ -149,9 +137,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
     :param int age_range: The allowed age difference between the two cats, default 10
     """
     cats = []
-    for inter_cat in Cat.all_cats.values():
-        if inter_cat.dead or inter_cat.outside or inter_cat.exiled:
-            continue
+    for inter_cat in Cat.membership.select(dead=False, outside=False, exiled=False):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -173,9 +159,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
 def get_free_possible_mates(cat):
     """Returns a list of available cats, which are possible mates for the given cat."""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if inter_cat.dead or inter_cat.outside or inter_cat.exiled:
-            continue
+    for inter_cat in cat.membership.select(dead=False, outside=False, exiled=False):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -205,15 +189,11 @@ def get_random_moon_cat(
     random_cat = None
 
     # grab list of possible random cats
-    possible_r_c = list(
-        filter(
-            lambda c: not c.dead
-                      and not c.exiled
-                      and not c.outside
-                      and (c.ID != main_cat.ID),
-            Cat.all_cats.values(),
-        )
-    )
+    possible_r_c = [
+        c
+        for c in Cat.membership.select(dead=False, outside=False, exiled=False)
+        if c.ID != main_cat.ID
+    ]
 
     if possible_r_c:
         random_cat = choice(possible_r_c)
@@ -557,9 +537,7 @@ def create_new_cat_block(
     # check if we can use an existing cat here
     chosen_cat = None
     if "exists" in attribute_list:
-        existing_outsiders = [
-            i for i in Cat.all_cats.values() if i.outside and not i.dead
-        ]
+        existing_outsiders = Cat.membership.select(dead=False, outside=True)
         possible_outsiders = []
         for cat in existing_outsiders:
             if stor and cat.backstory not in stor:
@@ -1086,9 +1064,7 @@ def get_personality_compatibility(cat1, cat2):
 def get_cats_of_romantic_interest(cat):
     """Returns a list of cats, those cats are love interest of the given cat"""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if inter_cat.dead or inter_cat.outside or inter_cat.exiled:
-            continue
+    for inter_cat in cat.membership.select(dead=False, outside=False, exiled=False):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -1114,45 +1090,15 @@ def get_amount_of_cats_with_relation_value_towards(cat, value, all_cats):
     :param value: value which has to be reached
     :param all_cats: list of cats which has to be checked
     """
-
-    # collect all true or false if the value is reached for the cat or not
-    # later count or sum can be used to get the amount of cats
-    # this will be handled like this, because it is easier / shorter to check
-    relation_dict = {
-        "romantic_love": [],
-        "platonic_like": [],
-        "dislike": [],
-        "admiration": [],
-        "comfortable": [],
-        "jealousy": [],
-        "trust": [],
-    }
-
+    amounts = dict.fromkeys(RELATIONSHIP_VALUES.values(), 0)
     for inter_cat in all_cats:
-        if cat.ID in inter_cat.relationships:
-            relation = inter_cat.relationships[cat.ID]
-        else:
+        if cat.ID not in inter_cat.relationships:
             continue
+        for value_name in amounts:
+            if inter_cat.relationships.value_towards(cat.ID, value_name) >= value:
+                amounts[value_name] += 1
 
-        relation_dict["romantic_love"].append(relation.romantic_love >= value)
-        relation_dict["platonic_like"].append(relation.platonic_like >= value)
-        relation_dict["dislike"].append(relation.dislike >= value)
-        relation_dict["admiration"].append(relation.admiration >= value)
-        relation_dict["comfortable"].append(relation.comfortable >= value)
-        relation_dict["jealousy"].append(relation.jealousy >= value)
-        relation_dict["trust"].append(relation.trust >= value)
-
-    return_dict = {
-        "romantic_love": sum(relation_dict["romantic_love"]),
-        "platonic_like": sum(relation_dict["platonic_like"]),
-        "dislike": sum(relation_dict["dislike"]),
-        "admiration": sum(relation_dict["admiration"]),
-        "comfortable": sum(relation_dict["comfortable"]),
-        "jealousy": sum(relation_dict["jealousy"]),
-        "trust": sum(relation_dict["trust"]),
-    }
-
-    return return_dict
+    return amounts
 
 
 def filter_relationship_type(
@@ -1184,16 +1130,6 @@ def filter_relationship_type(
         "app/mentor",
     ]
 
-    possible_value_types = [
-        "romantic",
-        "platonic",
-        "dislike",
-        "comfortable",
-        "jealousy",
-        "trust",
-        "admiration",
-    ]
-
     if "siblings" in filter_types:
         test_cat = group[0]
         testing_cats = [cat for cat in group if cat.ID != test_cat.ID]
@@ -1287,106 +1223,17 @@ def filter_relationship_type(
             return False
 
     # Filtering relationship values
-    break_loop = False
-    for v_type in possible_value_types:
-        # first get all tags for current value types
-        tags = [constraint for constraint in filter_types if v_type in constraint]
-
-        # If there is not a tag for the current value type, check next one
-        if len(tags) == 0:
-            continue
-
-            # there should be only one value constraint for each value type
-        elif len(tags) > 1:
-            print(
-                f"ERROR: event {event_id} has multiple relationship constraints for the value {v_type}."
-            )
-            break_loop = True
-            break
-
-        # try to extract the value/threshold from the text
-        try:
-            threshold = int(tags[0].split("_")[1])
-        except:
-            print(
-                f"ERROR: event {event_id} with the relationship constraint for the value does not {v_type} follow the formatting guidelines."
-            )
-            break_loop = True
-            break
-
-        if threshold > 100:
-            print(
-                f"ERROR: event {event_id} has a relationship constraint for the value {v_type}, which is higher than the max value of a relationship."
-            )
-            break_loop = True
-            break
-
-        if threshold <= 0:
-            print(
-                f"ERROR: event {event_id} has a relationship constraint for the value {v_type}, which is lower than the min value of a relationship or 0."
-            )
-            break_loop = True
-            break
-
-        # each cat has to have relationships with this relationship value above the threshold
-        fulfilled = True
-        for inter_cat in group:
-            rel_above_threshold = []
-            group_ids = [cat.ID for cat in group]
-            relevant_relationships = list(
-                filter(
-                    lambda rel: rel.cat_to.ID in group_ids
-                                and rel.cat_to.ID != inter_cat.ID,
-                    list(inter_cat.relationships.values()),
-                )
-            )
-
-            # get the relationships depending on the current value type + threshold
-            if v_type == "romantic":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.romantic_love >= threshold
-                ]
-            elif v_type == "platonic":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.platonic_like >= threshold
-                ]
-            elif v_type == "dislike":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.dislike >= threshold
-                ]
-            elif v_type == "comfortable":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.comfortable >= threshold
-                ]
-            elif v_type == "jealousy":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.jealousy >= threshold
-                ]
-            elif v_type == "trust":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.trust >= threshold
-                ]
-            elif v_type == "admiration":
-                rel_above_threshold = [
-                    i for i in relevant_relationships if i.admiration >= threshold
-                ]
-
-            # if the lengths are not equal, one cat has not the relationship value which is needed to another cat of
-            # the event
-            if len(rel_above_threshold) + 1 != len(group):
-                fulfilled = False
-                break
-
-        if not fulfilled:
-            break_loop = True
-            break
-
-    # if break is used in the loop, the condition are not fulfilled
-    # and this event should not be added to the filtered list
-    if break_loop:
+    # each cat has to have relationships with the values above (or below) the thresholds
+    # to every other cat of the event
+    constraint = compile_constraint(filter_types, event_id)
+    if not constraint.valid:
         return False
-
-    return True
+    return all(
+        constraint.values_fulfilled(inter_cat, other_cat)
+        for inter_cat in group
+        for other_cat in group
+        if other_cat.ID != inter_cat.ID
+    )
 
 
 def gather_cat_objects(
@@ -1432,7 +1279,7 @@ def gather_cat_objects(
             out_set.add(event.patrol_apprentices[5])
         elif abbr == "clan":
             out_set.update(
-                [x for x in Cat.all_cats_list if not (x.dead or x.outside or x.exiled)]
+                Cat.membership.select(dead=False, outside=False, exiled=False)
             )
         elif abbr == "some_clan":  # 1 / 8 of clan cats are affected
             clan_cats = [
@@ -1807,17 +1654,147 @@ def name_repl(m, cat_dict):
     return cat_dict[m.group(0)][0]
 
 
+PRONOUN_TAG = re.compile(r"(?<!%)\{(.*?)}")
+
+# the kinds of pieces a text is split into by compile_text() and compile_event_text()
+TEXT_LITERAL = 0
+TEXT_PRONOUN = 1
+TEXT_NAME = 2
+TEXT_REPLACEMENT = 3
+
+# the abbreviations event_text_adjust() replaces after the names, besides the prey abbreviations
+EVENT_TEXT_REPLACEMENTS = (
+    "multi_cat",
+    "o_c_n",
+    "c_n",
+    "acc_plural",
+    "acc_singular",
+    "given_herb",
+)
+
+
+@lru_cache(maxsize=64)
+def _name_pattern(abbreviations: Tuple[str, ...]) -> re.Pattern:
+    return re.compile(
+        "|".join(r"(?<!\{)" + re.escape(abbr) + r"(?!\})" for abbr in abbreviations)
+    )
+
+
+@lru_cache(maxsize=4096)
+def compile_text(text: str, abbreviations: Tuple[str, ...]) -> Tuple[Tuple[int, object], ...]:
+    """
+    Split a text into the pieces process_text() fills in. Texts are only split once, after that
+    the pieces are reused.
+    :param text: The text, with pronoun tags and cat abbreviations in it
+    :param abbreviations: The cat abbreviations to look for, in the order they should be tried
+    :return: (kind, value) pairs. Literal text is kept as it is, pronoun tags are kept as their
+        match, and names as the abbreviation.
+    """
+    pieces = []
+    name_pattern = _name_pattern(abbreviations) if abbreviations else None
+
+    def add_literal(literal):
+        start = 0
+        if name_pattern:
+            for match in name_pattern.finditer(literal):
+                pieces.append((TEXT_LITERAL, literal[start : match.start()]))
+                pieces.append((TEXT_NAME, match.group(0)))
+                start = match.end()
+        pieces.append((TEXT_LITERAL, literal[start:]))
+
+    start = 0
+    for match in PRONOUN_TAG.finditer(text):
+        # this is left in the text as it is
+        if match.group(0) == "{insert}":
+            continue
+        add_literal(text[start : match.start()])
+        pieces.append((TEXT_PRONOUN, match))
+        start = match.end()
+    add_literal(text[start:])
+
+    return tuple(piece for piece in pieces if piece != (TEXT_LITERAL, ""))
+
+
+@lru_cache(maxsize=64)
+def _replacement_pattern(replacements: Tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(re.escape(abbr) for abbr in replacements))
+
+
+@lru_cache(maxsize=4096)
+def compile_event_text(
+        text: str, abbreviations: Tuple[str, ...], replacements: Tuple[str, ...]
+) -> Tuple[Tuple[int, object], ...]:
+    """
+    Split a text like compile_text(), and also split out the abbreviations that are replaced with
+    something other than a cat, e.g. "c_n".
+    :param text: The text, with pronoun tags and abbreviations in it
+    :param abbreviations: The cat abbreviations to look for, in the order they should be tried
+    :param replacements: The other abbreviations to look for, in the order they should be tried
+    :return: (kind, value) pairs, like compile_text(). The other abbreviations are kept as they are.
+    """
+    pattern = _replacement_pattern(replacements)
+    pieces = []
+    for kind, value in compile_text(text, abbreviations):
+        if kind != TEXT_LITERAL:
+            pieces.append((kind, value))
+            continue
+        start = 0
+        for match in pattern.finditer(value):
+            pieces.append((TEXT_LITERAL, value[start : match.start()]))
+            pieces.append((TEXT_REPLACEMENT, match.group(0)))
+            start = match.end()
+        pieces.append((TEXT_LITERAL, value[start:]))
+
+    return tuple(piece for piece in pieces if piece != (TEXT_LITERAL, ""))
+
+
 def process_text(text, cat_dict, raise_exception=False):
     """Add the correct name and pronouns into a string."""
-    adjust_text = re.sub(
-        r"(?<!%)\{(.*?)}", lambda x: pronoun_repl(x, cat_dict, raise_exception), text
-    )
+    adjusted = []
+    for kind, value in compile_text(text, tuple(cat_dict)):
+        if kind == TEXT_PRONOUN:
+            adjusted.append(pronoun_repl(value, cat_dict, raise_exception))
+        elif kind == TEXT_NAME:
+            adjusted.append(cat_dict[value][0])
+        else:
+            adjusted.append(value)
+    return "".join(adjusted)
 
-    name_patterns = [r"(?<!\{)" + re.escape(l) + r"(?!\})" for l in cat_dict]
-    adjust_text = re.sub(
-        "|".join(name_patterns), lambda x: name_repl(x, cat_dict), adjust_text
-    )
-    return adjust_text
+
+@lru_cache(maxsize=8)
+def _article_pattern(abbr: str) -> re.Pattern:
+    return re.compile(r"(?<!\S)a(\s+)(?=" + re.escape(abbr) + ")")
+
+
+def adjust_article(text: str, abbr: str, name) -> str:
+    """
+    Turns an "a" right in front of abbr into "an", if the name abbr will be replaced with starts with a vowel.
+    :param text: The text, with abbr still in it
+    :param abbr: The abbreviation, e.g. "c_n"
+    :param name: What abbr will be replaced with
+    """
+    if str(name).startswith(("A", "E", "I", "O", "U")):
+        return _article_pattern(abbr).sub(r"an\1", text)
+    return text
+
+
+ARTICLE_AT_END = re.compile(r"(?<!\S)a(\s+)$")
+
+
+def adjust_last_article(adjusted: List[str], name):
+    """
+    Like adjust_article(), for a text that is put together from pieces: turns an "a" at the end of
+    the pieces so far into "an", if the name that comes next starts with a vowel.
+    """
+    if not adjusted or not str(name).startswith(("A", "E", "I", "O", "U")):
+        return
+    match = ARTICLE_AT_END.search(adjusted[-1])
+    if match is None:
+        return
+    # the "a" has to be a word of its own
+    if match.start() == 0 and len(adjusted) > 1 and not adjusted[-2][-1:].isspace():
+        return
+    adjusted[-1] = adjusted[-1][: match.start()] + "an" + match.group(1)
 
 
 def adjust_list_text(list_of_items: List) -> str:
@@ -1850,14 +1827,27 @@ def adjust_list_text(list_of_items: List) -> str:
     return i18n.t("utility.items", count=len(list_of_items), item1=item1, item2=item2)
 
 
+def get_prey_lists() -> dict:
+    """Returns the prey text replacements of the current language."""
+    global PREY_LISTS, PREY_PATTERN
+    if langs["prey"] != i18n.config.get("locale"):
+        langs["prey"] = i18n.config.get("locale")
+        PREY_LISTS = load_lang_resource("patrols/prey_text_replacements.json")
+        PREY_PATTERN = re.compile(
+            "|".join(re.escape(abbr) for abbr in PREY_LISTS["abbreviations"])
+        )
+    return PREY_LISTS
+
+
 def adjust_prey_abbr(patrol_text):
     """
     checks for prey abbreviations and returns adjusted text
     """
-    global PREY_LISTS
-    if langs["prey"] != i18n.config.get("locale"):
-        langs["prey"] = i18n.config.get("locale")
-        PREY_LISTS = load_lang_resource("patrols/prey_text_replacements.json")
+    get_prey_lists()
+
+    # most texts don't mention prey at all
+    if not PREY_PATTERN.search(patrol_text):
+        return patrol_text
 
     for abbr in PREY_LISTS["abbreviations"]:
         if abbr in patrol_text:
@@ -2005,27 +1995,8 @@ def history_text_adjust(text, other_clan_name, clan, other_cat_rc=None):
     we want to handle history text on its own because it needs to preserve the pronoun tags and cat abbreviations.
     this is so that future pronoun changes or name changes will continue to be reflected in history
     """
-    vowels = ["A", "E", "I", "O", "U"]
-
     if "o_c_n" in text:
-        pos = 0
-        for x in range(text.count("o_c_n")):
-            if "o_c_n" in text:
-                for y in vowels:
-                    if str(other_clan_name).startswith(y):
-                        modify = text.split()
-                        if "o_c_n" in modify:
-                            pos = modify.index("o_c_n")
-                        if "o_c_n's" in modify:
-                            pos = modify.index("o_c_n's")
-                        if "o_c_n." in modify:
-                            pos = modify.index("o_c_n.")
-                        if modify[pos - 1] == "a":
-                            modify.remove("a")
-                            modify.insert(pos - 1, "an")
-                        text = " ".join(modify)
-                        break
-
+        text = adjust_article(text, "o_c_n", other_clan_name)
         text = text.replace("o_c_n", str(other_clan_name))
 
     if "c_n" in text:
@@ -2123,8 +2094,6 @@ def event_text_adjust(
     :param OtherClan other_clan: OtherClan object for other_clan (o_c_n), if present
     :param str chosen_herb: string of chosen_herb (chosen_herb), if present
     """
-    vowels = ["A", "E", "I", "O", "U"]
-
     if not text:
         text = "This should not appear, report as a bug please! Tried to adjust the text, but no text was provided."
         print("WARNING: Tried to adjust text, but no text was provided.")
@@ -2227,90 +2196,89 @@ def event_text_adjust(
         med = choice(get_alive_status_cats(Cat, ["medicine cat"], working=True))
         replace_dict["med_name"] = (str(med.name), choice(med.pronouns))
 
+    # the texts are only split into pieces once, so the abbreviations aren't searched for again
+    prey_lists = get_prey_lists()
+    replacements = EVENT_TEXT_REPLACEMENTS + tuple(prey_lists["abbreviations"])
+    pieces = compile_event_text(text, tuple(replace_dict), replacements)
+
     # assign all names and pronouns
-    if replace_dict:
-        text = process_text(text, replace_dict)
+    adjusted = []
+    replaced = set()
+    for kind, value in pieces:
+        if kind == TEXT_PRONOUN:
+            # without any cats, the pronoun tags are left as they are
+            adjusted.append(
+                pronoun_repl(value, replace_dict) if replace_dict else value.group(0)
+            )
+        elif kind == TEXT_NAME:
+            adjusted.append(replace_dict[value][0])
+        elif kind == TEXT_REPLACEMENT:
+            replaced.add(value)
+            adjusted.append(value)
+        else:
+            adjusted.append(value)
+    if not replaced:
+        return "".join(adjusted)
+
+    # what the other abbreviations are replaced with, and the name an "a" in front of them has to fit
+    replace_with = {}
+    article_names = {}
 
     # multi_cat
-    if "multi_cat" in text:
+    if "multi_cat" in replaced:
         name_list = []
         for _cat in multi_cats:
             name_list.append(str(_cat.name))
-        list_text = adjust_list_text(name_list)
-        text = text.replace("multi_cat", list_text)
+        replace_with["multi_cat"] = adjust_list_text(name_list)
 
     # other_clan_name
-    if "o_c_n" in text:
+    if "o_c_n" in replaced:
         other_clan_name = other_clan.name
-        pos = 0
-        for x in range(text.count("o_c_n")):
-            if "o_c_n" in text:
-                for y in vowels:
-                    if str(other_clan_name).startswith(y):
-                        modify = text.split()
-                        if "o_c_n" in modify:
-                            pos = modify.index("o_c_n")
-                        if "o_c_n's" in modify:
-                            pos = modify.index("o_c_n's")
-                        if "o_c_n." in modify:
-                            pos = modify.index("o_c_n.")
-                        if modify[pos - 1] == "a":
-                            modify.remove("a")
-                            modify.insert(pos - 1, "an")
-                        text = " ".join(modify)
-                        break
-
-        text = text.replace("o_c_n", str(other_clan_name) + "Clan")
+        article_names["o_c_n"] = other_clan_name
+        replace_with["o_c_n"] = str(other_clan_name) + "Clan"
 
     # clan_name
-    if "c_n" in text:
+    if "c_n" in replaced:
         try:
             clan_name = clan.name
         except AttributeError:
             clan_name = game.switches["clan_list"][0]
 
-        pos = 0
-        for x in range(text.count("c_n")):
-            if "c_n" in text:
-                for y in vowels:
-                    if str(clan_name).startswith(y):
-                        modify = text.split()
-                        if "c_n" in modify:
-                            pos = modify.index("c_n")
-                        if "c_n's" in modify:
-                            pos = modify.index("c_n's")
-                        if "c_n." in modify:
-                            pos = modify.index("c_n.")
-                        if modify[pos - 1] == "a":
-                            modify.remove("a")
-                            modify.insert(pos - 1, "an")
-                        text = " ".join(modify)
-                        break
-
-        text = text.replace("c_n", str(clan_name) + "Clan")
+        article_names["c_n"] = clan_name
+        replace_with["c_n"] = str(clan_name) + "Clan"
 
     # prey lists
-    text = adjust_prey_abbr(text)
+    for abbr in prey_lists["abbreviations"]:
+        if abbr in replaced:
+            chosen_list = prey_lists[prey_lists["abbreviations"][abbr]]
+            replace_with[abbr] = choice(chosen_list)
 
     # acc_plural (only works for main_cat's acc)
-    if "acc_plural" in text:
-        text = text.replace(
-            "acc_plural", i18n.t(f"cat.accessories.{main_cat.pelt.accessory}", count=2)
+    if "acc_plural" in replaced:
+        replace_with["acc_plural"] = i18n.t(
+            f"cat.accessories.{main_cat.pelt.accessory}", count=2
         )
 
     # acc_singular (only works for main_cat's acc)
-    if "acc_singular" in text:
-        text = text.replace(
-            "acc_singular",
-            i18n.t(f"cat.accessories.{main_cat.pelt.accessory}", count=1),
+    if "acc_singular" in replaced:
+        replace_with["acc_singular"] = i18n.t(
+            f"cat.accessories.{main_cat.pelt.accessory}", count=1
         )
 
-    if "given_herb" in text:
-        text = text.replace(
-            "given_herb", i18n.t(f"conditions.herbs.{chosen_herb}", count=2)
+    if "given_herb" in replaced:
+        replace_with["given_herb"] = i18n.t(
+            f"conditions.herbs.{chosen_herb}", count=2
         )
 
-    return text
+    text = []
+    for (kind, value), piece in zip(pieces, adjusted):
+        if kind == TEXT_REPLACEMENT:
+            if value in article_names:
+                adjust_last_article(text, article_names[value])
+            piece = replace_with[value]
+        text.append(piece)
+
+    return "".join(text)
 
 
 def leader_ceremony_text_adjust(
@@ -2641,23 +2609,45 @@ def clan_symbol_sprite(clan, return_string=False, force_light=False):
             )
 
 
-def generate_sprite(
+class CatSpriteKey(NamedTuple):
+    """
+    Everything that decides what a finished cat sprite looks like, see get_sprite_key().
+    Sprite names are given without the pose number at the end.
+    """
+
+    pose: str
+    base: str
+    tortie_patches: Tuple[Tuple[str, str], ...]  # (patch sprite, mask sprite) pairs
+    tint: str
+    white_patches: tuple
+    white_patches_tint: str
+    points: str
+    vitiligo: str
+    eyes: str
+    eyes2: str
+    scars: Tuple[str, ...]  # drawn below the line art
+    scars_blended: Tuple[str, ...]  # drawn after the skin
+    shaders: bool
+    dead: bool
+    df: bool
+    skin: str
+    accessory: str
+    fade_stage: str
+    reverse: bool
+
+
+def get_sprite_key(
         cat,
         life_state=None,
         scars_hidden=False,
         acc_hidden=False,
         always_living=False,
         no_not_working=False,
-) -> pygame.Surface:
+) -> Union[CatSpriteKey, None]:
     """
-    Generates the sprite for a cat, with optional arguments that will override certain things.
-
-    :param life_state: sets the age life_stage of the cat, overriding the one set by its age. Set to string.
-    :param scars_hidden: If True, doesn't display the cat's scars. If False, display cat scars.
-    :param acc_hidden: If True, hide the accessory. If false, show the accessory.
-    :param always_living: If True, always show the cat with living lineart
-    :param no_not_working: If true, never use the not_working lineart.
-                    If false, use the cat.not_working() to determine the no_working art.
+    Works out what the sprite of a cat looks like, without drawing it. Takes the same arguments as
+    generate_sprite(). Cats with the same key have identical sprites.
+    Returns None if the cat's pelt can't be drawn.
     """
 
     if life_state is not None:
@@ -2698,133 +2688,210 @@ def generate_sprite(
         else:
             cat_sprite = str(cat.pelt.cat_sprites[age])
 
-    new_sprite = pygame.Surface(
-        (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
-    )
+    fade_stage = None
+    if (
+            cat.pelt.opacity <= 97
+            and not cat.prevent_fading
+            and game.clan.clan_settings["fading"]
+            and dead
+    ):
+        fade_stage = "0"
+        if 80 >= cat.pelt.opacity > 45:
+            # Stage 1
+            fade_stage = "1"
+        elif cat.pelt.opacity <= 45:
+            # Stage 2
+            fade_stage = "2"
 
-    # generating the sprite
     try:
+        tortie_patches = ()
         if cat.pelt.name not in ["Tortie", "Calico"]:
-            new_sprite.blit(
-                sprites.sprites[
-                    cat.pelt.get_sprites_name() + cat.pelt.colour + cat_sprite
-                    ],
-                (0, 0),
-            )
+            base = cat.pelt.get_sprites_name() + cat.pelt.colour
         else:
-            # Base Coat
-            new_sprite.blit(
-                sprites.sprites[cat.pelt.tortiebase + cat.pelt.colour + cat_sprite],
-                (0, 0),
-            )
+            base = cat.pelt.tortiebase + cat.pelt.colour
 
-            # Create the patch image
             if cat.pelt.tortiepattern == "Single":
                 tortie_pattern = "SingleColour"
             else:
                 tortie_pattern = cat.pelt.tortiepattern
 
-            for pattern in cat.pelt.pattern:
-                patches = sprites.sprites[
-                    tortie_pattern + cat.pelt.tortiecolour + cat_sprite
-                    ].copy()
-                patches.blit(
-                    sprites.sprites["tortiemask" + pattern + cat_sprite],
-                    (0, 0),
-                    special_flags=pygame.BLEND_RGBA_MULT
-                )
+            tortie_patches = tuple(
+                (tortie_pattern + cat.pelt.tortiecolour, "tortiemask" + pattern)
+                for pattern in cat.pelt.pattern
+            )
+
+        scars = ()
+        scars_blended = ()
+        if not scars_hidden:
+            for scar in cat.pelt.scars:
+                if scar in cat.pelt.scars1:
+                    scars += ("scars" + scar,)
+                if scar in cat.pelt.scars3:
+                    scars += ("scars" + scar,)
+                if scar in cat.pelt.scars2:
+                    scars_blended += ("scars" + scar,)
+
+        accessory = None
+        if not acc_hidden:
+            if cat.pelt.accessory in cat.pelt.plant_accessories:
+                accessory = "acc_herbs" + cat.pelt.accessory
+            elif cat.pelt.accessory in cat.pelt.wild_accessories:
+                accessory = "acc_wild" + cat.pelt.accessory
+            elif cat.pelt.accessory in cat.pelt.collars:
+                accessory = "collars" + cat.pelt.accessory
+
+        return CatSpriteKey(
+            pose=cat_sprite,
+            base=base,
+            tortie_patches=tortie_patches,
+            tint=cat.pelt.tint,
+            white_patches=tuple(cat.pelt.white_patches) if cat.pelt.white_patches else (),
+            white_patches_tint=cat.pelt.white_patches_tint,
+            points=cat.pelt.points,
+            vitiligo=cat.pelt.vitiligo,
+            eyes="eyes" + cat.pelt.eye_colour,
+            eyes2=(
+                "eyes2" + cat.pelt.eye_colour2
+                if cat.pelt.eye_colour2 is not None
+                else None
+            ),
+            scars=scars,
+            scars_blended=scars_blended,
+            shaders=game.settings["shaders"],
+            dead=dead,
+            df=cat.df,
+            skin=cat.pelt.skin,
+            accessory=accessory,
+            fade_stage=fade_stage,
+            reverse=cat.pelt.reverse,
+        )
+    except (TypeError, KeyError):
+        logger.exception("Failed to load sprite")
+        return None
+
+
+def generate_sprite(
+        cat,
+        life_state=None,
+        scars_hidden=False,
+        acc_hidden=False,
+        always_living=False,
+        no_not_working=False,
+) -> pygame.Surface:
+    """
+    Generates the sprite for a cat, with optional arguments that will override certain things.
+    Many cats look exactly alike, so finished sprites are kept and shared between them. Don't draw on
+    the returned surface.
+
+    :param life_state: sets the age life_stage of the cat, overriding the one set by its age. Set to string.
+    :param scars_hidden: If True, doesn't display the cat's scars. If False, display cat scars.
+    :param acc_hidden: If True, hide the accessory. If false, show the accessory.
+    :param always_living: If True, always show the cat with living lineart
+    :param no_not_working: If true, never use the not_working lineart.
+                    If false, use the cat.not_working() to determine the no_working art.
+    """
+    key = get_sprite_key(
+        cat,
+        life_state=life_state,
+        scars_hidden=scars_hidden,
+        acc_hidden=acc_hidden,
+        always_living=always_living,
+        no_not_working=no_not_working,
+    )
+    new_sprite = sprites.get_cat_sprite(key)
+    if new_sprite is None:
+        new_sprite = draw_cat_sprite(key)
+    return new_sprite
+
+
+def draw_cat_sprite(key: Union[CatSpriteKey, None]) -> pygame.Surface:
+    """
+    Draws the cat sprite described by key and keeps it for generate_sprite().
+    Only uses the key, so it can be called outside the main thread.
+    """
+    if key is None:
+        return image_cache.load_image(f"sprites/error_placeholder.png").convert_alpha()
 
-                # Add patches onto cat.
-                new_sprite.blit(patches, (0, 0))
+    cat_sprite = key.pose
+    new_sprite = pygame.Surface(
+        (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
+    )
+
+    # generating the sprite
+    try:
+        # Base Coat
+        new_sprite.blit(sprites.sprites[key.base + cat_sprite], (0, 0))
+
+        # Create the patch image
+        for patch, mask in key.tortie_patches:
+            patches = sprites.sprites[patch + cat_sprite].copy()
+            patches.blit(
+                sprites.sprites[mask + cat_sprite],
+                (0, 0),
+                special_flags=pygame.BLEND_RGBA_MULT
+            )
+
+            # Add patches onto cat.
+            new_sprite.blit(patches, (0, 0))
 
         # TINTS
-        if (
-                cat.pelt.tint != "none"
-                and cat.pelt.tint in sprites.cat_tints["tint_colours"]
-        ):
+        if key.tint != "none" and key.tint in sprites.cat_tints["tint_colours"]:
             # Multiply with alpha does not work as you would expect - it just lowers the alpha of the
             # entire surface. To get around this, we first blit the tint onto a white background to dull it,
             # then blit the surface onto the sprite with pygame.BLEND_RGB_MULT
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-            tint.fill(tuple(sprites.cat_tints["tint_colours"][cat.pelt.tint]))
+            tint = sprites.tint_surface(sprites.cat_tints["tint_colours"][key.tint])
             new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-        if (
-                cat.pelt.tint != "none"
-                and cat.pelt.tint in sprites.cat_tints["dilute_tint_colours"]
-        ):
-            tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-            tint.fill(tuple(sprites.cat_tints["dilute_tint_colours"][cat.pelt.tint]))
+        if key.tint != "none" and key.tint in sprites.cat_tints["dilute_tint_colours"]:
+            tint = sprites.tint_surface(
+                sprites.cat_tints["dilute_tint_colours"][key.tint]
+            )
             new_sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
 
+        white_patches_tinted = (
+            key.white_patches_tint != "none"
+            and key.white_patches_tint in sprites.white_patches_tints["tint_colours"]
+        )
+
         # draw white patches
-        if cat.pelt.white_patches:
-            for white in cat.pelt.white_patches:
-                if cat.pelt.white_patches_tint != "none" and cat.pelt.white_patches_tint in sprites.white_patches_tints["tint_colours"]:
-                    white_patch = sprites.sprites[
-                        'white' + white + cat_sprite
-                        ].copy()
-
-                    # Apply tint to white patches.
-                    tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-                    tint.fill(
-                        tuple(
-                            sprites.white_patches_tints["tint_colours"][
-                                cat.pelt.white_patches_tint
-                            ]
-                        )
-                    )
-                    
-                    white_patch.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-                    new_sprite.blit(white_patch, (0, 0))
-                else:
-                    new_sprite.blit(sprites.sprites['white' + white + cat_sprite], (0, 0))
+        for white in key.white_patches:
+            if white_patches_tinted:
+                white_patch = sprites.sprites['white' + white + cat_sprite].copy()
+
+                # Apply tint to white patches.
+                tint = sprites.tint_surface(
+                    sprites.white_patches_tints["tint_colours"][key.white_patches_tint]
+                )
+
+                white_patch.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+                new_sprite.blit(white_patch, (0, 0))
+            else:
+                new_sprite.blit(sprites.sprites['white' + white + cat_sprite], (0, 0))
 
         # draw vit & points
 
-        if cat.pelt.points:
-            points = sprites.sprites["white" + cat.pelt.points + cat_sprite].copy()
-            if (
-                    cat.pelt.white_patches_tint != "none"
-                    and cat.pelt.white_patches_tint
-                    in sprites.white_patches_tints["tint_colours"]
-            ):
-                tint = pygame.Surface((sprites.size, sprites.size)).convert_alpha()
-                tint.fill(
-                    tuple(
-                        sprites.white_patches_tints["tint_colours"][
-                            cat.pelt.white_patches_tint
-                        ]
-                    )
+        if key.points:
+            points = sprites.sprites["white" + key.points + cat_sprite].copy()
+            if white_patches_tinted:
+                tint = sprites.tint_surface(
+                    sprites.white_patches_tints["tint_colours"][key.white_patches_tint]
                 )
                 points.blit(tint, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
             new_sprite.blit(points, (0, 0))
 
-        if cat.pelt.vitiligo:
-            new_sprite.blit(
-                sprites.sprites["white" + cat.pelt.vitiligo + cat_sprite], (0, 0)
-            )
+        if key.vitiligo:
+            new_sprite.blit(sprites.sprites["white" + key.vitiligo + cat_sprite], (0, 0))
 
         # draw eyes & scars1
-        eyes = sprites.sprites["eyes" + cat.pelt.eye_colour + cat_sprite].copy()
-        if cat.pelt.eye_colour2 != None:
-            eyes.blit(
-                sprites.sprites["eyes2" + cat.pelt.eye_colour2 + cat_sprite], (0, 0)
-            )
+        eyes = sprites.sprites[key.eyes + cat_sprite].copy()
+        if key.eyes2 is not None:
+            eyes.blit(sprites.sprites[key.eyes2 + cat_sprite], (0, 0))
         new_sprite.blit(eyes, (0, 0))
 
-        if not scars_hidden:
-            for scar in cat.pelt.scars:
-                if scar in cat.pelt.scars1:
-                    new_sprite.blit(
-                        sprites.sprites["scars" + scar + cat_sprite], (0, 0)
-                    )
-                if scar in cat.pelt.scars3:
-                    new_sprite.blit(
-                        sprites.sprites["scars" + scar + cat_sprite], (0, 0)
-                    )
+        for scar in key.scars:
+            new_sprite.blit(sprites.sprites[scar + cat_sprite], (0, 0))
 
         # draw line art
-        if game.settings["shaders"] and not dead:
+        if key.shaders and not key.dead:
             new_sprite.blit(
                 sprites.sprites["shaders" + cat_sprite],
                 (0, 0),
@@ -2832,56 +2899,30 @@ def generate_sprite(
             )
             new_sprite.blit(sprites.sprites["lighting" + cat_sprite], (0, 0))
 
-        if not dead:
+        if not key.dead:
             new_sprite.blit(sprites.sprites["lines" + cat_sprite], (0, 0))
-        elif cat.df:
+        elif key.df:
             new_sprite.blit(sprites.sprites["lineartdf" + cat_sprite], (0, 0))
-        elif dead:
+        else:
             new_sprite.blit(sprites.sprites["lineartdead" + cat_sprite], (0, 0))
         # draw skin and scars2
         blendmode = pygame.BLEND_RGBA_MIN
-        new_sprite.blit(sprites.sprites["skin" + cat.pelt.skin + cat_sprite], (0, 0))
+        new_sprite.blit(sprites.sprites["skin" + key.skin + cat_sprite], (0, 0))
 
-        if not scars_hidden:
-            for scar in cat.pelt.scars:
-                if scar in cat.pelt.scars2:
-                    new_sprite.blit(
-                        sprites.sprites["scars" + scar + cat_sprite],
-                        (0, 0),
-                        special_flags=blendmode,
-                    )
+        for scar in key.scars_blended:
+            new_sprite.blit(
+                sprites.sprites[scar + cat_sprite],
+                (0, 0),
+                special_flags=blendmode,
+            )
 
         # draw accessories
-        if not acc_hidden:
-            if cat.pelt.accessory in cat.pelt.plant_accessories:
-                new_sprite.blit(
-                    sprites.sprites["acc_herbs" + cat.pelt.accessory + cat_sprite],
-                    (0, 0),
-                )
-            elif cat.pelt.accessory in cat.pelt.wild_accessories:
-                new_sprite.blit(
-                    sprites.sprites["acc_wild" + cat.pelt.accessory + cat_sprite],
-                    (0, 0),
-                )
-            elif cat.pelt.accessory in cat.pelt.collars:
-                new_sprite.blit(
-                    sprites.sprites["collars" + cat.pelt.accessory + cat_sprite], (0, 0)
-                )
+        if key.accessory:
+            new_sprite.blit(sprites.sprites[key.accessory + cat_sprite], (0, 0))
 
         # Apply fading fog
-        if (
-                cat.pelt.opacity <= 97
-                and not cat.prevent_fading
-                and game.clan.clan_settings["fading"]
-                and dead
-        ):
-            stage = "0"
-            if 80 >= cat.pelt.opacity > 45:
-                # Stage 1
-                stage = "1"
-            elif cat.pelt.opacity <= 45:
-                # Stage 2
-                stage = "2"
+        if key.fade_stage is not None:
+            stage = key.fade_stage
 
             new_sprite.blit(
                 sprites.sprites["fademask" + stage + cat_sprite],
@@ -2889,7 +2930,7 @@ def generate_sprite(
                 special_flags=pygame.BLEND_RGBA_MULT,
             )
 
-            if cat.df:
+            if key.df:
                 temp = sprites.sprites["fadedf" + stage + cat_sprite].copy()
                 temp.blit(new_sprite, (0, 0))
                 new_sprite = temp
@@ -2899,9 +2940,11 @@ def generate_sprite(
                 new_sprite = temp
 
         # reverse, if assigned so
-        if cat.pelt.reverse:
+        if key.reverse:
             new_sprite = pygame.transform.flip(new_sprite, True, False)
 
+        sprites.store_cat_sprite(key, new_sprite)
+
     except (TypeError, KeyError):
         logger.exception("Failed to load sprite")
 
@@ -2994,6 +3037,7 @@ langs = {"snippet": None, "prey": None}
 
 SNIPPETS = None
 PREY_LISTS = None
+PREY_PATTERN = None
 
 with open(
         os.path.normpath("resources/dicts/backstories.json"), "r", encoding="utf-8"
@@ -8,6 +8,8 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
 from scripts.cat.enums import CatAgeEnum
+from scripts.cat.membership import MembershipIndex
+from scripts.cat_relations.inheritance import FamilyIndex
 from scripts.cat_relations.relationship import Relationship
 
 class TestCreationAge(unittest.TestCase):
@@ -87,6 +89,136 @@ class TestRelativesFunction(unittest.TestCase):
         self.assertFalse(kit.is_grandparent(grand_parent))
         self.assertTrue(grand_parent.is_grandparent(kit))
 
+    # test that is_cousin returns True for kits of siblings and False otherwise
+    def test_is_cousin(self):
+        grand_parent = Cat()
+        sibling1 = Cat(parent1=grand_parent.ID)
+        sibling2 = Cat(parent1=grand_parent.ID)
+        kit1 = Cat(parent1=sibling1.ID)
+        kit2 = Cat(parent1=sibling2.ID)
+        self.assertFalse(kit1.is_cousin(sibling2))
+        self.assertTrue(kit1.is_cousin(kit2))
+        self.assertTrue(kit2.is_cousin(kit1))
+
+    # test that setting an adoptive parent makes the cat a sibling of the parent's kits
+    def test_adoptive_sibling(self):
+        parent = Cat()
+        kit = Cat(parent1=parent.ID)
+        adopted_kit = Cat()
+        self.assertFalse(kit.is_sibling(adopted_kit))
+
+        adopted_kit.set_adoptive_parent(parent)
+        self.assertTrue(parent.is_parent(adopted_kit))
+        self.assertTrue(kit.is_sibling(adopted_kit))
+        self.assertTrue(adopted_kit.is_sibling(kit))
+
+
+class TestFamilyIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FamilyIndex()
+
+    def test_update_cat(self):
+        parent1 = Cat()
+        parent2 = Cat()
+        kit = Cat(parent1=parent1.ID)
+        self.index.update_cat(kit)
+        self.assertEqual(self.index.get_kits(parent1.ID), {kit.ID})
+
+        kit.adoptive_parents.append(parent2.ID)
+        self.index.update_cat(kit)
+        self.assertEqual(self.index.get_kits(parent1.ID, parent2.ID), {kit.ID})
+
+        kit.adoptive_parents.remove(parent2.ID)
+        self.index.update_cat(kit)
+        self.assertEqual(self.index.get_kits(parent2.ID), set())
+
+    def test_remove_cat(self):
+        parent = Cat()
+        kit = Cat(parent1=parent.ID)
+        self.index.update_cat(parent)
+        self.index.update_cat(kit)
+        self.index.remove_cat(kit.ID)
+        self.assertEqual(self.index.get_kits(parent.ID), set())
+
+    def test_in_order(self):
+        parent = Cat()
+        kits = [Cat(parent1=parent.ID) for _ in range(3)]
+        for kit in reversed(kits):
+            self.index.update_cat(kit)
+        all_cats = {kit.ID: kit for kit in kits[1:]}
+        self.assertEqual(
+            self.index.in_order(self.index.get_kits(parent.ID), all_cats),
+            [kits[2].ID, kits[1].ID],
+        )
+
+
+class TestMembershipIndex(unittest.TestCase):
+    def test_cats_move_when_they_change(self):
+        warrior = Cat(moons=30, status="warrior")
+        apprentice = Cat(moons=8, status="apprentice")
+        warrior_ids = [
+            cat.ID for cat in Cat.membership.select(dead=False, statuses=["warrior"])
+        ]
+        self.assertIn(warrior.ID, warrior_ids)
+        self.assertNotIn(apprentice.ID, warrior_ids)
+
+        living = Cat.membership.count(dead=False, outside=False)
+        warrior.dead = True
+        warrior.df = True
+        self.assertEqual(Cat.membership.count(dead=False, outside=False), living - 1)
+        self.assertIn(warrior, Cat.membership.select(dead=True, df=True))
+
+        apprentice.status = "warrior"
+        self.assertIn(
+            apprentice, Cat.membership.select(dead=False, statuses=["warrior"])
+        )
+
+        apprentice.outside = True
+        apprentice.exiled = True
+        self.assertIn(apprentice, Cat.membership.select(dead=False, exiled=True))
+        self.assertNotIn(apprentice, Cat.membership.select(dead=False, outside=False))
+
+    def test_select_keeps_all_cats_order(self):
+        index = MembershipIndex()
+        cats = [Cat(moons=30, status="warrior") for _ in range(3)]
+        all_cats = {cat.ID: cat for cat in cats}
+        index.rebuild(all_cats)
+
+        cats[0].status = "deputy"
+        index.update_cat(cats[0])
+        self.assertEqual(index.select(statuses=["warrior"]), cats[1:])
+        cats[0].status = "warrior"
+        index.update_cat(cats[0])
+        self.assertEqual(index.select(statuses=["warrior"]), cats)
+
+        index.remove_cat(cats[1].ID)
+        self.assertEqual(index.select(), [cats[0], cats[2]])
+        self.assertEqual(index.count(statuses=["warrior"]), 2)
+
+    def test_random_cat(self):
+        index = MembershipIndex()
+        cats = [Cat(moons=30, status="warrior") for _ in range(3)]
+        index.rebuild({cat.ID: cat for cat in cats})
+
+        index.remove_cat(cats[0].ID)
+        self.assertEqual(sorted(index.ids), sorted([cats[1].ID, cats[2].ID]))
+        for _ in range(20):
+            self.assertIs(index.random_cat(exclude=cats[1].ID), cats[2])
+
+        index.remove_cat(cats[2].ID)
+        self.assertIsNone(index.random_cat(exclude=cats[1].ID))
+        self.assertIs(index.random_cat(), cats[1])
+
+    def test_random_matching(self):
+        index = MembershipIndex()
+        cats = [Cat(moons=30, status="warrior") for _ in range(3)]
+        index.rebuild({cat.ID: cat for cat in cats})
+
+        for _ in range(20):
+            self.assertIs(index.random_matching(lambda cat: cat is cats[2]), cats[2])
+        self.assertIsNone(index.random_matching(lambda cat: False))
+        self.assertIsNone(MembershipIndex().random_matching(lambda cat: True))
+
 
 class TestPossibleMateFunction(unittest.TestCase):
 
@@ -291,6 +423,71 @@ class TestPossibleMateFunction(unittest.TestCase):
         # self.assertTrue(former_appr.is_potential_mate(mentor,True,True))
 
 
+class TestRelationshipStore(unittest.TestCase):
+    def test_default_relationship_is_created_on_lookup(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add_default(cat2.ID)
+
+        self.assertIn(cat2.ID, cat1.relationships)
+        self.assertIsNone(cat1.relationships.peek(cat2.ID))
+        self.assertEqual(cat1.relationships.loaded_values(), [])
+
+        relationship = cat1.relationships[cat2.ID]
+        self.assertIsInstance(relationship, Relationship)
+        self.assertEqual(relationship.cat_from, cat1)
+        self.assertEqual(relationship.cat_to, cat2)
+        self.assertEqual(relationship.platonic_like, 0)
+        self.assertIs(cat1.relationships[cat2.ID], relationship)
+        self.assertEqual(cat1.relationships.loaded_values(), [relationship])
+
+    def test_new_cat_relationships_are_default(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat2.create_relationships_new_cat()
+
+        self.assertIn(cat1.ID, cat2.relationships)
+        self.assertIn(cat2.ID, cat1.relationships)
+        self.assertIsNone(cat2.relationships.peek(cat1.ID))
+        self.assertIsNone(cat1.relationships.peek(cat2.ID))
+
+    def test_set_and_delete(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        relationship = Relationship(cat1, cat2, platonic_like=20)
+        cat1.relationships[cat2.ID] = relationship
+        self.assertIs(cat1.relationships.peek(cat2.ID), relationship)
+        self.assertEqual(list(cat1.relationships.values()), [relationship])
+
+        del cat1.relationships[cat2.ID]
+        self.assertNotIn(cat2.ID, cat1.relationships)
+        self.assertEqual(len(cat1.relationships), 0)
+
+    def test_default_relationship_to_removed_cat_is_skipped(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat3 = Cat()
+        cat1.relationships.add_default(cat2.ID)
+        cat1.relationships.add_default(cat3.ID)
+        Cat.all_cats.pop(cat2.ID)
+
+        with patch.object(Cat, "load_faded_cat") as load_faded_cat:
+            self.assertEqual(list(cat1.relationships), [cat3.ID])
+            self.assertEqual(len(cat1.relationships), 1)
+            self.assertNotIn(cat2.ID, cat1.relationships)
+            self.assertEqual(
+                [rel.cat_to for rel in cat1.relationships.values()], [cat3]
+            )
+            with self.assertRaises(KeyError):
+                cat1.relationships[cat2.ID]
+        load_faded_cat.assert_not_called()
+
+        cat1.relationships.discard_default(cat2.ID)
+        cat1.relationships.discard_default(cat3.ID)
+        self.assertNotIn(cat2.ID, cat1.relationships)
+        self.assertIn(cat3.ID, cat1.relationships)
+
+
 class TestMateFunctions(unittest.TestCase):
 
     # test that set_mate adds the mate's ID to the cat's mate list
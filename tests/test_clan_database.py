@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import ujson
+
+from scripts.game_structure.clan_database import ClanDatabase
+from scripts.game_structure.history_store import get_history_store
+
+
+class TestClanDatabase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.database = ClanDatabase(os.path.join(self.directory, "clan.db"))
+
+    def tearDown(self):
+        self.database.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_put_get_delete(self):
+        self.database.put("conditions", "1", {"injuries": {"bruises": {}}})
+
+        self.assertEqual(
+            self.database.get("conditions", "1"), {"injuries": {"bruises": {}}}
+        )
+        self.assertIsNone(self.database.get("conditions", "2"))
+
+        self.database.delete("conditions", "1")
+        self.assertIsNone(self.database.get("conditions", "1"))
+
+    def test_replace_all_keeps_order(self):
+        self.database.replace_all("cats", [("3", {"ID": "3"}), ("1", {"ID": "1"})])
+        self.database.replace_all(
+            "cats", [("2", {"ID": "2"}), ("10", {"ID": "10"}), ("1", {"ID": "1"})]
+        )
+
+        self.assertEqual(
+            [cat["ID"] for cat in self.database.iter_records("cats")], ["2", "10", "1"]
+        )
+
+    def test_transaction_rolls_back(self):
+        self.database.put("history", "1", {"died_by": []})
+
+        with self.assertRaises(RuntimeError):
+            with self.database.transaction():
+                self.database.put("history", "1", {"died_by": ["a fox"]})
+                self.database.put("history", "2", {"died_by": []})
+                raise RuntimeError
+
+        self.assertEqual(self.database.get("history", "1"), {"died_by": []})
+        self.assertIsNone(self.database.get("history", "2"))
+
+    def test_unchanged_records_are_skipped(self):
+        self.database.put("conditions", "1", {"injuries": {}})
+        self.database.replace_all("cats", [("1", {"ID": "1"}), ("2", {"ID": "2"})])
+        changes = self.database.connection.total_changes
+
+        self.database.put("conditions", "1", {"injuries": {}})
+        self.database.replace_all("cats", [("1", {"ID": "1"}), ("2", {"ID": "2"})])
+        self.assertEqual(self.database.connection.total_changes, changes)
+
+        self.database.replace_all("cats", [("2", {"ID": "2"}), ("1", {"ID": "1"})])
+        self.assertEqual(
+            [cat["ID"] for cat in self.database.iter_records("cats")], ["2", "1"]
+        )
+
+    def test_rolled_back_records_are_written_again(self):
+        with self.assertRaises(RuntimeError):
+            with self.database.transaction():
+                self.database.put("history", "1", {"died_by": []})
+                raise RuntimeError
+
+        self.database.put("history", "1", {"died_by": []})
+        self.assertEqual(self.database.get("history", "1"), {"died_by": []})
+
+    def test_delete_all_except(self):
+        for record_id in ("1", "2", "3"):
+            self.database.put("relationships", record_id, [])
+
+        self.database.delete_all_except("relationships", ["2"])
+
+        self.assertEqual(
+            [record_id for record_id, _ in self.database.iter_items("relationships")],
+            ["2"],
+        )
+
+    def test_import_and_export_files(self):
+        os.makedirs(os.path.join(self.directory, "history"))
+        os.makedirs(os.path.join(self.directory, "faded_cats"))
+        with open(
+            os.path.join(self.directory, "history", "4_history.json"), "w"
+        ) as write_file:
+            write_file.write(ujson.dumps({"died_by": []}))
+        with open(os.path.join(self.directory, "faded_cats", "5.json"), "w") as write_file:
+            write_file.write(ujson.dumps({"ID": "5", "faded_offspring": []}))
+
+        self.database.import_files(self.directory)
+        self.assertEqual(self.database.get("history", "4"), {"died_by": []})
+        self.assertEqual(self.database.get("faded_cats", "5")["ID"], "5")
+
+        exported = os.path.join(self.directory, "exported")
+        written = {}
+        self.database.export_files(
+            exported, lambda path, data: written.update({path: data})
+        )
+        self.assertEqual(
+            written,
+            {
+                os.path.join(exported, "faded_cats", "5.json"): {
+                    "ID": "5",
+                    "faded_offspring": [],
+                },
+            },
+        )
+        self.assertEqual(get_history_store(exported).get("4"), {"died_by": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat_relations.constraints import compile_constraint
+from scripts.cat_relations.relationship import Relationship
+
+
+class TestCompileConstraint(unittest.TestCase):
+    def test_same_tags_are_compiled_once(self):
+        self.assertIs(
+            compile_constraint(["siblings", "romantic_40"]),
+            compile_constraint(["siblings", "romantic_40"]),
+        )
+
+    def test_thresholds(self):
+        constraint = compile_constraint(["platonic_20", "dislike_20_lower"])
+        cat1 = Cat()
+        cat2 = Cat()
+        relationship = Relationship(cat1, cat2, platonic_like=30, dislike=10)
+        self.assertTrue(constraint.fulfilled_by(cat1, cat2, relationship))
+
+        relationship.dislike = 30
+        self.assertFalse(constraint.fulfilled_by(cat1, cat2, relationship))
+
+    def test_malformed_tags_are_reported_once(self):
+        output = StringIO()
+        with redirect_stdout(output):
+            constraint = compile_constraint(["trust_lots"], "test_interaction")
+            compile_constraint(["trust_lots"], "test_interaction")
+        self.assertFalse(constraint.valid)
+        self.assertEqual(output.getvalue().count("ERROR"), 1)
+
+    def test_mates(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.mate.append(cat2.ID)
+        cat2.mate.append(cat1.ID)
+        self.assertTrue(compile_constraint(["mates"]).fulfilled_by(cat1, cat2))
+        self.assertFalse(compile_constraint(["not_mates"]).fulfilled_by(cat1, cat2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.game_structure.event_journal import (
+    get_moon_path,
+    load_moon_events,
+    saved_moons,
+)
+
+
+class TestEventJournal(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write(self, path, events):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as write_file:
+            write_file.write(ujson.dumps(events))
+
+    def test_moons_are_loaded_on_their_own(self):
+        self.write(get_moon_path(self.directory, 9), [{"text": "nine", "types": ["misc"]}])
+        self.write(get_moon_path(self.directory, 10), [{"text": "ten", "types": ["misc"]}])
+
+        self.assertEqual(saved_moons(self.directory), [9, 10])
+        self.assertEqual(
+            [event.text for event in load_moon_events(self.directory, 9, Cat)], ["nine"]
+        )
+        self.assertEqual(load_moon_events(self.directory, 11, Cat), [])
+
+    def test_old_events_file_is_read_until_there_are_moon_files(self):
+        self.write(
+            os.path.join(self.directory, "events.json"),
+            [{"text": "old", "types": ["misc"]}],
+        )
+        self.assertEqual(
+            [event.text for event in load_moon_events(self.directory, 4, Cat)], ["old"]
+        )
+
+        self.write(get_moon_path(self.directory, 5), [])
+        self.assertEqual(load_moon_events(self.directory, 4, Cat), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
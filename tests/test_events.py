@@ -0,0 +1,54 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.events import Events
+from scripts.game_structure.game_essentials import game
+
+
+class TestOneMoonDeadCats(unittest.TestCase):
+    def setUp(self):
+        self.old_clan = game.clan
+        game.clan = Clan(name="test", biome="Forest", camp_bg="camp1")
+        game.clan.clan_settings["fading"] = False
+        game.just_died.clear()
+        self.events = Events()
+
+    def tearDown(self):
+        game.clan = self.old_clan
+        game.just_died.clear()
+
+    def test_dead_cats_age_without_thinking(self):
+        cat = Cat(moons=30, status="warrior")
+        cat.dead = True
+        cat.dead_for = 3
+        cat.thought = "Is watching over the Clan"
+
+        self.events.one_moon_dead_cats([cat])
+
+        self.assertEqual(cat.dead_for, 4)
+        self.assertEqual(cat.thought, "Is watching over the Clan")
+        self.assertTrue(cat.thought_pending)
+
+        cat.thoughts()
+        self.assertFalse(cat.thought_pending)
+
+    def test_cats_who_just_died_keep_their_death_thought(self):
+        cat = Cat(moons=30, status="warrior")
+        cat.dead = True
+        cat.thought = "Was startled to find themselves in Silverpelt"
+        game.just_died.append(cat.ID)
+
+        self.events.one_moon_dead_cats([cat])
+
+        self.assertEqual(cat.moons, 31)
+        self.assertEqual(cat.dead_for, 0)
+        self.assertFalse(cat.thought_pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
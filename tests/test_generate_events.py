@@ -0,0 +1,60 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.events_module.generate_events import ShortEventCatalogue
+from scripts.events_module.short.short_event import ShortEvent
+from scripts.game_structure.game_essentials import game
+
+
+class TestShortEventCatalogue(unittest.TestCase):
+    def setUp(self):
+        self.old_clan = game.clan
+        game.clan = Clan(name="test", biome="Forest", camp_bg="camp1")
+        game.clan.current_season = "Leaf-bare"
+
+        self.catalogue = ShortEventCatalogue(
+            [
+                ShortEvent(event_id="anywhere"),
+                ShortEvent(event_id="mountain", location=["mountainous"]),
+                ShortEvent(event_id="forest_camp2", location=["forest:camp2"]),
+                ShortEvent(event_id="greenleaf", season=["greenleaf"]),
+                ShortEvent(event_id="war", sub_type=["war"]),
+                ShortEvent(event_id="cruel", tags=["cruel_season"]),
+                ShortEvent(event_id="kits", m_c={"age": ["kitten"]}),
+                ShortEvent(event_id="warriors", m_c={"status": ["warrior"]}),
+                ShortEvent(event_id="leaf_bare", season=["leaf-bare"]),
+            ]
+        )
+        self.cat = Cat(moons=30, status="warrior")
+
+    def tearDown(self):
+        game.clan = self.old_clan
+
+    def test_candidates(self):
+        self.assertEqual(
+            [event.event_id for event in self.catalogue.candidates([], self.cat)],
+            ["anywhere", "warriors", "leaf_bare"],
+        )
+        self.assertEqual(
+            [event.event_id for event in self.catalogue.candidates(["war"], self.cat)],
+            ["war"],
+        )
+
+    def test_candidates_follow_the_clan(self):
+        self.catalogue.candidates([], self.cat)
+        game.clan.current_season = "Greenleaf"
+        game.clan.game_mode = "cruel_season"
+
+        self.assertEqual(
+            [event.event_id for event in self.catalogue.candidates([], self.cat)],
+            ["anywhere", "greenleaf", "cruel", "warriors"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,11 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat, Relationship
 from scripts.cat.skills import Skill, SkillPath
-from scripts.events_module.relationship.group_events import GroupEvents, GroupInteraction
+from scripts.events_module.relationship.group_events import (
+    CatCandidates,
+    GroupEvents,
+    GroupInteraction,
+)
 
 class MainCatFiltering(unittest.TestCase):
     def test_main_cat_status_one(self):
@@ -317,132 +321,123 @@ class OtherFiltering(unittest.TestCase):
 
 
 class Abbreviations(unittest.TestCase):
-    def test_get_abbreviation_possibilities_all(self):
+    def test_fitting_cats(self):
         # given
-        main_cat = Cat()
-        main_cat.status = "warrior"
-
         random1 = Cat()
         random1.status = "warrior"
         random2 = Cat()
         random2.status = "warrior"
         random3 = Cat()
-        random3.status = "warrior"
+        random3.status = "medicine cat"
 
         interaction1 = GroupInteraction("1")
         interaction1.status_constraint = {"r_c1": ["warrior"]}
 
         interaction2 = GroupInteraction("2")
-        interaction2.status_constraint = {"r_c1": ["healer", "warrior"]}
-        
+        interaction2.status_constraint = {"r_c1": ["medicine cat"]}
+
         # when
-        all_interactions = [interaction1, interaction2]
-        interaction_cats = [random1, random2]
-        abbreviations_possibilities, cat_abbreviations_counter = GroupEvents().get_abbreviations_possibilities(
-            all_interactions, 3, interaction_cats
-        )
+        candidates = CatCandidates([random1, random2, random3])
 
         # then
-        self.assertEqual(len(abbreviations_possibilities), 2)
-        # all cats would fit in
-        self.assertEqual(len(abbreviations_possibilities["1"]), 3)
-        self.assertEqual(len(abbreviations_possibilities["2"]), 3)
+        self.assertEqual(candidates.fitting(interaction1, "r_c1"), [random1.ID, random2.ID])
+        self.assertEqual(candidates.fitting(interaction1, "r_c2"), [random1.ID, random2.ID, random3.ID])
+        self.assertEqual(candidates.fitting(interaction2, "r_c1"), [random3.ID])
 
-    def test_get_abbreviation_possibilities_not_all(self):
+    def test_assign_abbreviations_cats(self):
         # given
         main_cat = Cat()
         main_cat.status = "warrior"
-
         random1 = Cat()
         random1.status = "warrior"
         random2 = Cat()
-        random2.status = "warrior"
-        random3 = Cat()
-        random3.status = "medicine cat"
+        random2.status = "medicine cat"
+        abbreviations_cat_id = {
+            "m_c": main_cat.ID,
+            "r_c1": None,
+            "r_c2": None
+        }
 
-        interaction1 = GroupInteraction("1")
-        interaction1.status_constraint = {"r_c1": ["warrior"]}
+        # both cats fit r_c1, but only the medicine cat fits r_c2, so the warrior has to take r_c1
+        interaction = GroupInteraction("1")
+        interaction.status_constraint = {
+            "r_c1": ["warrior", "medicine cat"],
+            "r_c2": ["medicine cat"]
+        }
 
-        interaction2 = GroupInteraction("2")
-        interaction2.status_constraint = {"r_c1": ["medicine cat"]}
-        
         # when
-        all_interactions = [interaction1, interaction2]
-        interaction_cats = [random1, random2, random3]
-        abbreviations_possibilities, cat_abbreviations_counter = GroupEvents().get_abbreviations_possibilities(
-            all_interactions, 3, interaction_cats
+        found = GroupEvents().assign_abbreviations_cats(
+            interaction, CatCandidates([random1, random2]), abbreviations_cat_id
         )
 
         # then
-        self.assertEqual(len(abbreviations_possibilities), 2)
-        # all cats would fit in
-        self.assertEqual(len(abbreviations_possibilities["1"]["r_c1"]), 2)
-        self.assertEqual(len(abbreviations_possibilities["2"]["r_c1"]), 1)
+        self.assertTrue(found)
+        self.assertEqual(abbreviations_cat_id["r_c1"], random1.ID)
+        self.assertEqual(abbreviations_cat_id["r_c2"], random2.ID)
 
-    def test_remove_abbreviations_missing_cats(self):
+    def test_assign_abbreviations_cats_not_possible(self):
         # given
-        abbreviations_possibilities = {
-            "1": {
-                "r_c1": ["1", "2"],
-                "r_c2": ["1", "2"],
-            },
-            "2": {
-                "r_c1": ["1", "2"],
-                "r_c2": [],
-            },
+        main_cat = Cat()
+        random1 = Cat()
+        random1.status = "medicine cat"
+        random2 = Cat()
+        random2.status = "warrior"
+        abbreviations_cat_id = {
+            "m_c": main_cat.ID,
+            "r_c1": None,
+            "r_c2": None
         }
-        
+
+        interaction = GroupInteraction("1")
+        interaction.status_constraint = {
+            "r_c1": ["medicine cat"],
+            "r_c2": ["medicine cat"]
+        }
+
         # when
-        new_possibilities = GroupEvents().remove_abbreviations_missing_cats(
-            abbreviations_possibilities
+        found = GroupEvents().assign_abbreviations_cats(
+            interaction, CatCandidates([random1, random2]), abbreviations_cat_id
         )
 
         # then
-        self.assertNotEqual(len(abbreviations_possibilities), len(new_possibilities))
-        self.assertIn("1", new_possibilities)
-        self.assertNotIn("2", new_possibilities)
+        self.assertFalse(found)
+        self.assertIsNone(abbreviations_cat_id["r_c1"])
 
-    def test_set_abbreviations_cats(self):
+    def test_assign_abbreviations_cats_keeps_default_relationships(self):
         # given
         main_cat = Cat()
-        main_cat.status = "warrior"
+        others = [Cat() for _ in range(4)]
+        for other in others:
+            main_cat.relationships.add_default(other.ID)
+            other.relationships.add_default(main_cat.ID)
+        liked = others[-1]
+        main_cat.relationships[liked.ID] = Relationship(
+            main_cat, liked, False, False, 0, 50, 0, 0, 0, 0, 0
+        )
         abbreviations_cat_id = {
             "m_c": main_cat.ID,
-            "r_c1": None,
-            "r_c2": None
+            "r_c1": None
         }
 
-        random1 = Cat()
-        random1.status = "warrior"
-        random2 = Cat()
-        random2.status = "warrior"
-        random3 = Cat()
-        random3.status = "medicine cat"
+        # only the liked cat fulfills the constraint, the others still have default values
+        interaction = GroupInteraction("1")
+        interaction.relationship_constraint = {
+            "m_c_to_r_c1": ["platonic_30"]
+        }
 
         # when
-        interaction_cats = [random1, random2, random3]
-        cat_abbreviations_counter = {
-            random1.ID: {
-                "r_c1": 2,
-                "r_c2": 2
-            },
-            random2.ID: {
-                "r_c1": 2,
-                "r_c2": 2
-            },
-            random3.ID: {
-                "r_c1": 1,
-                "r_c2": 2
-            }
-        }
-        abbreviations_cat_id = GroupEvents().set_abbreviations_cats(
-            interaction_cats, abbreviations_cat_id, cat_abbreviations_counter)
+        found = GroupEvents().assign_abbreviations_cats(
+            interaction, CatCandidates(others), abbreviations_cat_id
+        )
 
         # then
-        self.assertIsNotNone(abbreviations_cat_id["r_c1"])
-        self.assertIsNotNone(abbreviations_cat_id["r_c2"])
-        self.assertIn(abbreviations_cat_id["r_c1"], [random1.ID, random2.ID])
-        self.assertNotIn(abbreviations_cat_id["r_c1"], [random3.ID])
+        self.assertTrue(found)
+        self.assertEqual(abbreviations_cat_id["r_c1"], liked.ID)
+        self.assertEqual(
+            main_cat.relationships.loaded_values(), [main_cat.relationships[liked.ID]]
+        )
+        for other in others:
+            self.assertEqual(other.relationships.loaded_values(), [])
 
 
 class OtherCatsFiltering(unittest.TestCase):
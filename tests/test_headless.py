@@ -0,0 +1,70 @@
+import unittest
+
+from scripts.game_structure.headless import SubsystemTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Subject:
+    clock = None
+
+    @staticmethod
+    def outer():
+        Subject.clock.now += 1
+        Subject.inner()
+        Subject.clock.now += 2
+        return "outer"
+
+    @staticmethod
+    def inner():
+        Subject.clock.now += 4
+
+    def method(self, value):
+        Subject.clock.now += 8
+        return value
+
+
+class TestSubsystemTimer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        Subject.clock = self.clock
+        self.timer = SubsystemTimer(clock=self.clock)
+
+    def tearDown(self):
+        self.timer.restore()
+
+    def test_nested_time_is_exclusive(self):
+        self.timer.wrap(Subject, "outer", "a")
+        self.timer.wrap(Subject, "inner", "b")
+
+        self.assertEqual(Subject.outer(), "outer")
+
+        self.assertEqual(self.timer.totals["a"], 3)
+        self.assertEqual(self.timer.totals["b"], 4)
+        self.assertEqual(self.timer.calls["a"], 1)
+        self.assertEqual(self.timer.calls["b"], 1)
+
+    def test_methods_keep_working(self):
+        self.timer.wrap(Subject, "method", "c")
+
+        self.assertEqual(Subject().method(5), 5)
+        self.assertEqual(self.timer.totals["c"], 8)
+
+    def test_restore(self):
+        original = Subject.__dict__["outer"]
+        self.timer.wrap(Subject, "outer", "a")
+        self.timer.restore()
+
+        self.assertIs(Subject.__dict__["outer"], original)
+        Subject.outer()
+        self.assertNotIn("a", self.timer.totals)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import ujson
+
+from scripts.game_structure.history_store import (
+    HISTORY_FILE,
+    HISTORY_FOLDER,
+    HistoryStore,
+    MIN_COMPACT_LINES,
+    mark_history_used,
+    release_histories,
+)
+
+
+class TestHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, HISTORY_FOLDER, HISTORY_FILE)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def count_lines(self):
+        with open(self.path, "r", encoding="utf-8") as read_file:
+            return len(read_file.readlines())
+
+    def test_last_saved_history_is_read(self):
+        store = HistoryStore(self.directory)
+        store.put("1", {"died_by": []})
+        store.put("2", {"murder": {}})
+        store.flush()
+        store.put("1", {"died_by": ["a fox"]})
+        store.flush()
+
+        self.assertEqual(store.get("1"), {"died_by": ["a fox"]})
+        self.assertEqual(HistoryStore(self.directory).get("1"), {"died_by": ["a fox"]})
+        self.assertEqual(HistoryStore(self.directory).get("2"), {"murder": {}})
+        self.assertIsNone(store.get("3"))
+
+    def test_unchanged_histories_are_not_written_again(self):
+        store = HistoryStore(self.directory)
+        store.put("1", {"died_by": []})
+        store.flush()
+
+        store = HistoryStore(self.directory)
+        store.get("1")
+        store.put("1", {"died_by": []})
+        store.flush()
+        self.assertEqual(self.count_lines(), 1)
+
+    def test_outdated_lines_are_removed(self):
+        store = HistoryStore(self.directory)
+        for moon in range(MIN_COMPACT_LINES + 1):
+            store.put("1", {"died_by": [str(moon)]})
+            store.put("2", {"died_by": []})
+            store.flush()
+
+        self.assertLessEqual(self.count_lines(), MIN_COMPACT_LINES)
+        self.assertEqual(
+            HistoryStore(self.directory).get("1"),
+            {"died_by": [str(MIN_COMPACT_LINES)]},
+        )
+
+    def test_files_of_older_saves_are_copied(self):
+        legacy_path = os.path.join(self.directory, HISTORY_FOLDER, "4_history.json")
+        os.makedirs(os.path.dirname(legacy_path))
+        with open(legacy_path, "w", encoding="utf-8") as write_file:
+            write_file.write(ujson.dumps({"died_by": ["old age"]}))
+
+        store = HistoryStore(self.directory)
+        self.assertEqual(store.get("4"), {"died_by": ["old age"]})
+        self.assertEqual(store.flush(), [legacy_path])
+
+        os.remove(legacy_path)
+        self.assertEqual(
+            HistoryStore(self.directory).get("4"), {"died_by": ["old age"]}
+        )
+
+    def test_unfinished_last_line_is_skipped(self):
+        store = HistoryStore(self.directory)
+        store.put("1", {"died_by": []})
+        store.flush()
+        with open(self.path, "a", encoding="utf-8") as write_file:
+            write_file.write('{"cat":"2","hist')
+
+        store = HistoryStore(self.directory)
+        self.assertIsNone(store.get("2"))
+        store.put("2", {"died_by": []})
+        store.flush()
+        self.assertEqual(HistoryStore(self.directory).get("2"), {"died_by": []})
+
+
+class TestReleaseHistories(unittest.TestCase):
+    class FakeCat:
+        history = "loaded"
+
+    def test_least_recently_used_are_unloaded(self):
+        cats = {str(i): self.FakeCat() for i in range(3)}
+        for cat_id in ("0", "1", "2", "0"):
+            mark_history_used(cat_id)
+
+        release_histories(cats, limit=2)
+
+        self.assertIsNone(cats["1"].history)
+        self.assertEqual(cats["0"].history, "loaded")
+        self.assertEqual(cats["2"].history, "loaded")
+        release_histories(cats, limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat, Relationship
 from scripts.cat.skills import SkillPath, Skill
+import scripts.cat_relations.interaction as interactions
 from scripts.cat_relations.interaction import (
     SingleInteraction,
     rel_fulfill_rel_constraints,
@@ -100,6 +101,65 @@ class RelationshipConstraints(unittest.TestCase):
         self.assertFalse(rel_fulfill_rel_constraints(rel, ["trust_30_lower"], "test"))
 
 
+class InteractionPools(unittest.TestCase):
+    def setUp(self):
+        self.pools = interactions.INTERACTION_POOLS.copy()
+        interactions._local_pools.clear()
+
+    def tearDown(self):
+        interactions.INTERACTION_POOLS.clear()
+        interactions.INTERACTION_POOLS.update(self.pools)
+        interactions._local_pools.clear()
+
+    def test_biome_and_season(self):
+        # given
+        anywhere = SingleInteraction("anywhere")
+        forest = SingleInteraction("forest", biome=["forest"])
+        forest_leaf_fall = SingleInteraction(
+            "forest_leaf_fall", biome=["forest"], season=["leaf-fall"]
+        )
+        two_biomes = SingleInteraction("two_biomes", biome=["forest", "beach"])
+        interactions.INTERACTION_POOLS[("trust", "increase", "low")] = [
+            anywhere,
+            forest,
+            forest_leaf_fall,
+            two_biomes,
+        ]
+
+        # then
+        self.assertEqual(
+            interactions.get_interaction_pool(
+                "trust", "increase", "low", "forest", "leaf-fall"
+            ),
+            [anywhere, forest, forest_leaf_fall],
+        )
+        self.assertEqual(
+            interactions.get_interaction_pool(
+                "trust", "increase", "low", "beach", "leaf-fall"
+            ),
+            [anywhere],
+        )
+        self.assertEqual(
+            interactions.get_interaction_pool(
+                "trust", "increase", "medium", "forest", "leaf-fall"
+            ),
+            [],
+        )
+
+    def test_neutral(self):
+        # given
+        neutral = SingleInteraction("neutral", intensity="high")
+        interactions.INTERACTION_POOLS[(None, "neutral", None)] = [neutral]
+
+        # then
+        self.assertEqual(
+            interactions.get_interaction_pool(
+                "romantic", "neutral", "low", "forest", "greenleaf"
+            ),
+            [neutral],
+        )
+
+
 class SingleInteractionCatConstraints(unittest.TestCase):
     def test_status(self):
         # given
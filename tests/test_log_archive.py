@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.cats import Cat
+from scripts.cat_relations.log_archive import (
+    get_archive_path,
+    load_archived_log,
+    remove_archives_except,
+)
+from scripts.game_structure.game_essentials import game
+
+
+class TestLogArchive(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.old_log_length = game.config["relationship"]["log_length"]
+        game.config["relationship"]["log_length"] = 2
+
+    def tearDown(self):
+        game.config["relationship"]["log_length"] = self.old_log_length
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def save(self, cat):
+        relationship_dir = os.path.join(self.directory, "relationships")
+        os.makedirs(relationship_dir, exist_ok=True)
+        cat.save_relationship_of_cat(relationship_dir)
+
+    def test_old_entries_are_archived_on_save(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        relationship = cat1.create_one_relationship(cat2)
+        relationship.log.extend(["1", "2", "3"])
+
+        self.save(cat1)
+        self.assertEqual(relationship.log, ["2", "3"])
+        self.assertEqual(load_archived_log(self.directory, cat1.ID, cat2.ID), ["1"])
+
+        relationship.log.extend(["4", "5"])
+        self.save(cat1)
+        self.assertEqual(relationship.log, ["4", "5"])
+        self.assertEqual(
+            load_archived_log(self.directory, cat1.ID, cat2.ID), ["1", "2", "3"]
+        )
+        self.assertEqual(load_archived_log(self.directory, cat2.ID, cat1.ID), [])
+
+    def test_archives_of_other_cats_are_removed(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.create_one_relationship(cat2).log.extend(["1", "2", "3"])
+        cat2.create_one_relationship(cat1).log.extend(["1", "2", "3"])
+        self.save(cat1)
+        self.save(cat2)
+
+        remove_archives_except(self.directory, [cat2.ID])
+
+        self.assertFalse(os.path.exists(get_archive_path(self.directory, cat1.ID)))
+        self.assertTrue(os.path.exists(get_archive_path(self.directory, cat2.ID)))
+
+
+if __name__ == "__main__":
+    unittest.main()
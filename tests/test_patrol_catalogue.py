@@ -0,0 +1,67 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.events_module.patrol.patrol_catalogue import (
+    PatrolGroup,
+    get_patrol_group,
+)
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+
+
+class TestPatrolGroup(unittest.TestCase):
+    def setUp(self):
+        self.group = PatrolGroup(
+            [
+                PatrolEvent("any_hunt", types=["hunting"]),
+                PatrolEvent("mountain_hunt", biome=["mountainous"], types=["hunting"]),
+                PatrolEvent("camp2_hunt", camp=["camp2"], types=["hunting"]),
+                PatrolEvent("greenleaf_hunt", season=["greenleaf"], types=["hunting"]),
+                PatrolEvent("border", types=["border"]),
+                PatrolEvent("solo_hunt", max_cats=1, types=["hunting"]),
+                PatrolEvent(
+                    "apprentice_hunt",
+                    min_max_status={"apprentice": [1, 6]},
+                    types=["hunting"],
+                ),
+                PatrolEvent("cruel_hunt", tags=["cruel_season"], types=["hunting"]),
+            ]
+        )
+
+    def candidate_ids(self, patrol_type="hunting", statuses=None, size=2, game_mode="classic"):
+        return [
+            patrol.patrol_id
+            for patrol in self.group.candidates(
+                "forest",
+                "camp1",
+                "leaf-bare",
+                patrol_type,
+                statuses if statuses is not None else {"warrior": size},
+                size,
+                game_mode,
+            )
+        ]
+
+    def test_candidates(self):
+        self.assertEqual(self.candidate_ids(), ["any_hunt"])
+        self.assertEqual(self.candidate_ids("border"), ["border"])
+        self.assertEqual(self.candidate_ids(size=1), ["any_hunt", "solo_hunt"])
+        self.assertEqual(
+            self.candidate_ids(statuses={"warrior": 1, "apprentice": 1}),
+            ["any_hunt", "apprentice_hunt"],
+        )
+        self.assertEqual(
+            self.candidate_ids(game_mode="cruel_season"), ["any_hunt", "cruel_hunt"]
+        )
+
+    def test_patrol_files_are_loaded_once(self):
+        group = get_patrol_group("general/hunting.json")
+
+        self.assertIs(get_patrol_group("general/hunting.json"), group)
+        self.assertGreater(len(group), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from scripts.game_structure.save_manifest import SaveManifest
+
+
+class TestSaveManifest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, "relationships", "1_relations.json")
+        os.makedirs(os.path.dirname(self.file_path))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write(self, manifest, text):
+        with open(self.file_path, "w", encoding="utf-8") as write_file:
+            write_file.write(text)
+        manifest.record(self.file_path, text)
+
+    def test_unchanged_only_after_record(self):
+        manifest = SaveManifest(self.directory)
+        self.assertFalse(manifest.is_unchanged(self.file_path, "[]"))
+
+        self.write(manifest, "[]")
+
+        self.assertTrue(manifest.is_unchanged(self.file_path, "[]"))
+        self.assertFalse(manifest.is_unchanged(self.file_path, "[1]"))
+        self.assertIn("relationships/1_relations.json", manifest.records)
+
+    def test_file_changed_on_disk(self):
+        manifest = SaveManifest(self.directory)
+        self.write(manifest, "[]")
+
+        with open(self.file_path, "w", encoding="utf-8") as write_file:
+            write_file.write("[1, 2]")
+        self.assertFalse(manifest.is_unchanged(self.file_path, "[]"))
+
+        os.remove(self.file_path)
+        self.assertFalse(manifest.is_unchanged(self.file_path, "[]"))
+
+    def test_read_back(self):
+        manifest = SaveManifest(self.directory)
+        self.write(manifest, "[]")
+        with open(manifest.path, "w", encoding="utf-8") as write_file:
+            write_file.write(manifest.to_text())
+
+        self.assertTrue(
+            SaveManifest(self.directory).is_unchanged(self.file_path, "[]")
+        )
+
+    def test_forget(self):
+        manifest = SaveManifest(self.directory)
+        self.write(manifest, "[]")
+        manifest.changed = False
+
+        manifest.forget(self.file_path)
+
+        self.assertTrue(manifest.changed)
+        self.assertFalse(manifest.is_unchanged(self.file_path, "[]"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+
+from scripts.cat.cats import Cat
+from scripts.cat.sprite_queue import SpriteQueue
+from scripts.cat.sprites import Sprites, sprites
+from scripts.utility import get_sprite_key
+
+
+class TestCatSpriteCache(unittest.TestCase):
+    def test_least_recently_used_is_dropped(self):
+        sprites = Sprites()
+        sprites.cat_sprite_cache_size = 2
+
+        sprites.store_cat_sprite("a", "sprite a")
+        sprites.store_cat_sprite("b", "sprite b")
+        self.assertEqual(sprites.get_cat_sprite("a"), "sprite a")
+        sprites.store_cat_sprite("c", "sprite c")
+
+        self.assertEqual(sprites.get_cat_sprite("a"), "sprite a")
+        self.assertIsNone(sprites.get_cat_sprite("b"))
+        self.assertEqual(sprites.get_cat_sprite("c"), "sprite c")
+
+
+class TestSpriteRegistry(unittest.TestCase):
+    def setUp(self):
+        pygame.display.set_mode((1, 1))
+        self.directory = tempfile.mkdtemp()
+        self.sheet_path = os.path.join(self.directory, "sheet.png")
+        sheet = pygame.Surface((6, 14), pygame.SRCALPHA)
+        sheet.fill((255, 0, 0, 255), pygame.Rect(2, 0, 2, 2))
+        pygame.image.save(sheet, self.sheet_path)
+
+        self.sprites = Sprites()
+        self.sprites.size = 2
+        self.sprites.spritesheet(self.sheet_path, "sheet")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_sprites_are_cut_out_when_used(self):
+        self.sprites.make_group("sheet", (0, 0), "test")
+
+        self.assertEqual(len(self.sprites.sprites), 21)
+        self.assertIn("test1", self.sprites.sprites)
+        self.assertEqual(self.sprites.memory_report()["spritesheets_loaded"], 0)
+
+        sprite = self.sprites.sprites["test1"]
+
+        self.assertEqual(sprite.get_at((0, 0)), pygame.Color(255, 0, 0, 255))
+        report = self.sprites.memory_report()
+        self.assertEqual(report["sprites_cut_out"], 1)
+        self.assertEqual(report["spritesheets_loaded"], 1)
+        self.assertEqual(report["spritesheet_bytes"], 6 * 14 * 4)
+
+    def test_sprite_outside_the_spritesheet(self):
+        self.sprites.make_group("sheet", (1, 0), "outside")
+
+        self.assertIs(self.sprites.sprites["outside0"], self.sprites.blank_sprite)
+        with self.assertRaises(KeyError):
+            self.sprites.sprites["missing0"]
+
+
+class TestSpriteQueue(unittest.TestCase):
+    def test_ready_sprite_is_handed_over_at_once(self):
+        cat = Cat()
+        sprites.store_cat_sprite(get_sprite_key(cat), "finished sprite")
+
+        received = []
+        SpriteQueue().request(cat, received.append)
+
+        self.assertEqual(received, ["finished sprite"])
+
+    def wait_for(self, queue, received):
+        started = time.time()
+        while not received and time.time() - started < 10:
+            queue.update()
+            time.sleep(0.01)
+
+    def test_sprite_that_fails_to_draw_is_replaced_by_placeholder(self):
+        cat = Cat(moons=40)
+        queue = SpriteQueue()
+        received = []
+        with patch(
+            "scripts.cat.sprite_queue.draw_cat_sprite", side_effect=ValueError
+        ), patch.object(sprites, "size", 50), self.assertLogs(
+            "scripts.cat.sprite_queue", "ERROR"
+        ):
+            queue.request(cat, received.append)
+            self.wait_for(queue, received)
+            self.assertEqual(received, [queue.placeholder])
+        self.assertEqual(queue._waiting, {})
+
+    def test_cancelled_requests_are_dropped(self):
+        cat = Cat(moons=50)
+        queue = SpriteQueue()
+        owner = object()
+        cancelled = []
+        received = []
+        with patch("scripts.cat.sprite_queue.draw_cat_sprite", return_value="sprite"):
+            queue.request(cat, cancelled.append, owner=owner)
+            queue.request(cat, received.append)
+            queue.cancel(owner)
+            self.wait_for(queue, received)
+
+        self.assertEqual(received, ["sprite"])
+        self.assertEqual(cancelled, [])
+
+    def test_alike_cats_share_a_key(self):
+        cat = Cat(moons=30)
+        twin = Cat(moons=cat.moons)
+        twin.pelt = cat.pelt
+
+        self.assertEqual(get_sprite_key(cat), get_sprite_key(twin))
+        self.assertNotEqual(
+            get_sprite_key(cat), get_sprite_key(cat, always_living=True, life_state="newborn")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
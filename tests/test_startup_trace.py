@@ -0,0 +1,30 @@
+import unittest
+
+from scripts.housekeeping import startup_trace
+
+
+class TestStartupTrace(unittest.TestCase):
+    def setUp(self):
+        self.enabled = startup_trace.enabled
+        startup_trace.stages.clear()
+
+    def tearDown(self):
+        startup_trace.enabled = self.enabled
+        startup_trace.stages.clear()
+
+    def test_stages_are_added_up(self):
+        startup_trace.enabled = True
+        for _ in range(3):
+            with startup_trace.stage("load"):
+                pass
+        self.assertEqual(startup_trace.stages["load"][1], 3)
+
+    def test_nothing_is_recorded_when_disabled(self):
+        startup_trace.enabled = False
+        with startup_trace.stage("load"):
+            pass
+        self.assertEqual(startup_trace.stages, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
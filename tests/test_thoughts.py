@@ -5,7 +5,8 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
-from scripts.cat.thoughts import Thoughts
+from scripts.cat.thoughts import Thoughts, ThoughtIndex
+from scripts.game_structure.localization import load_lang_resource
 
 class TestNotWorkingThoughts(unittest.TestCase):
     def setUp(self):
@@ -110,6 +111,66 @@ class TestsGetStatusThought(unittest.TestCase):
         thoughts = Thoughts.load_thoughts(cat, None, "expanded", biome, season, camp)
 
 
+class TestThoughtIndex(unittest.TestCase):
+    def setUp(self):
+        self.thoughts = [
+            {"id": "any", "thoughts": []},
+            {"id": "forest_only", "biome": ["Forest"], "thoughts": []},
+            {"id": "leafbare_only", "season": ["Leaf-bare"], "thoughts": []},
+            {"id": "any_status", "main_status_constraint": ["any"], "thoughts": []},
+            {"id": "warrior_only", "main_status_constraint": ["warrior"], "thoughts": []},
+            {"id": "bold_adult", "main_trait_constraint": ["bold"], "main_age_constraint": ["adult"], "thoughts": []},
+        ]
+        self.index = ThoughtIndex(self.thoughts)
+
+    def candidate_ids(self, cat, biome="Forest", season="Newleaf", camp="camp2"):
+        return [thought["id"] for thought in self.index.candidates(cat, biome, season, camp)]
+
+    def test_candidates(self):
+        cat = Cat(status="warrior", moons=50)
+        cat.personality.trait = "bold"
+
+        self.assertEqual(
+            ["any", "forest_only", "any_status", "warrior_only", "bold_adult"],
+            self.candidate_ids(cat),
+        )
+
+    def test_candidates_excluded(self):
+        cat = Cat(status="elder", moons=130)
+        cat.personality.trait = "bold"
+
+        self.assertEqual(
+            ["any", "leafbare_only", "any_status"],
+            self.candidate_ids(cat, biome="Beach", season="Leaf-bare"),
+        )
+
+    def test_matches_full_scan(self):
+        """The index must never change which thoughts are possible, only how many are checked."""
+        other = Cat(status="warrior", moons=40)
+        for status in ["warrior", "medicine cat", "elder", "kitten", "leader"]:
+            loaded = load_lang_resource(f"thoughts/alive/{status.replace(' ', '_')}.json")
+            loaded += load_lang_resource("thoughts/alive/general.json")
+            index = ThoughtIndex(loaded)
+            for _ in range(10):
+                cat = Cat(status=status)
+                for season in ["Newleaf", "Leaf-bare"]:
+                    expected = Thoughts.create_thoughts(
+                        loaded, cat, other, "expanded", "Forest", season, "camp1"
+                    )
+                    actual = Thoughts.create_thoughts(
+                        index.candidates(cat, "Forest", season, "camp1"),
+                        cat,
+                        other,
+                        "expanded",
+                        "Forest",
+                        season,
+                        "camp1",
+                    )
+                    self.assertEqual(
+                        [t["id"] for t in expected], [t["id"] for t in actual]
+                    )
+
+
 class TestFamilyThoughts(unittest.TestCase):
 
     def test_family_thought_young_children(self):
@@ -1,6 +1,8 @@
 import os
 import unittest
 
+import i18n
+
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
@@ -10,7 +12,11 @@ from scripts.utility import (
     get_highest_romantic_relation,
     get_personality_compatibility,
     get_amount_of_cats_with_relation_value_towards,
-    get_alive_clan_queens
+    get_alive_clan_queens,
+    filter_relationship_type,
+    adjust_article,
+    event_text_adjust,
+    process_text,
 )
 
 class TestPersonalityCompatibility(unittest.TestCase):
@@ -130,6 +136,31 @@ class TestCountRelation(unittest.TestCase):
         self.assertEqual(relation_dict["jealousy"], 2)
         self.assertEqual(relation_dict["trust"], 0)
 
+    def test_default_relationships_are_not_created(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.relationships.add_default(cat2.ID)
+
+        relation_dict = get_amount_of_cats_with_relation_value_towards(cat2, 0, [cat1])
+
+        self.assertEqual(relation_dict["trust"], 1)
+        self.assertIsNone(cat1.relationships.peek(cat2.ID))
+
+
+class TestFilterRelationshipValues(unittest.TestCase):
+    def test_every_cat_needs_the_value_towards_the_others(self):
+        cat1 = Cat()
+        cat2 = Cat()
+        cat1.create_one_relationship(cat2).trust = 50
+        cat2.relationships.add_default(cat1.ID)
+
+        self.assertFalse(filter_relationship_type([cat1, cat2], ["trust_40"]))
+        self.assertIsNone(cat2.relationships.peek(cat1.ID))
+
+        cat2.relationships[cat1.ID].trust = 40
+        self.assertTrue(filter_relationship_type([cat1, cat2], ["trust_40"]))
+        self.assertFalse(filter_relationship_type([cat1, cat2], ["trust_40", "romantic_10"]))
+
 
 class TestHighestRomance(unittest.TestCase):
     def test_exclude_mate(self):
@@ -336,3 +367,47 @@ class TestGetQueens(unittest.TestCase):
         # then
         living_cats = [self.test_cat1, self.test_cat2, self.test_cat3, self.test_cat4, self.test_cat5, self.test_cat6]
         self.assertEqual([self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys()))
+
+
+class TestProcessText(unittest.TestCase):
+    def test_names_and_pronouns(self):
+        cat = Cat()
+        pronouns = cat.pronouns[0]
+        cat_dict = {"m_c": ("Ashfur", pronouns), "r_c": ("Eelpaw", pronouns)}
+        text = "m_c meets r_c. {PRONOUN/m_c/subject} {VERB/m_c/greet/greets} {PRONOUN/r_c/object}. {insert} %{m_c}"
+
+        expected = (
+            f"Ashfur meets Eelpaw. {pronouns['subject']} "
+            f"{'greet' if pronouns['conju'] == 1 else 'greets'} {pronouns['object']}. {{insert}} %{{m_c}}"
+        )
+        self.assertEqual(process_text(text, cat_dict), expected)
+        # the second time, the split up text is reused
+        self.assertEqual(process_text(text, cat_dict), expected)
+
+    def test_adjust_article(self):
+        text = "a c_n warrior and\na o_c_n warrior"
+
+        self.assertEqual(
+            adjust_article(text, "o_c_n", "Ash"), "a c_n warrior and\nan o_c_n warrior"
+        )
+        self.assertEqual(adjust_article(text, "c_n", "Ash"), "an c_n warrior and\na o_c_n warrior")
+        self.assertEqual(adjust_article(text, "c_n", "Thunder"), text)
+
+    def test_event_abbreviations(self):
+        cat = Cat()
+        cat.pelt.accessory = "MAPLE LEAF"
+        clan = type("FakeClan", (), {"name": "Thunder"})()
+        other_clan = type("FakeClan", (), {"name": "Eel"})()
+        text = "m_c met a o_c_n warrior near a c_n border, wearing acc_singular. m_c"
+
+        expected = (
+            f"{cat.name} met an EelClan warrior near a ThunderClan border, wearing "
+            f"{i18n.t('cat.accessories.MAPLE LEAF', count=1)}. {cat.name}"
+        )
+        for _ in range(2):
+            self.assertEqual(
+                event_text_adjust(
+                    Cat, text, main_cat=cat, clan=clan, other_clan=other_clan
+                ),
+                expected,
+            )